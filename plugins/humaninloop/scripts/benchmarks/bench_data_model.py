@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark data-model.md validation on generated models.
+
+Builds models with growing numbers of entities, each with an attributes
+table, a status field with its transitions and a relationship, and times
+parsing them into Entity records and running every check. For
+comparison, it also times the scans the checks used to repeat: one
+regex search per keyword over each entity's text, per check. Once the
+records are built, the checks only read attributes and markers, so
+their time should stay a small fraction of the scans'.
+
+Usage:
+    python bench_data_model.py [--entities 100,500,2000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+from humaninloop_validators import data_model  # noqa: E402
+from humaninloop_validators.markdown import parse_document  # noqa: E402
+
+# The keyword lists the validation, id and audit checks used to scan for
+VALIDATION_PATTERNS = [r"required", r"unique", r"min", r"max", r"format", r"Enum\[", r"Text\(\d+\)",
+                       r"Decimal\(\d+", r"Yes\s*\|", r"No\s*\|"]
+ID_PATTERNS = [r"\|\s*id\s*\|", r"\|\s*\w+Id\s*\|", r"\|\s*\w+_id\s*\|", r"Identifier", r"UUID", r"Primary\s*key"]
+AUDIT_FIELDS = ["createdat", "created_at", "creationtime", "created",
+                "updatedat", "updated_at", "modifiedat", "modified_at", "lastupdated"]
+
+ENTITY = """## Entity: Resource{n} [NEW]
+
+Stores resource {n}, owned by a User.
+
+### Attributes
+
+| Attribute | Type | Required | PII | Description |
+|-----------|------|----------|-----|-------------|
+| id | UUID | Yes | | Unique identifier |
+| name | Text(200) | Yes | | Display name, min 3 characters |
+| email | Email | No | **PII** | Contact address |
+| status | Enum[draft,active,archived] | Yes | | Lifecycle state |
+| ownerId | Reference(User) | Yes | | Owner |
+| createdAt | Timestamp | Yes | | Creation time |
+| updatedAt | Timestamp | Yes | | Last change |
+
+### Relationships
+
+- belongs to User (many-to-one)
+
+### Transitions
+
+| From | To | Trigger |
+|------|----|---------|
+| draft | active | publish |
+| active | archived | archive |
+"""
+
+
+def generate_model(entities: int) -> str:
+    return "# Data Model\n\n" + "\n".join(ENTITY.format(n=n) for n in range(entities))
+
+
+def validate(text: str):
+    doc = parse_document(text)
+    entities = data_model.extract_entities(doc)
+    checks = [
+        data_model.check_entity_format(entities),
+        data_model.check_required_attributes(entities),
+        data_model.check_relationships(entities, doc),
+        data_model.check_state_machines(entities, doc),
+        data_model.check_validation_rules(entities),
+        data_model.check_audit_fields(entities),
+        data_model.check_id_fields(entities),
+    ]
+    return entities, checks
+
+
+def rescan(entities) -> int:
+    """The per-check, per-keyword searches the checks used to run."""
+    found = 0
+    for entity in entities:
+        for family in (data_model.RELATIONSHIP_KEYWORDS, VALIDATION_PATTERNS, ID_PATTERNS):
+            found += any(re.search(pattern, entity.content, re.IGNORECASE) for pattern in family)
+        found += bool(re.search(r"\|\s*Attribute\s*\|.*\|", entity.content, re.IGNORECASE))
+        found += len(re.findall(r"\|\s*\w+\s*\|[^|]+\|", entity.content))
+        found += bool(data_model.STATE_FIELD.search(entity.content))
+        lowered = entity.content.lower()
+        found += any(field in lowered for field in AUDIT_FIELDS)
+    return found
+
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return value, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entities", default="100,500,2000")
+    args = parser.parse_args()
+
+    print(f"{'entities':>8} {'attributes':>10} {'validate ms':>12} {'checks ms':>10} {'rescan ms':>10}")
+    for count in (int(c) for c in args.entities.split(",")):
+        text = generate_model(count)
+        (entities, checks), total = timed(validate, text)
+        assert all(check.passed for check in checks), [check.check for check in checks if not check.passed]
+        doc = parse_document(text)
+
+        def run_checks():
+            return [
+                data_model.check_required_attributes(entities),
+                data_model.check_relationships(entities, doc),
+                data_model.check_state_machines(entities, doc),
+                data_model.check_validation_rules(entities),
+                data_model.check_audit_fields(entities),
+                data_model.check_id_fields(entities),
+            ]
+        _, check_time = timed(run_checks)
+        _, rescan_time = timed(rescan, entities)
+        attributes = sum(len(entity.attributes) for entity in entities)
+        print(f"{count:>8} {attributes:>10} {total * 1e3:>12.1f} {check_time * 1e3:>10.2f} {rescan_time * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
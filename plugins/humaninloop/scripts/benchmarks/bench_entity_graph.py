@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark the data-model relationship graph on generated models.
+
+Builds models with growing numbers of entities, each referencing three
+earlier ones through Reference attributes (one of them required) and
+one through a "belongs to" sentence, with a required-reference cycle
+every 50 entities, a dangling reference every 100 and an orphan every
+200. Times building the graph and running the dangling-reference,
+cycle and orphan checks. The time per edge should stay flat as the
+model grows.
+
+Usage:
+    python bench_entity_graph.py [--entities 1000,5000,20000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+from humaninloop_validators import data_model  # noqa: E402
+from humaninloop_validators.markdown import parse_document  # noqa: E402
+
+
+def generate_model(entities: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+
+    def orphan(n):
+        return n % 200 == 123
+
+    parts = ["# Data Model\n"]
+    for n in range(entities):
+        rows = ["| id | UUID | Yes |"]
+        prose = ""
+        if n and not orphan(n):
+            for k in range(3):
+                target = rng.randrange(n)
+                if orphan(target):
+                    target -= 1
+                if k == 0 and n % 50 == 0:
+                    # Closes the required cycle opened by the entity before
+                    target = n - 1
+                rows.append(f"| ref{k}Id | Reference(Entity{target}) | {'Yes' if k == 0 else 'No'} |")
+            parent = n - 1 if not orphan(n - 1) else n - 2
+            prose = f"Entity{n} belongs to Entity{parent}.\n"
+        if n % 50 == 49 and n + 1 < entities:
+            rows.append(f"| nextId | Reference(Entity{n + 1}) | Yes |")
+        if n % 100 == 99:
+            rows.append("| ghostId | Reference(Ghost) | No |")
+        parts.append(
+            f"## Entity: Entity{n} [NEW]\n\n{prose}\n| Attribute | Type | Required |\n|---|---|---|\n"
+            + "\n".join(rows) + "\n"
+        )
+    return "\n".join(parts)
+
+
+def analyse(doc, entities):
+    graph = data_model.build_graph(entities, doc)
+    return graph, [
+        data_model.check_dangling_references(graph),
+        data_model.check_required_reference_cycles(graph),
+        data_model.check_orphan_entities(entities, graph),
+    ]
+
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return value, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--entities", default="1000,5000,20000")
+    args = parser.parse_args()
+
+    print(f"{'entities':>8} {'edges':>7} {'graph ms':>9} {'us/edge':>8} {'dangling':>9} {'cycles':>7} {'orphans':>8}")
+    for count in (int(c) for c in args.entities.split(",")):
+        doc = parse_document(generate_model(count))
+        entities = data_model.extract_entities(doc)
+        (graph, (dangling, cycles, orphans)), elapsed = timed(analyse, doc, entities)
+        edges = sum(len(relations) for relations in graph.outgoing.values())
+        print(f"{count:>8} {edges:>7} {elapsed * 1e3:>9.1f} {elapsed * 1e6 / edges:>8.2f} "
+              f"{len(dangling.issues):>9} {len(cycles.issues):>7} {len(orphans.issues):>8}")
+
+
+if __name__ == "__main__":
+    main()
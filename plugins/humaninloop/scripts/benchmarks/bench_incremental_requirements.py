@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental requirement validation.
+
+Builds a spec with many FR/SC blocks, validates it once to fill the block
+store, then edits a single requirement (and separately inserts a line
+near the top, which shifts every block) and times a full run against an
+incremental run. Each incremental report is checked against the full one.
+
+Usage:
+    python bench_incremental_requirements.py [--sizes 500,2000,5000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.cache import BlockStore  # noqa: E402
+from humaninloop_validators.requirements import validate_requirements  # noqa: E402
+
+
+def generate_spec(count: int) -> list[str]:
+    lines = ['# Feature Specification: Benchmark', '', '## Requirements', '']
+    for i in range(count):
+        lines.append(f'- **FR-{i % 999 + 1:03d}**: System MUST let members manage item {i} through the '
+                     f'dashboard without a page reload, and the endpoint cache layer should stay warm.')
+    lines += ['', '## Success Criteria', '']
+    for i in range(count // 5):
+        lines.append(f'- **SC-{i % 999 + 1:03d}**: Members finish task {i} in under 200ms of waiting.')
+    return lines
+
+
+def timed(func):
+    start = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', default='500,2000,5000')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['HUMANINLOOP_CACHE_DIR'] = str(Path(tmp) / 'cache')
+        spec = Path(tmp) / 'spec.md'
+
+        print(f"{'blocks':>7} {'edit':<10} {'full ms':>8} {'incr ms':>8} {'reused':>7} {'checked':>8} {'same':>5}")
+        for size in (int(s) for s in args.sizes.split(',')):
+            lines = generate_spec(size)
+            spec.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            store = BlockStore.for_file(spec)
+            validate_requirements(spec, store)
+            store.save()
+
+            edits = {
+                'one-block': lambda ls: ls[:10] + [ls[10].replace('dashboard', 'python dashboard')] + ls[11:],
+                'shift-all': lambda ls: ls[:1] + ['', 'Intro paragraph.'] + ls[1:],
+            }
+            for name, edit in edits.items():
+                lines = edit(lines)
+                spec.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+                full, full_time = timed(lambda: validate_requirements(spec).to_dict())
+                store = BlockStore.for_file(spec)
+                incremental, incr_time = timed(lambda: validate_requirements(spec, store).to_dict())
+                store.save()
+
+                print(f"{size + size // 5:>7} {name:<10} {full_time * 1e3:>8.1f} {incr_time * 1e3:>8.1f} "
+                      f"{store.reused:>7} {store.checked:>8} {str(full == incremental):>5}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark line-number resolution for requirement extraction.
+
+Generates specs with an increasing number of FR/SC entries and times
+find_requirements() from the validator library, which resolves line
+numbers through the shared LineIndex, against the previous approach of
+counting newlines in the content prefix for every match.
+
+Usage:
+    python bench_line_index.py [--sizes 1000,2000,5000,10000]
+
+Output:
+    Table of timings per size; per-requirement cost stays flat when
+    scaling is linear.
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.requirements import find_requirements  # noqa: E402
+
+
+def generate_spec(count: int) -> str:
+    """Build a spec with count FRs and count SCs.
+
+    IDs are three digits, so numbering wraps after 999; the duplicates only
+    matter to check_sequence, not to extraction cost.
+    """
+    parts = ['# Feature Specification: Benchmark\n\n## Requirements\n']
+    for i in range(count):
+        parts.append(f'**FR-{i % 999 + 1:03d}**: System MUST handle scenario {i} for members.\n')
+    parts.append('\n## Success Criteria\n')
+    for i in range(count):
+        parts.append(f'**SC-{i % 999 + 1:03d}**: Users complete flow {i} without assistance.\n')
+    return ''.join(parts)
+
+
+def prefix_count_lines(content: str, prefix: str) -> list[int]:
+    """Previous approach: count newlines in the prefix of every match."""
+    pattern = re.compile(rf'\*\*({prefix}-(\d{{3}}))[\*:]+', re.IGNORECASE)
+    return [content[:m.start()].count('\n') + 1 for m in pattern.finditer(content)]
+
+
+def best_of(runs: int, func, *args) -> float:
+    """Return the fastest wall-clock time of several runs."""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', default='1000,2000,5000,10000')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+
+    print(f"{'requirements':>12} {'indexed (s)':>12} {'us/req':>8} {'prefix (s)':>12} {'us/req':>8}")
+    for size in (int(s) for s in args.sizes.split(',')):
+        content = generate_spec(size)
+
+        def indexed():
+            find_requirements(content, 'FR')
+            find_requirements(content, 'SC')
+
+        def prefixed():
+            prefix_count_lines(content, 'FR')
+            prefix_count_lines(content, 'SC')
+
+        indexed_time = best_of(args.runs, indexed)
+        prefix_time = best_of(args.runs, prefixed)
+        total = size * 2
+        print(f"{total:>12} {indexed_time:>12.4f} {indexed_time / total * 1e6:>8.2f} "
+              f"{prefix_time:>12.4f} {prefix_time / total * 1e6:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
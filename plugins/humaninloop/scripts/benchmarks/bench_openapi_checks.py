@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the OpenAPI checks on generated contracts.
+
+Builds already-parsed specs with growing numbers of operations and times
+the registered checks run together in one traversal of the paths
+against the same checks each given a traversal of their own (as the
+per-check functions used to walk the paths). Issue counts must match.
+With --refs every response is a $ref into components, and the time
+includes resolving them.
+
+Usage:
+    python bench_openapi_checks.py [--operations 5000,10000,20000] [--refs]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.openapi import CHECKS, visit_operations  # noqa: E402
+from humaninloop_validators.refs import RefResolver  # noqa: E402
+
+METHODS = ('get', 'post', 'put', 'patch', 'delete')
+
+
+def generate_spec(operations: int) -> dict:
+    paths = {}
+    for i in range(0, operations, len(METHODS)):
+        resource = f'/resource{i}' if i % 4 else f'/resource_{i}/{{id}}'
+        paths[resource] = {
+            method: {
+                'operationId': f'{method}Resource{i}',
+                'summary': f'{method} resource {i}',
+                'security': [{'bearer': []}] if i % 3 == 0 else [],
+                'responses': {'200': {'description': 'OK'}, **({'400': {}} if i % 2 else {})},
+                **({'requestBody': {'content': {}}} if method != 'get' and i % 5 else {}),
+            }
+            for method in METHODS
+        }
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': 'Generated', 'version': '1.0.0'},
+        'paths': paths,
+        'components': {'schemas': {}},
+    }
+
+
+def with_refs(spec: dict) -> dict:
+    """Move every response into components.responses and reference it."""
+    responses = spec['components']['responses'] = {}
+    for path, item in spec['paths'].items():
+        for method, operation in item.items():
+            for code, response in operation['responses'].items():
+                name = f'{method}{path.replace("/", "_")}{code}'
+                responses[name] = response
+                operation['responses'][code] = {'$ref': f'#/components/responses/{name}'}
+    return spec
+
+
+def single_pass(spec: dict) -> int:
+    resolver = RefResolver('openapi.yaml', spec, None)
+    results = visit_operations(resolver.spec, [check() for check in CHECKS], resolver)
+    return sum(len(r.issues) for r in results)
+
+
+def pass_per_check(spec: dict) -> int:
+    resolver = RefResolver('openapi.yaml', spec, None)
+    view = resolver.spec
+    return sum(len(next(visit_operations(view, [check()], resolver)).issues) for check in CHECKS)
+
+
+def timed(func, spec: dict, repeat: int = 3) -> tuple[int, float]:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(spec)
+        best = min(best, time.perf_counter() - start)
+    return value, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--operations', default='5000,10000,20000')
+    parser.add_argument('--refs', action='store_true', help='Reference every response from components')
+    args = parser.parse_args()
+
+    print(f"{'operations':>10} {'per-check ms':>13} {'issues':>7} {'single ms':>10} {'issues':>7} {'speedup':>8}")
+    for count in (int(c) for c in args.operations.split(',')):
+        spec = generate_spec(count)
+        if args.refs:
+            spec = with_refs(spec)
+        separate, separate_time = timed(pass_per_check, spec)
+        single, single_time = timed(single_pass, spec)
+        print(f"{count:>10} {separate_time * 1e3:>13.1f} {separate:>7} {single_time * 1e3:>10.1f} {single:>7} "
+              f"{separate_time / single_time:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
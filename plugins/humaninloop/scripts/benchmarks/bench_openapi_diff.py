@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Benchmark the structural OpenAPI diff on generated contracts.
+
+Builds already-parsed specs with growing numbers of operations, each
+returning a shared component schema by $ref, and a copy with a fixed
+number of edits: operations removed and added, a parameter made
+required, a field removed from a schema one operation returns. Times
+the diff, which resolves only the path items that changed, against
+resolving both specs and hashing every subtree up front, as an eager
+Merkle tree would. The diff should stay well below the eager approach
+as the spec grows, and its change count should not grow with it.
+
+Usage:
+    python bench_openapi_diff.py [--operations 5000,10000,20000] [--edits 10]
+"""
+
+import argparse
+import hashlib
+import marshal
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.diff import ContractDiff  # noqa: E402
+from humaninloop_validators.refs import RefResolver  # noqa: E402
+
+METHODS = ('get', 'post', 'put', 'patch', 'delete')
+
+
+def generate_spec(operations: int) -> dict:
+    schemas = {
+        f'Resource{n}': {
+            'type': 'object',
+            'required': ['id'],
+            'properties': {
+                'id': {'type': 'integer', 'minimum': 1},
+                'name': {'type': 'string', 'maxLength': 80},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+            },
+        }
+        for n in range(50)
+    }
+    # Only the first path uses it
+    schemas['Special'] = {'type': 'object', 'properties': {'id': {'type': 'integer'}, 'note': {'type': 'string'}}}
+    paths = {}
+    for i in range(0, operations, len(METHODS)):
+        paths[f'/resource{i}/{{id}}'] = {
+            method: {
+                'operationId': f'{method}Resource{i}',
+                'parameters': [
+                    {'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}},
+                    {'name': 'expand', 'in': 'query', 'schema': {'type': 'string', 'enum': ['tags', 'owner']}},
+                ],
+                'responses': {'200': {'description': 'OK', 'content': {'application/json': {
+                    'schema': {'$ref': f'#/components/schemas/Resource{i % 50}'}}}}},
+            }
+            for method in METHODS
+        }
+    first = next(iter(paths.values()))
+    first['get']['responses']['200']['content']['application/json']['schema'] = {'$ref': '#/components/schemas/Special'}
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': 'Generated', 'version': '1.0.0'},
+        'paths': paths,
+        'components': {'schemas': schemas},
+    }
+
+
+def edit(spec: dict, edits: int) -> dict:
+    """A copy of spec with edits changes spread across its paths."""
+    spec = marshal.loads(marshal.dumps(spec))
+    paths = list(spec['paths'])
+    step = max(1, len(paths) // edits)
+    for n, path in enumerate(paths[::step][:edits]):
+        item = spec['paths'][path]
+        if n % 3 == 0:
+            del item['delete']
+        elif n % 3 == 1:
+            item['get']['parameters'][1]['required'] = True
+        else:
+            spec['paths'][f'{path}/history'] = {'get': {'responses': {'200': {'description': 'OK'}}}}
+    spec['components']['schemas']['Special']['properties'].pop('note')
+    return spec
+
+
+def resolver(spec: dict) -> RefResolver:
+    return RefResolver('openapi.yaml', spec, None)
+
+
+def eager_merkle(spec: dict) -> int:
+    """Hash every subtree bottom-up; returns the number of subtrees."""
+    digests = {}
+
+    def digest(node):
+        key = id(node)
+        if key not in digests:
+            if type(node) is dict:
+                parts = [(name, digest(child) if type(child) in (dict, list) else child)
+                         for name, child in node.items()]
+            else:
+                parts = [digest(child) if type(child) in (dict, list) else child for child in node]
+            digests[key] = hashlib.blake2b(marshal.dumps(parts, 2), digest_size=16).digest()
+        return digests[key]
+
+    digest(spec)
+    return len(digests)
+
+
+def timed(func, *args, repeat: int = 3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return value, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--operations', default='5000,10000,20000')
+    parser.add_argument('--edits', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'operations':>10} {'eager ms':>9} {'subtrees':>9} {'diff ms':>8} {'hashed KB':>10} "
+          f"{'resolved':>9} {'changes':>8} {'breaking':>9}")
+    for count in (int(c) for c in args.operations.split(',')):
+        old = generate_spec(count)
+        new = edit(generate_spec(count), args.edits)
+        subtrees, eager_time = timed(lambda: eager_merkle(resolver(old).spec) + eager_merkle(resolver(new).spec))
+
+        def run():
+            diff = ContractDiff(resolver(old), resolver(new))
+            return diff, diff.changes()
+        (diff, changes), diff_time = timed(run)
+        breaking = sum(1 for change in changes if change.breaking)
+        digests = (diff.old_source, diff.new_source, diff.old, diff.new)
+        hashed = sum(d.hashed for d in digests) / 1024
+        # Containers resolved, in both specs
+        resolved = len(diff.old.resolver.views) + len(diff.new.resolver.views)
+        print(f"{count:>10} {eager_time * 1e3:>9.1f} {subtrees:>9} {diff_time * 1e3:>8.1f} {hashed:>10.0f} "
+              f"{resolved:>9} {len(changes):>8} {breaking:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark OpenAPI contract loading backends.
+
+Generates contracts of growing size and times each way of getting the
+parsed spec: PyYAML's pure-Python SafeLoader, libyaml's CSafeLoader (what
+load_spec uses when available), json.loads on the same contract as JSON,
+and the parsed-spec cache (an unchanged file, and a touched file whose
+content hash still matches).
+
+Usage:
+    python bench_openapi_loading.py [--paths 200,1000,4000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.cache import SpecCache  # noqa: E402
+from humaninloop_validators.openapi import load_spec  # noqa: E402
+
+
+def generate_contract(count: int) -> dict:
+    paths = {}
+    schemas = {}
+    for i in range(count):
+        name = f'resource{i}'
+        schemas[name.title()] = {
+            'type': 'object',
+            'required': ['id', 'name'],
+            'properties': {
+                'id': {'type': 'string', 'format': 'uuid'},
+                'name': {'type': 'string', 'maxLength': 120},
+                'count': {'type': 'integer', 'minimum': 0},
+                'tags': {'type': 'array', 'items': {'type': 'string'}},
+            },
+            'example': {'id': '00000000-0000-0000-0000-000000000000', 'name': name, 'count': i},
+        }
+        ref = {'$ref': f'#/components/schemas/{name.title()}'}
+        paths[f'/{name}s/{{id}}'] = {
+            method: {
+                'operationId': f'{method}{name.title()}',
+                'summary': f'{method.upper()} a {name}',
+                'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'string'}}],
+                'responses': {
+                    '200': {'description': 'OK', 'content': {'application/json': {'schema': ref}}},
+                    '404': {'description': 'Not found'},
+                    '500': {'description': 'Server error'},
+                },
+            }
+            for method in ('get', 'put', 'delete')
+        }
+    return {'openapi': '3.0.3', 'info': {'title': 'Bench', 'version': '1.0.0'},
+            'paths': paths, 'components': {'schemas': schemas}}
+
+
+def timed(func, repeat: int = 3) -> float:
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--paths', default='200,1000,4000')
+    args = parser.parse_args()
+
+    if not hasattr(yaml, 'CSafeLoader'):
+        print('PyYAML was built without libyaml; CSafeLoader column will be skipped')
+
+    print(f"{'paths':>6} {'MB':>6} {'SafeLoader':>11} {'CSafeLoader':>12} {'json':>7} "
+          f"{'cache hit':>10} {'cache touched':>14}  (ms)")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SpecCache(Path(tmp) / 'specs')
+        for count in (int(c) for c in args.paths.split(',')):
+            contract = generate_contract(count)
+            yaml_path = Path(tmp) / f'contract-{count}.yaml'
+            yaml_path.write_text(yaml.dump(contract, sort_keys=False), encoding='utf-8')
+            text = yaml_path.read_text(encoding='utf-8')
+            json_text = json.dumps(contract)
+
+            pure = timed(lambda: yaml.load(text, Loader=yaml.SafeLoader), repeat=1)
+            fast = timed(lambda: yaml.load(text, Loader=yaml.CSafeLoader)) if hasattr(yaml, 'CSafeLoader') else None
+            from_json = timed(lambda: json.loads(json_text))
+
+            assert load_spec(yaml_path, cache) == contract
+            hit = timed(lambda: load_spec(yaml_path, cache))
+            os.utime(yaml_path)
+            touched = timed(lambda: load_spec(yaml_path, cache), repeat=1)
+
+            fast_col = f'{fast:>12.1f}' if fast is not None else f"{'-':>12}"
+            print(f"{count:>6} {len(text) / 1e6:>6.2f} {pure:>11.1f} {fast_col} {from_json:>7.1f} "
+                  f"{hit:>10.1f} {touched:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark sharded OpenAPI validation on a generated contract.
+
+Builds an already-parsed spec with 20k operations, each with parameters,
+a request body or a response carrying an example, and runs every
+registered check over it sequentially and with the paths sharded across
+worker processes. $refs are resolved once up front, as that stays
+sequential; the time includes starting the workers and merging their
+results. Results must be identical to the sequential run's; the speedup
+depends on the cores available.
+
+Usage:
+    python bench_openapi_sharding.py [--operations 20000] [--jobs 2,4,8]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.openapi import CHECKS, visit_operations  # noqa: E402
+from humaninloop_validators.refs import RefResolver  # noqa: E402
+
+METHODS = ('get', 'post', 'put', 'patch', 'delete')
+
+
+def generate_spec(operations: int) -> dict:
+    item_schema = {
+        'type': 'object',
+        'required': ['id', 'name'],
+        'properties': {
+            'id': {'type': 'integer', 'minimum': 1},
+            'name': {'type': 'string', 'maxLength': 80},
+            'tags': {'type': 'array', 'items': {'type': 'string'}, 'uniqueItems': True},
+        },
+    }
+    paths = {}
+    for i in range(0, operations, len(METHODS)):
+        resource = f'/service{i % 40}/resource{i}'
+        paths[f'{resource}/{{id}}'] = {
+            method: {
+                'operationId': f'{method}Resource{i % 7000}',
+                'summary': f'{method} resource {i}',
+                'parameters': [{'name': 'id', 'in': 'path', 'required': True, 'schema': {'type': 'integer'}}],
+                **({'requestBody': {'content': {'application/json': {
+                    'schema': {'$ref': '#/components/schemas/Item'},
+                    'example': {'id': i, 'name': f'item {i}', 'tags': ['a', 'b']}}}}}
+                   if method in ('post', 'put', 'patch') else {}),
+                'responses': {
+                    '200': {'description': 'OK', 'content': {'application/json': {
+                        'schema': {'$ref': '#/components/schemas/Item'},
+                        'example': {'id': i, 'name': f'item {i}' if i % 9 else i}}}},
+                    **({'404': {'description': 'Not found'}} if i % 3 else {}),
+                },
+            }
+            for method in METHODS
+        }
+    return {
+        'openapi': '3.0.3',
+        'info': {'title': 'Generated', 'version': '1.0.0'},
+        'paths': paths,
+        'components': {'schemas': {'Item': item_schema}},
+    }
+
+
+def run(view: dict, resolver: RefResolver, jobs: int) -> tuple[str, float]:
+    start = time.perf_counter()
+    results = list(visit_operations(view, [check() for check in CHECKS], resolver, jobs))
+    elapsed = time.perf_counter() - start
+    return json.dumps([r.to_dict() for r in results]), elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--operations', type=int, default=20000)
+    parser.add_argument('--jobs', default='2,4,8')
+    args = parser.parse_args()
+
+    spec = generate_spec(args.operations)
+    print(f"{args.operations} operations, {len(spec['paths'])} paths, {os.cpu_count()} CPUs")
+    resolver = RefResolver('openapi.yaml', spec, None)
+    view = resolver.spec
+    baseline, sequential = run(view, resolver, 1)
+    print(f"{'jobs':>5} {'ms':>9} {'speedup':>8} {'identical':>10}")
+    print(f"{1:>5} {sequential * 1e3:>9.1f} {1:>7.2f}x {'yes':>10}")
+    for jobs in (int(j) for j in args.jobs.split(',')):
+        output, elapsed = run(view, resolver, jobs)
+        print(f"{jobs:>5} {elapsed * 1e3:>9.1f} {sequential / elapsed:>7.2f}x "
+              f"{'yes' if output == baseline else 'NO':>10}")
+
+
+if __name__ == '__main__':
+    main()
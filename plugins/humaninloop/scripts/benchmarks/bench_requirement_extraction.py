@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark FR/SC extraction on adversarial specs.
+
+Compares the streaming single-pass extractor in the validator library
+with the previous approach (one DOTALL lazy regex pass per prefix) on
+inputs that stress it: many short requirements, a few huge requirement
+bodies full of near-miss lines ('**', '#', '**FR' without a number), and
+long unterminated blocks. Streaming cost per KB should stay flat. The
+'found' columns show how many blocks each approach extracted; the legacy
+regex misses bullet-form requirements entirely.
+
+Usage:
+    python bench_requirement_extraction.py [--scales 1,2,4,8]
+"""
+
+import argparse
+import io
+import re
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.requirements import extract_requirements  # noqa: E402
+
+
+def many_requirements(scale: int) -> str:
+    """Thousands of one-line requirements in bullet form."""
+    lines = ['## Requirements']
+    lines += [f'- **FR-{i % 999 + 1:03d}**: System MUST handle case {i}.' for i in range(2500 * scale)]
+    lines.append('## Success Criteria')
+    lines += [f'- **SC-{i % 999 + 1:03d}**: Users finish task {i}.' for i in range(2500 * scale)]
+    return '\n'.join(lines) + '\n'
+
+
+def near_miss_bodies(scale: int) -> str:
+    """Few requirements whose bodies are long runs of near-miss lines."""
+    filler = '\n'.join(['**', '# not a heading', '**FR', '**SC-', '*FR-001*', 'plain text'] * 2000)
+    blocks = [f'**FR-{i:03d}**: System MUST cope.\n{filler}' for i in range(1, 4 * scale + 1)]
+    return '## Requirements\n' + '\n'.join(blocks) + '\n'
+
+
+def unterminated_block(scale: int) -> str:
+    """One requirement that runs to end of file with no terminator."""
+    return '**FR-001**: System MUST ' + ('continue the sentence ' * 20000 * scale)
+
+
+def legacy_extract(content: str) -> int:
+    """Previous approach: one DOTALL lazy regex pass per prefix."""
+    total = 0
+    for prefix in ('FR', 'SC'):
+        pattern = re.compile(
+            rf'\*\*({prefix}-(\d{{3}}))[\*:]+\s*(.+?)(?=\n\*\*{prefix}-|\n##|\n\n##|\Z)',
+            re.DOTALL | re.IGNORECASE
+        )
+        total += sum(1 for _ in pattern.finditer(content))
+    return total
+
+
+def best_of(runs: int, func) -> float:
+    """Return the fastest wall-clock time of several runs."""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--scales', default='1,2,4,8')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    generators = [many_requirements, near_miss_bodies, unterminated_block]
+
+    print(f"{'input':<20} {'scale':>5} {'KB':>8} {'stream ms':>10} {'us/KB':>7} {'found':>6} "
+          f"{'legacy ms':>10} {'us/KB':>7} {'found':>6}")
+    for generate in generators:
+        for scale in (int(s) for s in args.scales.split(',')):
+            content = generate(scale)
+            kb = len(content) / 1024
+            stream = best_of(args.runs, lambda: extract_requirements(io.StringIO(content)))
+            legacy = best_of(args.runs, lambda: legacy_extract(content))
+            found = sum(map(len, extract_requirements(io.StringIO(content))))
+            print(f"{generate.__name__:<20} {scale:>5} {kb:>8.0f} {stream * 1e3:>10.1f} "
+                  f"{stream / kb * 1e6:>7.1f} {found:>6} {legacy * 1e3:>10.1f} "
+                  f"{legacy / kb * 1e6:>7.1f} {legacy_extract(content):>6}")
+
+
+if __name__ == '__main__':
+    main()
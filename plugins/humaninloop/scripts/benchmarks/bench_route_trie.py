@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Benchmark path-template conflict detection on generated contracts.
+
+Builds path sets of growing size, shaped like large REST APIs: nested
+collections with parameter segments, a fixed share of literal routes
+beside a parameter ("/orgs/{orgId}/users/me"), and renamed parameters.
+Times building the route trie and running every analysis. Time per
+path should stay flat as the count grows.
+
+Usage:
+    python bench_route_trie.py [--paths 10000,20000,40000,80000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.routes import RouteTrie  # noqa: E402
+
+
+def generate_paths(count: int) -> list[str]:
+    paths = []
+    resource = 0
+    while len(paths) < count:
+        base = f'/service{resource % 50}/resource{resource}'
+        paths += [base, f'{base}/{{id}}', f'{base}/{{id}}/items', f'{base}/{{itemId}}/history']
+        if resource % 10 == 0:
+            paths.append(f'{base}/me')
+        resource += 1
+    return paths[:count]
+
+
+def analyze(paths: list[str]) -> int:
+    trie = RouteTrie()
+    for path in paths:
+        trie.add(path)
+    return len(trie.conflicts) + len(trie.inconsistent_names()) + len(trie.overlaps())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--paths', default='10000,20000,40000,80000')
+    args = parser.parse_args()
+
+    print(f"{'paths':>7} {'segments':>9} {'ms':>8} {'us/path':>8} {'issues':>7}")
+    for count in (int(c) for c in args.paths.split(',')):
+        paths = generate_paths(count)
+        start = time.perf_counter()
+        issues = analyze(paths)
+        elapsed = time.perf_counter() - start
+        segments = sum(path.count('/') for path in paths)
+        print(f"{count:>7} {segments:>9} {elapsed * 1e3:>8.1f} {elapsed * 1e6 / count:>8.2f} {issues:>7}")
+
+
+if __name__ == '__main__':
+    main()
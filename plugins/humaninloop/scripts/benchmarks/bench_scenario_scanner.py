@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the Given/When/Then scenario scanner on generated specs.
+
+Builds stories with growing numbers of acceptance scenarios, including
+multi-line scenarios and long runs of lines starting with digits, and
+times the scanner in the validator library (on an already parsed
+document, as validators share one parse) against the previous approach (a lazy DOTALL regex split plus substring tests).
+Time per scenario should stay flat as the count grows. The 'issues'
+columns differ where the substring test accepted 'then' inside words
+such as 'authentication'.
+
+Usage:
+    python bench_scenario_scanner.py [--counts 1000,2000,4000,8000]
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.markdown import Document, parse_document  # noqa: E402
+from humaninloop_validators.user_stories import check_given_when_then, find_user_stories  # noqa: E402
+
+LEGACY_SCENARIOS = re.compile(r'\*\*Acceptance Scenarios?\*\*:?\s*(.*?)(?=\n###|\n##|\Z)', re.DOTALL | re.IGNORECASE)
+LEGACY_NUMBERED = re.compile(r'^\d+\.\s+(.+?)(?=^\d+\.|\Z)', re.MULTILINE | re.DOTALL)
+
+
+def generate_story(count: int) -> str:
+    lines = ['### User Story 1 - Bulk import (Priority: P1)', '',
+             '**Why this priority**: Imports are the main way members bring data in.', '',
+             '**Independent Test**: Import a file and check every row appears in the list.', '',
+             '**Acceptance Scenarios**:', '']
+    for i in range(1, count + 1):
+        if i % 3 == 0:
+            lines += [f'{i}. **Given** a file with {i} rows,', '   **When** the member imports it,',
+                      '   **Then** every row is listed']
+        elif i % 3 == 1:
+            lines.append(f'{i}. **Given** authentication succeeds, **When** row {i} is read, **Then** it is saved')
+        else:
+            lines += [f'{i}. A member retries import {i} after an authentication timeout',
+                      '   2024 rows were already saved', '   0.5 seconds later the retry starts']
+    return '\n'.join(lines) + '\n'
+
+
+def legacy_issues(text: str) -> int:
+    issues = 0
+    for scenario in LEGACY_NUMBERED.findall(LEGACY_SCENARIOS.search(text).group(1)):
+        lower = scenario.lower()
+        issues += sum(1 for clause in ('given', 'when', 'then') if clause not in lower)
+    return issues
+
+
+def scanner_issues(document: Document) -> int:
+    story = find_user_stories(document)[0]
+    return len(check_given_when_then(story).issues)
+
+
+def timed(func, source) -> tuple[int, float]:
+    start = time.perf_counter()
+    value = func(source)
+    return value, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--counts', default='1000,2000,4000,8000')
+    args = parser.parse_args()
+
+    print(f"{'scenarios':>9} {'KB':>6} {'legacy ms':>10} {'us/scn':>7} {'issues':>7} "
+          f"{'scanner ms':>11} {'us/scn':>7} {'issues':>7}")
+    for count in (int(c) for c in args.counts.split(',')):
+        text = generate_story(count)
+        legacy, legacy_time = timed(legacy_issues, text)
+        scanned, scan_time = timed(scanner_issues, parse_document(text))
+        print(f"{count:>9} {len(text) // 1024:>6} {legacy_time * 1e3:>10.1f} {legacy_time * 1e6 / count:>7.2f} "
+              f"{legacy:>7} {scan_time * 1e3:>11.1f} {scan_time * 1e6 / count:>7.2f} {scanned:>7}")
+
+
+if __name__ == '__main__':
+    main()
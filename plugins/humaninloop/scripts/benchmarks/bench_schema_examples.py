@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark example validation on generated contracts.
+
+Builds contracts with growing numbers of component schemas that
+reference each other, each with a schema-level example and property
+examples, and one operation per schema whose request and response media
+types reference it and carry examples. One example in ten is invalid.
+Times resolving $refs and running the schema_examples check, and
+reports how many validators were compiled for the schema uses checked.
+
+Usage:
+    python bench_schema_examples.py [--schemas 1000,2000,4000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.openapi import SchemaExamples, visit_operations  # noqa: E402
+from humaninloop_validators.refs import RefResolver  # noqa: E402
+
+
+def generate_spec(count: int) -> dict:
+    schemas = {}
+    paths = {}
+    for i in range(count):
+        name = f'Resource{i}'
+        example = {'id': i, 'name': f'resource {i}', 'status': 'active', 'tags': ['a', 'b']}
+        if i % 10 == 0:
+            example['status'] = 'unknown'
+        schemas[name] = {
+            'type': 'object',
+            'required': ['id', 'name'],
+            'additionalProperties': False,
+            'properties': {
+                'id': {'type': 'integer', 'minimum': 0, 'example': i},
+                'name': {'type': 'string', 'minLength': 1, 'maxLength': 64, 'example': f'resource {i}'},
+                'status': {'type': 'string', 'enum': ['active', 'archived']},
+                'tags': {'type': 'array', 'uniqueItems': True, 'items': {'type': 'string', 'pattern': '^[a-z]+$'}},
+                'parent': {'$ref': f'#/components/schemas/Resource{max(i - 1, 0)}'},
+            },
+            'example': example,
+        }
+        ref = {'$ref': f'#/components/schemas/{name}'}
+        paths[f'/resources{i}'] = {
+            'post': {
+                'requestBody': {'content': {'application/json': {
+                    'schema': ref,
+                    'examples': {'basic': {'value': {'id': i, 'name': 'new'}},
+                                 'full': {'value': example}},
+                }}},
+                'responses': {'201': {'content': {'application/json': {
+                    'schema': {'type': 'array', 'items': ref},
+                    'example': [example, example],
+                }}}},
+            }
+        }
+    return {'openapi': '3.0.3', 'paths': paths, 'components': {'schemas': schemas}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--schemas', default='1000,2000,4000')
+    args = parser.parse_args()
+
+    print(f"{'schemas':>7} {'examples':>8} {'ms':>8} {'us/example':>10} {'compiled':>8} {'issues':>7}")
+    for count in (int(c) for c in args.schemas.split(',')):
+        spec = generate_spec(count)
+        start = time.perf_counter()
+        resolver = RefResolver('openapi.yaml', spec, None)
+        check = SchemaExamples()
+        result = next(visit_operations(resolver.spec, [check], resolver))
+        elapsed = time.perf_counter() - start
+        # schema example, two property examples, two request examples, one response example
+        examples = count * 6
+        print(f"{count:>7} {examples:>8} {elapsed * 1e3:>8.1f} {elapsed * 1e6 / examples:>10.2f} "
+              f"{len(check.compiler.compiled):>8} {len(result.issues):>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark state machine analysis on generated lifecycles.
+
+Builds state machines with growing numbers of states: a chain of
+forward transitions with a step back every 10 states, a wildcard
+transition to a cancelled state, a few transitions to undeclared values
+and a few states off the chain. Times problems(), which should grow
+linearly with states plus transitions.
+
+Usage:
+    python bench_state_machines.py [--states 1000,10000,100000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / "scripts"))
+from humaninloop_validators.state_machines import StateMachine  # noqa: E402
+
+
+def generate_machine(states: int) -> StateMachine:
+    values = [f"step{n}" for n in range(states)] + ["cancelled"]
+    # Declared but never entered
+    values += [f"detached{n}" for n in range(0, states, 1000)]
+    machine = StateMachine("Workflow", "status", values, 1, 1, initial={"step0"}, terminal={"cancelled"})
+    for n in range(states - 1):
+        machine.transitions.append((f"step{n}", f"step{n + 1}", n + 10, 1))
+        if n % 10 == 9:
+            machine.transitions.append((f"step{n}", f"step{n - 5}", n + 10, 1))
+        if n % 1000 == 999:
+            machine.transitions.append((f"step{n}", f"missing{n}", n + 10, 1))
+    machine.transitions.append((None, "cancelled", 5, 1))
+    return machine
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--states", default="1000,10000,100000")
+    args = parser.parse_args()
+
+    print(f"{'states':>8} {'transitions':>12} {'ms':>8} {'us/edge':>8} {'problems':>9}")
+    for count in (int(c) for c in args.states.split(",")):
+        machine = generate_machine(count)
+        best, problems = float("inf"), []
+        for _ in range(3):
+            start = time.perf_counter()
+            problems = list(machine.problems())
+            best = min(best, time.perf_counter() - start)
+        edges = len(machine.transitions)
+        print(f"{count:>8} {edges:>12} {best * 1e3:>8.1f} {best * 1e6 / (count + edges):>8.2f} {len(problems):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark the parallel validation sweep.
+
+Copies one feature's artifacts into many specs/NNN-* directories under a
+temporary root and times validate-sweep.py at increasing worker counts.
+Wall-clock time should fall roughly in proportion to the workers until
+the cores run out.
+
+Usage:
+    python bench_sweep.py <spec.md> <data-model.md> <openapi.yaml> [--features 200] [--jobs 1,2,4,8]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+
+
+def build_specs(root: Path, count: int, spec: str, data_model: str, openapi: str) -> Path:
+    specs = root / 'specs'
+    for i in range(1, count + 1):
+        feature = specs / f'{i % 1000:03d}-feature-{i}'
+        (feature / 'contracts').mkdir(parents=True)
+        shutil.copy(spec, feature / 'spec.md')
+        shutil.copy(data_model, feature / 'data-model.md')
+        shutil.copy(openapi, feature / 'contracts' / 'api.yaml')
+    return specs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('spec')
+    parser.add_argument('data_model')
+    parser.add_argument('openapi')
+    parser.add_argument('--features', type=int, default=200)
+    parser.add_argument('--jobs', default=','.join(str(n) for n in (1, 2, 4, 8) if n <= (os.cpu_count() or 1)))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        specs = build_specs(Path(tmp), args.features, args.spec, args.data_model, args.openapi)
+        script = PLUGIN_ROOT / 'scripts' / 'validate-sweep.py'
+
+        print(f"{'jobs':>4} {'seconds':>8} {'features/s':>11} {'speedup':>8}")
+        baseline = None
+        for jobs in (int(j) for j in args.jobs.split(',')):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, str(script), str(specs), '--jobs', str(jobs)],
+                           stdout=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{jobs:>4} {elapsed:>8.2f} {args.features / elapsed:>11.1f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark validator round trips through the resident server.
+
+Starts validator-server.py on a temporary socket and compares, for each
+validator, a fresh `python3 <script>` process against a request over a
+persistent client connection.
+
+Usage:
+    python bench_validator_server.py <spec.md> <data-model.md> <openapi.yaml> [--runs 20]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+
+from humaninloop_validators.client import VALIDATORS, ValidatorClient  # noqa: E402
+
+
+def mean_ms(runs: int, func) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('spec')
+    parser.add_argument('data_model')
+    parser.add_argument('openapi')
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    cases = {
+        'validate-requirements': [args.spec],
+        'validate-user-stories': [args.spec],
+        'validate-model': [args.data_model],
+        'validate-openapi': [args.openapi],
+        'check-artifacts': [args.data_model],
+    }
+
+    socket_path = os.path.join(tempfile.mkdtemp(), 'bench.sock')
+    server = subprocess.Popen(
+        [sys.executable, str(PLUGIN_ROOT / 'scripts' / 'validator-server.py'), '--socket', socket_path]
+    )
+    try:
+        for _ in range(100):
+            if os.path.exists(socket_path):
+                break
+            time.sleep(0.05)
+
+        print(f"{'validator':<24} {'process ms':>11} {'server ms':>10} {'speedup':>8}")
+        with ValidatorClient(socket_path) as client:
+            for validator, validator_args in cases.items():
+                script = str(PLUGIN_ROOT / VALIDATORS[validator])
+                process = mean_ms(args.runs, lambda: subprocess.run(
+                    [sys.executable, script, *validator_args], capture_output=True
+                ))
+                client.run(validator, validator_args)
+                resident = mean_ms(args.runs, lambda: client.run(validator, validator_args))
+                print(f"{validator:<24} {process:>11.2f} {resident:>10.2f} {process / resident:>7.0f}x")
+            client.call('shutdown')
+    finally:
+        server.wait(timeout=10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark watch mode save-to-report latency.
+
+Builds a feature directory with a large spec, starts a FeatureWatcher on
+it, then repeatedly edits one requirement and measures the time from the
+write to the end of the diff report, including change detection and the
+debounce window.
+
+Usage:
+    python bench_watch.py [--blocks 2000] [--edits 20] [--poll]
+"""
+
+import argparse
+import io
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(PLUGIN_ROOT / 'scripts'))
+from humaninloop_validators.watch import DEBOUNCE_SECONDS, FeatureWatcher, open_source  # noqa: E402
+
+
+def generate_spec(count: int) -> list[str]:
+    lines = ['# Feature Specification: Benchmark', '', '## Requirements', '']
+    for i in range(count):
+        lines.append(f'- **FR-{i % 999 + 1:03d}**: System MUST let members manage item {i} through the '
+                     f'dashboard without a page reload.')
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--blocks', type=int, default=2000)
+    parser.add_argument('--edits', type=int, default=20)
+    parser.add_argument('--poll', action='store_true')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['HUMANINLOOP_CACHE_DIR'] = str(Path(tmp) / 'cache')
+        feature = Path(tmp) / '001-bench'
+        feature.mkdir()
+        spec = feature / 'spec.md'
+        lines = generate_spec(args.blocks)
+        spec.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+
+        report = io.StringIO()
+        watcher = FeatureWatcher(feature, out=report)
+        start = time.perf_counter()
+        watcher.revalidate()
+        print(f"initial run: {(time.perf_counter() - start) * 1e3:.1f} ms over {args.blocks} blocks")
+
+        source = open_source(watcher.feature_dir, args.poll)
+        latencies = []
+        for edit in range(args.edits):
+            target = 4 + (edit * 37) % args.blocks
+            wording = 'python dashboard' if edit % 2 == 0 else 'dashboard'
+            lines[target] = lines[target].replace('python dashboard', 'dashboard').replace('dashboard', wording)
+
+            start = time.perf_counter()
+            spec.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            changed = source.wait(1.0)
+            while changed:
+                more = source.wait(DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+            watcher.revalidate(changed)
+            latencies.append((time.perf_counter() - start) * 1e3)
+        source.close()
+
+        print(f"source: {source.name}, debounce: {DEBOUNCE_SECONDS * 1e3:.0f} ms, edits: {args.edits}")
+        print(f"save-to-report ms: median {statistics.median(latencies):.1f}, "
+              f"max {max(latencies):.1f}, min {min(latencies):.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Shared helpers for the humaninloop validation scripts.
+
+The skill scripts under ``skills/*/scripts/`` add the plugin-level
+``scripts/`` directory to ``sys.path`` and import from this package.
+The validators can also be called in-process:
+
+    from humaninloop_validators import validate_requirements
+
+    result = validate_requirements('specs/001-auth/spec.md')
+    if not result.passed:
+        for check in result.checks:
+            ...
+
+Each validate_* function returns a typed result whose to_dict() is the
+JSON document the matching script prints. A missing artifact raises
+ArtifactNotFoundError; an unparseable one raises SpecParseError.
+"""
+
+import importlib
+
+# Public name -> submodule; imported on first access so that light users
+# of the package (the validator client) do not pay for PyYAML and friends.
+_EXPORTS = {
+    'validate_requirements': 'requirements',
+    'validate_user_stories': 'user_stories',
+    'validate_data_model': 'data_model',
+    'validate_openapi': 'openapi',
+    'OpenAPICheck': 'openapi',
+    'register_check': 'openapi',
+    'diff_openapi': 'diff',
+    'validate_artifacts': 'artifacts',
+    'load_document': 'markdown',
+    'parse_document': 'markdown',
+    'Document': 'markdown',
+    'ValidationError': 'results',
+    'ArtifactNotFoundError': 'results',
+    'SpecParseError': 'results',
+    'Issue': 'results',
+    'CheckResult': 'results',
+    'Summary': 'results',
+    'ValidationResult': 'results',
+    'RequirementsResult': 'results',
+    'UserStoriesResult': 'results',
+    'DataModelResult': 'results',
+    'Entity': 'results',
+    'Attribute': 'results',
+    'Relation': 'results',
+    'IndexRecommendation': 'results',
+    'AccessPattern': 'results',
+    'EntitySize': 'results',
+    'ModelAdvice': 'results',
+    'OpenAPIResult': 'results',
+    'Change': 'results',
+    'OpenAPIDiffResult': 'results',
+    'ArtifactsResult': 'results',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,295 @@
+"""
+Plan artifact validation.
+
+Automates common artifact checks for plan phase outputs including:
+- Unresolved markers ([NEEDS CLARIFICATION], [TBD], [TODO], [PLACEHOLDER])
+- Required sections based on file type
+- Traceability references (FR-XXX, US-XXX)
+- PII annotations for sensitive fields
+- Entity consistency across multiple files
+"""
+
+import os
+import re
+from typing import List, Optional, Set, Tuple
+
+from .lines import LineIndex
+from .markdown import Document, load_document
+from .results import ArtifactsResult, CheckList, CheckListener, CheckResult
+
+
+# Markers that indicate unresolved content
+UNRESOLVED_MARKERS = [
+    r'\[NEEDS CLARIFICATION\]',
+    r'\[TBD\]',
+    r'\[TODO\]',
+    r'\[PLACEHOLDER\]',
+]
+
+# Required sections by file type (filename pattern -> list of required headers)
+REQUIRED_SECTIONS = {
+    'research.md': [
+        '## Technical Decisions',
+        '## Alternatives Considered',
+        '## Rationale',
+    ],
+    'data-model.md': [
+        '## Entities',
+        '## Relationships',
+        '## Validation Rules',
+    ],
+}
+
+# Common PII field patterns (case insensitive)
+PII_FIELD_PATTERNS = [
+    r'\bemail\b',
+    r'\bphone\b',
+    r'\bssn\b',
+    r'\bsocial.?security\b',
+    r'\baddress\b',
+    r'\b(?:first|last|full).?name\b',
+    r'\bdate.?of.?birth\b',
+    r'\bdob\b',
+    r'\bpassword\b',
+    r'\bcredit.?card\b',
+    r'\bbank.?account\b',
+]
+
+# Entity name pattern (capitalized words in backticks - most reliable indicator)
+ENTITY_PATTERN = r'`([A-Z][a-zA-Z0-9]+)`'
+
+# Common section header words to exclude from entity detection
+SECTION_HEADERS = {
+    'entities', 'relationships', 'validation', 'rules', 'technical',
+    'decisions', 'alternatives', 'considered', 'rationale', 'overview',
+    'summary', 'introduction', 'conclusion', 'notes', 'references',
+    'requirements', 'constraints', 'assumptions', 'dependencies',
+    'authentication', 'authorization', 'security', 'performance',
+    'scalability', 'monitoring', 'logging', 'testing', 'deployment',
+}
+
+
+def skipped(name: str, reason: str) -> CheckResult:
+    """Build a check that did not apply and does not count toward the summary."""
+    return CheckResult(name, located=False, details={'skipped': True, 'reason': reason})
+
+
+def read_document(filepath: str) -> Optional[Document]:
+    """Load and parse a file, or return None if it cannot be read."""
+    try:
+        return load_document(filepath)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def check_unresolved_markers(content: str, index: Optional[LineIndex] = None) -> CheckResult:
+    """Check for unresolved markers in the content."""
+    result = CheckResult('unresolved_markers')
+    if index is None:
+        index = LineIndex(content)
+
+    for marker_pattern in UNRESOLVED_MARKERS:
+        marker_regex = re.compile(marker_pattern, re.IGNORECASE)
+        for match in marker_regex.finditer(content):
+            line_num, column = index.position(match.start())
+            result.add(f"Line {line_num}: {match.group(0)} marker found", line_num, column)
+
+    return result
+
+
+def check_required_sections(filepath: str, content: str) -> CheckResult:
+    """Check for required markdown sections based on file type."""
+    filename = os.path.basename(filepath).lower()
+
+    # Find matching file type
+    required = None
+    for pattern, sections in REQUIRED_SECTIONS.items():
+        if pattern.lower() in filename:
+            required = sections
+            break
+
+    # Skip if no required sections defined for this file type
+    if required is None:
+        return skipped('required_sections', f'No required sections defined for file type: {filename}')
+
+    result = CheckResult('required_sections', located=False)
+
+    # Check for each required section
+    content_lower = content.lower()
+    for section in required:
+        if section.lower() not in content_lower:
+            result.add(f"Missing required section: {section}")
+
+    return result
+
+
+def check_traceability(content: str) -> CheckResult:
+    """Check for FR-XXX or US-XXX references."""
+    # Pattern for functional requirements (FR-001, FR-1, FR-ABC-001, etc.)
+    fr_pattern = r'\bFR-[A-Z0-9]+-?[0-9]*\b|\bFR-[0-9]+\b'
+    # Pattern for user stories (US-001, US-1, US-ABC-001, etc.)
+    us_pattern = r'\bUS-[A-Z0-9]+-?[0-9]*\b|\bUS-[0-9]+\b'
+
+    fr_count = len(set(re.findall(fr_pattern, content, re.IGNORECASE)))
+    us_count = len(set(re.findall(us_pattern, content, re.IGNORECASE)))
+
+    result = CheckResult('traceability', located=False,
+                         details={'fr_count': fr_count, 'us_count': us_count})
+
+    if fr_count == 0 and us_count == 0:
+        result.add("No FR-XXX or US-XXX traceability references found in document")
+
+    return result
+
+
+def check_pii_markers(filepath: str, lines: List[str]) -> CheckResult:
+    """Check if PII fields have [PII] annotation nearby."""
+    filename = os.path.basename(filepath).lower()
+
+    # Only check data-model files
+    if 'data-model' not in filename and 'datamodel' not in filename and 'model' not in filename:
+        return skipped('pii_markers', 'Not a data model file')
+
+    result = CheckResult('pii_markers')
+    reported = set()
+
+    # Check each line for PII fields
+    # Only check lines that look like field definitions (contain : or have list/table format)
+    field_definition_pattern = r'^[\s\-\*\|]*[a-zA-Z_]+[\s]*[:\|]'
+
+    for line_num, line in enumerate(lines, 1):
+        line_lower = line.lower()
+
+        # Skip lines that don't look like field definitions
+        if not re.match(field_definition_pattern, line):
+            continue
+
+        for pii_pattern in PII_FIELD_PATTERNS:
+            match = re.search(pii_pattern, line_lower)
+            if match:
+                # Field definitions should have [PII] annotation directly on the field line
+                if '[pii]' not in line_lower:
+                    issue = f"Line {line_num}: '{match.group(0).strip()}' field may need [PII] annotation"
+                    if issue not in reported:
+                        reported.add(issue)
+                        result.add(issue, line_num, match.start() + 1)
+                break  # Only report once per line
+
+    return result
+
+
+def extract_entities(content: str) -> Set[str]:
+    """Extract entity names from content.
+
+    Focuses on backtick-wrapped entities as the most reliable indicator
+    of domain model entities (e.g., `User`, `Order`, `Product`).
+    """
+    entities = set()
+
+    # Match backtick entities - most reliable indicator
+    matches = re.findall(ENTITY_PATTERN, content)
+    for match in matches:
+        entity = match if isinstance(match, str) else match[0]
+        if entity and len(entity) > 1:
+            # Skip common section header words
+            if entity.lower() not in SECTION_HEADERS:
+                entities.add(entity)
+
+    # Also match explicit entity declaration patterns
+    # e.g., "### User Entity" or "#### UserProfile"
+    declaration_pattern = r'###\s+([A-Z][a-zA-Z0-9]+)\s+(?:Entity|Model|Schema)'
+    matches = re.findall(declaration_pattern, content)
+    for entity in matches:
+        if entity and len(entity) > 1 and entity.lower() not in SECTION_HEADERS:
+            entities.add(entity)
+
+    return entities
+
+
+def check_entity_consistency(files_data: List[Tuple[str, str]]) -> CheckResult:
+    """Check that entities mentioned in one file appear in others."""
+    if len(files_data) < 2:
+        return skipped('entity_consistency', 'Entity consistency check requires 2+ files')
+
+    # Extract entities from each file
+    file_entities = {}
+    all_entities = set()
+
+    for filepath, content in files_data:
+        entities = extract_entities(content)
+        file_entities[filepath] = entities
+        all_entities.update(entities)
+
+    # Check for entities missing from files
+    result = CheckResult('entity_consistency', located=False)
+    for filepath, entities in file_entities.items():
+        filename = os.path.basename(filepath)
+        missing = all_entities - entities
+
+        # Only report if significant entities are missing
+        for entity in missing:
+            # Skip common words that might be false positives
+            if entity.lower() in ['id', 'type', 'status', 'date', 'time', 'name', 'api', 'json']:
+                continue
+            result.add(f"Entity '{entity}' not found in {filename}")
+
+    return result
+
+
+def is_openapi_file(filepath: str) -> bool:
+    """Check if file is an OpenAPI/contract file."""
+    filename = os.path.basename(filepath).lower()
+    dirname = os.path.dirname(filepath).lower()
+
+    return (
+        filename.endswith('.yaml') or
+        filename.endswith('.yml') or
+        'contract' in filename or
+        'api' in filename or
+        'contracts' in dirname or
+        'openapi' in filename
+    )
+
+
+def validate_artifacts(filepaths: List[str], listener: Optional[CheckListener] = None) -> ArtifactsResult:
+    """Run all validations on the provided plan artifacts.
+
+    Paths that do not exist are ignored; callers decide whether to warn.
+    Each check is passed to listener as it completes.
+    """
+    checks = CheckList(listener)
+    files_data = []
+    validated_files = []
+
+    for filepath in filepaths:
+        if not os.path.exists(filepath):
+            continue
+
+        # Skip OpenAPI files (defer to validate-openapi.py)
+        if is_openapi_file(filepath):
+            checks.append(skipped(f'openapi_validation:{os.path.basename(filepath)}',
+                                  'OpenAPI files should be validated with validate-openapi.py'))
+            validated_files.append(filepath)
+            continue
+
+        doc = read_document(filepath)
+        if doc is None or not doc.text:
+            read_check = CheckResult(f'file_read:{os.path.basename(filepath)}', located=False)
+            read_check.add(f'Could not read file: {filepath}')
+            checks.append(read_check)
+            continue
+
+        validated_files.append(filepath)
+        files_data.append((filepath, doc.text))
+
+        # Run file-specific checks
+        checks.append(check_unresolved_markers(doc.text, doc.index))
+        checks.append(check_required_sections(filepath, doc.text))
+        checks.append(check_traceability(doc.text))
+        checks.append(check_pii_markers(filepath, doc.lines))
+
+    # Run cross-file checks
+    if len(files_data) >= 2:
+        checks.append(check_entity_consistency(files_data))
+
+    return ArtifactsResult(checks=checks, files=[os.path.basename(f) for f in validated_files])
@@ -0,0 +1,442 @@
+"""
+Persistent, content-addressed cache of validator results.
+
+Entries live under .humaninloop/cache/ in the project and are keyed by:
+- the validator name and the plugin version
+- a hash of the validator library sources (the rule set)
+- any extra rule inputs, such as the project term pack
+- the arguments and the content hash of every input file
+
+An unchanged artifact validated by unchanged rules therefore returns its
+stored JSON result without re-running any checks. Entries also record
+the content hash of any file the result depended on beyond the inputs
+(e.g. a contract's $ref targets); a change to one is a miss.
+
+Writes go to a temporary file that is renamed into place, so concurrent
+agents never observe a partial entry. Reads refresh an entry's mtime.
+Each write adds its size to a running total kept in the cache's .size
+file, so a write costs no directory scan; only once the total passes the
+size limit is the cache scanned, the least recently used entries
+deleted and the total re-counted. Any cache I/O failure falls back to
+validating normally.
+
+The cache lives in a project: it is used only under a directory that
+already has a .humaninloop directory, or where $HUMANINLOOP_CACHE_DIR
+points. Callers pass create=True (the scripts' --cache flag) to create
+one in the current directory otherwise.
+
+BlockStore keeps finer-grained state for incremental validation: the
+per-block issues of one artifact from its previous run, keyed by a
+fingerprint of each block, under .humaninloop/cache/blocks/.
+
+SpecCache keeps parsed API contracts in marshal form under
+.humaninloop/cache/specs/, so re-validating an unchanged contract under
+changed rules skips YAML parsing.
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .results import Issue, Requirement
+
+CACHE_DIR_ENV = 'HUMANINLOOP_CACHE_DIR'
+CACHE_MAX_BYTES_ENV = 'HUMANINLOOP_CACHE_MAX_BYTES'
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Running total of bytes written, relative to the cache directory
+SIZE_FILE = '.size'
+
+# Length prefix of a SpecCache entry's header
+SPEC_HEADER_SIZE = struct.Struct('<I')
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+PLUGIN_MANIFEST = PACKAGE_DIR.parents[1] / '.claude-plugin' / 'plugin.json'
+
+
+@lru_cache(maxsize=1)
+def validator_version() -> str:
+    """Plugin version the validators ship with."""
+    try:
+        return json.loads(PLUGIN_MANIFEST.read_text(encoding='utf-8')).get('version', '0')
+    except (OSError, ValueError):
+        return '0'
+
+
+@lru_cache(maxsize=1)
+def ruleset_hash() -> str:
+    """Hash of the validator library sources; any rule change invalidates the cache."""
+    digest = hashlib.sha256()
+    for source in sorted(PACKAGE_DIR.glob('*.py')):
+        digest.update(source.name.encode('utf-8'))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def file_digest(path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def atomic_write(path: Path, data) -> None:
+    """Write data (str or bytes) to path via a temporary file renamed into place."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix='.tmp-', suffix=path.suffix)
+    try:
+        if isinstance(data, bytes):
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+        else:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def ensure_cache_dir(directory: Path) -> None:
+    """Create the cache directory, keeping it out of version control."""
+    if not directory.is_dir():
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / '.gitignore').write_text('*\n', encoding='utf-8')
+
+
+def find_cache_dir(start, create: bool = False) -> Optional[Path]:
+    """Cache directory for the project containing start.
+
+    Uses $HUMANINLOOP_CACHE_DIR if set, otherwise .humaninloop/cache in the
+    nearest ancestor that already has a .humaninloop directory. Outside a
+    project there is none, unless create asks for one in the current
+    directory.
+    """
+    if os.environ.get(CACHE_DIR_ENV):
+        return Path(os.environ[CACHE_DIR_ENV])
+    start = Path(start).resolve()
+    if not start.is_dir():
+        start = start.parent
+    for directory in (start, *start.parents):
+        if (directory / '.humaninloop').is_dir():
+            return directory / '.humaninloop' / 'cache'
+    return Path.cwd() / '.humaninloop' / 'cache' if create else None
+
+
+def cache_max_bytes() -> int:
+    return int(os.environ.get(CACHE_MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+
+
+def record_write(directory: Path, written: int, max_bytes: Optional[int] = None) -> None:
+    """Add written bytes to the cache's running total, evicting once it passes max_bytes.
+
+    The total only grows between scans (a rewritten entry counts again),
+    so it errs towards scanning early. A cache without a total yet is
+    scanned once to start one.
+    """
+    if max_bytes is None:
+        max_bytes = cache_max_bytes()
+    size_path = directory / SIZE_FILE
+    try:
+        total = int(size_path.read_text(encoding='ascii')) + written
+    except (OSError, ValueError):
+        total = None
+    if total is None or total > max_bytes:
+        total = evict(directory, max_bytes)
+    atomic_write(size_path, str(total))
+
+
+def evict(directory: Path, max_bytes: int) -> int:
+    """Delete least recently used entries until the cache fits max_bytes; return its size."""
+    entries = []
+    total = 0
+    for shard in os.scandir(directory):
+        if not shard.is_dir():
+            continue
+        for entry in os.scandir(shard.path):
+            if entry.name.startswith('.tmp-'):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+            total += stat.st_size
+
+    if total <= max_bytes:
+        return total
+    for _, size, path in sorted(entries):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+        if total <= max_bytes:
+            break
+    return total
+
+
+class ResultCache:
+    """Validator results stored as one JSON file per key."""
+
+    def __init__(self, directory, max_bytes: Optional[int] = None):
+        self.directory = Path(directory)
+        if max_bytes is None:
+            max_bytes = cache_max_bytes()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_path(cls, start, create: bool = False) -> Optional['ResultCache']:
+        """The cache of the project containing start; None outside a project unless create."""
+        directory = find_cache_dir(start, create)
+        return cls(directory) if directory is not None else None
+
+    def key(self, validator: str, args: list[str], rules: str = '') -> str:
+        """Cache key for running validator on args; raises OSError if an input is unreadable."""
+        digest = hashlib.sha256()
+        digest.update(json.dumps({
+            'validator': validator,
+            'version': validator_version(),
+            'ruleset': ruleset_hash(),
+            'rules': rules,
+            'args': args,
+        }, sort_keys=True).encode('utf-8'))
+        for arg in args:
+            digest.update(file_digest(arg).encode('ascii'))
+        return digest.hexdigest()
+
+    def entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f'{key}.json'
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self.entry_path(key)
+        try:
+            value = json.loads(path.read_text(encoding='utf-8'))
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return value
+
+    def put(self, key: str, value: dict) -> None:
+        path = self.entry_path(key)
+        try:
+            ensure_cache_dir(self.directory)
+            path.parent.mkdir(exist_ok=True)
+            data = json.dumps(value).encode('utf-8')
+            atomic_write(path, data)
+            record_write(self.directory, len(data), self.max_bytes)
+        except OSError:
+            pass
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        atomic_write(self.directory / SIZE_FILE, str(evict(self.directory, self.max_bytes)))
+
+    def fetch(self, validator: str, args: list[str], compute: Callable[[], dict], rules: str = '',
+              dependencies: Optional[Callable[[dict], list[str]]] = None) -> dict:
+        """Return the stored result for this input, computing and storing it on a miss.
+
+        dependencies(result) names further files the result was computed
+        from, such as contracts reached through $ref. A stored result is
+        only reused while their contents are unchanged too. Errors raised
+        by compute are not cached.
+        """
+        try:
+            key = self.key(validator, args, rules)
+        except OSError:
+            # Missing input: let the validator report it
+            return compute()
+
+        entry = self.get(key)
+        if entry is not None and 'result' in entry and self.unchanged(entry.get('dependencies', {})):
+            self.hits += 1
+            return entry['result']
+
+        self.misses += 1
+        value = compute()
+        try:
+            depends = {path: file_digest(path) for path in (dependencies(value) if dependencies else [])}
+        except OSError:
+            return value
+        self.put(key, {'result': value, 'dependencies': depends})
+        return value
+
+    @staticmethod
+    def unchanged(dependencies: dict[str, str]) -> bool:
+        try:
+            return all(file_digest(path) == digest for path, digest in dependencies.items())
+        except OSError:
+            return False
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class BlockStore:
+    """Per-block check issues of one artifact from its previous run.
+
+    A block is reused when its fingerprint (ID, marker position and text)
+    and the rules it was checked under are unchanged. Issue lines are kept
+    relative to the block, so blocks that merely moved are reused too.
+    """
+
+    def __init__(self, path: Optional[Path], rules: str = ''):
+        # None keeps the blocks in memory only, for the life of the store
+        self.path = Path(path) if path is not None else None
+        self.header = {'version': validator_version(), 'ruleset': ruleset_hash(), 'rules': rules}
+        self.previous = {}
+        self.current = {}
+        self.reused = 0
+        self.checked = 0
+        if self.path is None:
+            return
+        try:
+            stored = json.loads(self.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if stored.get('header') == self.header:
+            self.previous = stored.get('blocks', {})
+
+    @classmethod
+    def for_file(cls, file_path, rules: str = '', create: bool = False) -> 'BlockStore':
+        """The stored blocks of file_path; kept in memory only outside a project unless create."""
+        directory = find_cache_dir(file_path, create)
+        if directory is None:
+            return cls(None, rules)
+        name = hashlib.sha256(str(Path(file_path).resolve()).encode('utf-8')).hexdigest()
+        return cls(directory / 'blocks' / f'{name}.json', rules)
+
+    @staticmethod
+    def fingerprint(req: Requirement) -> str:
+        block = '\0'.join((req.id, str(req.column), str(req.text_column), req.text))
+        return hashlib.sha256(block.encode('utf-8')).hexdigest()
+
+    def lookup(self, req: Requirement) -> Optional[dict[str, list[Issue]]]:
+        """Return the stored issues for an unchanged block, rebased to its current line."""
+        key = self.fingerprint(req)
+        stored = self.previous.get(key)
+        if stored is None:
+            return None
+        self.current[key] = stored
+        self.reused += 1
+        return {
+            name: [Issue(message, None if delta is None else req.line + delta, column)
+                   for message, delta, column in issues]
+            for name, issues in stored.items()
+        }
+
+    def remember(self, req: Requirement, issues: dict[str, list[Issue]]) -> None:
+        self.checked += 1
+        self.current[self.fingerprint(req)] = {
+            name: [[i.message, None if i.line is None else i.line - req.line, i.column] for i in found]
+            for name, found in issues.items()
+        }
+
+    def save(self) -> None:
+        """Persist the blocks seen in this run, dropping blocks that no longer exist."""
+        if self.path is None or self.current.keys() == self.previous.keys():
+            return
+        try:
+            ensure_cache_dir(self.path.parents[1])
+            self.path.parent.mkdir(exist_ok=True)
+            data = json.dumps({'header': self.header, 'blocks': self.current}).encode('utf-8')
+            atomic_write(self.path, data)
+            record_write(self.path.parents[1], len(data))
+        except OSError:
+            pass
+
+    def advance(self) -> None:
+        """Start a new run in the same process, treating this run's blocks as the previous state."""
+        self.previous, self.current = self.current, {}
+        self.reused = self.checked = 0
+
+    def stats(self) -> dict:
+        return {'reused': self.reused, 'checked': self.checked}
+
+
+class SpecCache:
+    """Parsed contracts keyed by path, mtime and content hash.
+
+    Each file has one entry: a length-prefixed header of the parser
+    identity, the file's mtime and size and its content hash, followed by
+    the parsed value, both marshalled. A matching mtime and size return the stored value
+    without reading the file; otherwise a matching content hash does.
+    Values marshal cannot represent (e.g. YAML timestamps) are not stored.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, directory, rules: str = ''):
+        self.directory = Path(directory)
+        self.identity = [self.FORMAT, validator_version(), rules]
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_path(cls, start, rules: str = '', create: bool = False) -> Optional['SpecCache']:
+        """The parsed-contract cache of the project containing start; None outside a project unless create."""
+        directory = find_cache_dir(start, create)
+        return cls(directory / 'specs', rules) if directory is not None else None
+
+    def entry_path(self, file_path: Path) -> Path:
+        name = hashlib.sha256(str(file_path.resolve()).encode('utf-8')).hexdigest()
+        return self.directory / f'{name}.marshal'
+
+    def load(self, file_path, parse: Callable[[bytes], Any]) -> Any:
+        """Return the parsed contents of file_path, calling parse(data) on a miss.
+
+        Errors raised by parse are not cached.
+        """
+        path = Path(file_path)
+        stat = path.stat()
+        entry = self.entry_path(path)
+        header, value = self.read(entry)
+        if header is not None and header[:3] != self.identity:
+            header = None
+        if header is not None and header[3:5] == [stat.st_mtime_ns, stat.st_size]:
+            self.hits += 1
+            return value
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        if header is not None and header[5] == digest:
+            # Touched but unchanged: keep the value under the new mtime
+            self.hits += 1
+        else:
+            self.misses += 1
+            value = parse(data)
+        self.store(entry, [*self.identity, stat.st_mtime_ns, stat.st_size, digest], value)
+        return value
+
+    @staticmethod
+    def read(entry: Path) -> tuple[Optional[list], Any]:
+        # Read whole: marshal.load() on a file object reads in small pieces
+        try:
+            data = memoryview(entry.read_bytes())
+            (size,) = SPEC_HEADER_SIZE.unpack_from(data)
+            start = SPEC_HEADER_SIZE.size
+            return marshal.loads(data[start:start + size]), marshal.loads(data[start + size:])
+        except (OSError, EOFError, ValueError, TypeError, struct.error):
+            return None, None
+
+    def store(self, entry: Path, header: list, value: Any) -> None:
+        try:
+            header_data = marshal.dumps(header)
+            data = SPEC_HEADER_SIZE.pack(len(header_data)) + header_data + marshal.dumps(value)
+        except ValueError:
+            return
+        try:
+            ensure_cache_dir(self.directory.parent)
+            self.directory.mkdir(exist_ok=True)
+            atomic_write(entry, data)
+            record_write(self.directory.parent, len(data))
+        except OSError:
+            pass
+
+    def stats(self) -> dict:
+        return {'hits': self.hits, 'misses': self.misses}
@@ -0,0 +1,159 @@
+"""
+Row-size and capacity estimates for a data model.
+
+Each attribute's conceptual type gives its stored width: fixed-width
+types (Identifier, Integer, Timestamp, Enum...) a number of bytes,
+Text(N) and Decimal(P,S) a width derived from their arguments. Types
+with no bound (Text, JSON, URL) and types the table does not know are
+left out of the width and listed instead, so row_bytes, the row header
+plus those widths, is the widest row the bounded columns can make. Widths follow PostgreSQL's storage,
+counting characters as bytes; they are estimates, not byte-exact.
+
+With an expected row count ("**Expected rows**: 2M" in the entity's
+section), the table is projected from rows per 8 KiB page, and each
+index, the primary key's and those the advisor recommends, from index
+entries per leaf page at the default fill factor.
+
+problems() flags rows wider than a page, rows over the 2 KiB beyond
+which values are compressed or moved out of line, and unbounded text in
+entities expected to grow past a million rows.
+"""
+
+import math
+from typing import Iterator, Optional
+
+from .indexes import snake
+from .results import Attribute, Entity, EntitySize, IndexRecommendation
+
+# Stored width in bytes, by lower-cased conceptual type
+FIXED_WIDTHS = {
+    "identifier": 16, "uuid": 16, "guid": 16, "id": 16,
+    "reference": 16, "ref": 16, "fk": 16, "foreignkey": 16,
+    "integer": 4, "int": 4, "smallint": 2, "biginteger": 8, "bigint": 8, "long": 8,
+    "float": 8, "double": 8, "real": 8, "number": 8,
+    "boolean": 1, "bool": 1,
+    "timestamp": 8, "datetime": 8, "date": 4, "time": 8, "duration": 16, "interval": 16,
+    "enum": 4,
+}
+
+# Decimal types and the precision assumed when none is written
+DECIMAL_KINDS = {"decimal": 18, "numeric": 18, "money": 19, "currency": 19}
+
+# Text types, bounded by a length argument; formats with a standard maximum length
+TEXT_KINDS = {"text", "string", "varchar", "char"}
+TEXT_BOUNDS = {"email": 254, "phone": 16}
+
+# Types holding arbitrarily large values
+LARGE_KINDS = {"json", "jsonb", "markdown", "richtext", "html", "blob", "binary", "bytes"}
+UNBOUNDED_KINDS = LARGE_KINDS | {"url", "uri"}
+
+# Heap page layout
+PAGE_BYTES = 8192
+PAGE_USABLE = PAGE_BYTES - 24
+ROW_HEADER = 24
+LINE_POINTER = 4
+# Above this a row's long values are compressed or stored out of line
+INLINE_LIMIT = 2032
+
+# B-tree leaf entries: header, key padded to 8 bytes, line pointer; leaves filled to 90%
+INDEX_HEADER = 8
+INDEX_FILL = 0.9
+# Key width assumed for a column whose width is not known
+UNKNOWN_KEY = 32
+
+# Expected rows from which unbounded text is flagged
+LARGE_TABLE = 1_000_000
+
+
+def text_width(length: int) -> int:
+    """A varlena value of length bytes: a 1-byte header up to 126 bytes, 4 above."""
+    return length + (1 if length < 127 else 4)
+
+
+def width(attribute: Attribute) -> Optional[int]:
+    """Stored width of the attribute in bytes; None if unbounded or unknown."""
+    kind = attribute.kind.lower()
+    if kind in FIXED_WIDTHS:
+        return FIXED_WIDTHS[kind]
+    if kind in DECIMAL_KINDS:
+        precision = DECIMAL_KINDS[kind]
+        if attribute.arguments and attribute.arguments[0].isdigit():
+            precision = int(attribute.arguments[0])
+        # Two bytes per four digits, plus the number's header
+        return 3 + 2 * math.ceil(precision / 4)
+    if kind in TEXT_KINDS and attribute.arguments and attribute.arguments[0].isdigit():
+        return text_width(int(attribute.arguments[0]))
+    if kind in TEXT_BOUNDS:
+        return text_width(TEXT_BOUNDS[kind])
+    return None
+
+
+def is_unbounded(attribute: Attribute) -> bool:
+    kind = attribute.kind.lower()
+    return kind in UNBOUNDED_KINDS or (kind in TEXT_KINDS and not attribute.arguments)
+
+
+def columns(entity: Entity) -> list[Attribute]:
+    """The entity's typed attributes, once each; a Validation table repeating names has no types."""
+    seen, found = set(), []
+    for attribute in entity.attributes:
+        if attribute.type and attribute.name not in seen:
+            seen.add(attribute.name)
+            found.append(attribute)
+    return found
+
+
+def pages(rows: int, entry: int, usable: float) -> int:
+    """Pages holding rows entries of entry bytes; an entry wider than a page spans several."""
+    if entry > usable:
+        return rows * math.ceil(entry / usable)
+    return math.ceil(rows / int(usable // entry))
+
+
+def estimate(entity: Entity, indexes: list[IndexRecommendation]) -> EntitySize:
+    """The entity's row width and, if its expected rows are known, table and index sizes."""
+    widths, unbounded, unknown = {}, [], []
+    for attribute in columns(entity):
+        stored = width(attribute)
+        if stored is not None:
+            widths[attribute.name] = stored
+        elif is_unbounded(attribute):
+            unbounded.append(attribute.name)
+        else:
+            unknown.append(attribute.name)
+    row_bytes = ROW_HEADER + sum(widths.values())
+
+    table_bytes = index_bytes = None
+    if entity.rows is not None:
+        table_bytes = pages(entity.rows, row_bytes + LINE_POINTER, PAGE_USABLE) * PAGE_BYTES
+        keys = [(f"pk_{snake(entity.name)}", ("id",))] if "id" in widths else []
+        keys += [(index.name, index.columns) for index in indexes if index.entity == entity.name]
+        index_bytes = {}
+        for name, key in keys:
+            key_bytes = sum(widths.get(column, UNKNOWN_KEY) for column in key)
+            entry = INDEX_HEADER + math.ceil(key_bytes / 8) * 8 + LINE_POINTER
+            index_bytes[name] = pages(entity.rows, entry, PAGE_USABLE * INDEX_FILL) * PAGE_BYTES
+
+    return EntitySize(
+        entity=entity.name, row_bytes=row_bytes, unbounded=tuple(unbounded), unknown=tuple(unknown),
+        rows=entity.rows, table_bytes=table_bytes, index_bytes=index_bytes, line=entity.line,
+    )
+
+
+def problems(entity: Entity, size: EntitySize) -> Iterator[tuple[str, int, int]]:
+    """(message, line, column) for each capacity problem of the entity."""
+    stored = size.row_bytes
+    if stored > PAGE_USABLE:
+        yield (f"{entity.name}: Estimated row width {stored:,} bytes exceeds the {PAGE_BYTES // 1024} KiB page; "
+               f"move rarely read columns to their own entity", entity.line, 1)
+    elif stored > INLINE_LIMIT:
+        yield (f"{entity.name}: Estimated row width {stored:,} bytes is over 2 KiB, so fewer than four rows fit "
+               f"a page and long values are compressed or stored out of line", entity.line, 1)
+
+    if size.rows is not None and size.rows >= LARGE_TABLE:
+        for attribute in columns(entity):
+            kind = attribute.kind.lower()
+            if kind in LARGE_KINDS or (kind in TEXT_KINDS and not attribute.arguments):
+                yield (f"{entity.name}.{attribute.name}: Unbounded {attribute.type} in an entity expected to hold "
+                       f"{size.rows:,} rows; give it a maximum length or move it to its own entity",
+                       attribute.line, attribute.column)
@@ -0,0 +1,83 @@
+"""
+Thin client for the resident validator server.
+
+Imports only the standard-library modules needed to talk to the socket,
+so a client invocation costs little more than interpreter startup. When
+no server is listening, the validator script runs in-process instead,
+making the client a drop-in for calling the script directly.
+"""
+
+import json
+import os
+import socket
+import tempfile
+from pathlib import Path
+
+SOCKET_ENV = 'HUMANINLOOP_VALIDATOR_SOCKET'
+
+PLUGIN_ROOT = Path(__file__).resolve().parents[2]
+
+# Validator name -> script path relative to the plugin root
+VALIDATORS = {
+    'validate-requirements': 'skills/authoring-requirements/scripts/validate-requirements.py',
+    'validate-user-stories': 'skills/authoring-user-stories/scripts/validate-user-stories.py',
+    'validate-model': 'skills/patterns-entity-modeling/scripts/validate-model.py',
+    'validate-openapi': 'skills/patterns-api-contracts/scripts/validate-openapi.py',
+    'check-artifacts': 'skills/validation-plan-artifacts/scripts/check-artifacts.py',
+}
+
+
+def default_socket_path() -> str:
+    """Socket path from the environment, or a per-user path in the temp dir."""
+    if os.environ.get(SOCKET_ENV):
+        return os.environ[SOCKET_ENV]
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir()
+    return str(Path(runtime_dir) / f'humaninloop-validators-{os.getuid()}.sock')
+
+
+class ValidatorClient:
+    """Persistent connection to a validator server."""
+
+    def __init__(self, socket_path: str = None, timeout: float = 60.0):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(socket_path or default_socket_path())
+        self.reader = self.sock.makefile('rb')
+        self.next_id = 0
+
+    def call(self, method: str, params: dict = None):
+        """Send one request and return its result, raising on RPC errors."""
+        self.next_id += 1
+        request = {'jsonrpc': '2.0', 'id': self.next_id, 'method': method, 'params': params or {}}
+        self.sock.sendall((json.dumps(request) + '\n').encode('utf-8'))
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError('Validator server closed the connection')
+        response = json.loads(line)
+        if 'error' in response:
+            raise RuntimeError(response['error']['message'])
+        return response['result']
+
+    def run(self, validator: str, args: list, cwd: str = None) -> dict:
+        """Run a validator CLI on the server; returns exit_code/stdout/stderr."""
+        return self.call('run', {'validator': validator, 'args': list(args), 'cwd': cwd or os.getcwd()})
+
+    def close(self):
+        self.reader.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def run_local(validator: str, args: list):
+    """Run the validator script in this process, exactly as its CLI would."""
+    import runpy
+    import sys
+
+    script = str(PLUGIN_ROOT / VALIDATORS[validator])
+    sys.argv = [script, *args]
+    runpy.run_path(script, run_name='__main__')
@@ -0,0 +1,834 @@
+"""
+Validation of data-model.md files.
+
+Validates domain entity definitions for completeness and consistency
+according to the patterns-entity-modeling skill requirements.
+
+Each entity section is parsed once into an Entity record: its attribute
+table rows become typed Attribute records, which the id_fields,
+audit_fields and validation_rules checks read by name, type, required
+flag and constraints. Documentation written as prose (an attributes or
+relationships section, state transitions) is looked for once and kept
+as markers. The checks then look at the records rather than scanning
+the text again.
+
+The relations entities declare (Reference attributes, Relationships
+tables, "belongs to X") and the document's relationship diagrams form
+an EntityGraph, which the dangling_references, required_reference_cycles
+and orphan_entities checks analyse.
+
+Each status/state field with a From/To transitions table, in its entity
+section or under a "## State Machine" heading, becomes a StateMachine
+that the state_transitions check analyses.
+
+Attribute types give each entity an estimated row width, which the
+row_size check holds against page-size thresholds (see capacity).
+"""
+
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Optional
+
+from .capacity import estimate, problems as capacity_problems
+from .entity_graph import EntityGraph
+from .indexes import UniqueKey, advise
+from .state_machines import StateMachine
+from .markdown import Document, Section, Table, load_document
+from .results import (
+    ArtifactNotFoundError, Attribute, CheckList, CheckListener, CheckResult, DataModelResult, Entity, ModelAdvice,
+    Relation
+)
+
+
+# Pattern for ## Entity: Name [STATUS] format
+ENTITY_HEADER = re.compile(r"^##\s+Entity:\s+(\w+)(?:\s+\[([^\]]+)\])?")
+
+# | Entity | Attributes | Relationships | Status |
+SUMMARY_ROW = re.compile(r"\|\s*(\w+)\s*\|[^|]*\|[^|]*\|\s*\[?(\w+[^\]]*)\]?\s*\|")
+
+# Relationship keywords to look for
+RELATIONSHIP_KEYWORDS = [
+    r"belongs\s+to",
+    r"has\s+many",
+    r"has\s+one",
+    r"references",
+    r"Reference\(",
+    r"N:1",
+    r"1:N",
+    r"N:M",
+    r"1:1",
+    r"One-to-Many",
+    r"Many-to-One",
+    r"Many-to-Many",
+    r"One-to-One",
+    r"Foreign\s*Key",
+    r"→",
+    r"←",
+    r"↔",
+]
+
+# Audit field names, lower-cased without underscores, and the types a
+# created/updated attribute of another name needs
+AUDIT_FIELDS = {
+    "createdat", "createdon", "creationtime", "created",
+    "updatedat", "updatedon", "modifiedat", "modifiedon", "lastupdated",
+}
+AUDIT_KINDS = {"timestamp", "datetime"}
+
+# Types of an identifier attribute, and constraints naming one
+IDENTIFIER_KINDS = {"identifier", "uuid", "guid", "id"}
+PRIMARY_KEY = re.compile(r"Primary\s*key|\bPK\b", re.IGNORECASE)
+
+# Pattern to identify status/state fields
+STATE_FIELD = re.compile(r"\|\s*(status|state)\s*\|.*Enum\[([^\]]+)\]", re.IGNORECASE)
+
+# Each keyword list compiled once. Kept as separate patterns: a search for
+# one keyword skips ahead to its literal text, which an alternation of all
+# of them cannot, so trying them in turn is several times faster.
+RELATIONSHIP = tuple(re.compile(keyword, re.IGNORECASE) for keyword in RELATIONSHIP_KEYWORDS)
+
+# An attributes table header, and a table row with at least two cells
+ATTRIBUTE_HEADER = re.compile(r"\|\s*Attribute\s*\|.*\|", re.IGNORECASE)
+ATTRIBUTE_ROW = re.compile(r"\|\s*\w+\s*\|[^|]+\|")
+
+# State transition documentation
+TRANSITIONS = (
+    re.compile(r"###?\s+Transitions", re.IGNORECASE),
+    re.compile(r"###?\s+States", re.IGNORECASE),
+    re.compile(r"\|\s*From\s*\|\s*To\s*\|"),
+)
+
+# Conceptual type: Text, Text(200), Decimal(10,2), Enum[a,b], Reference(User)
+TYPE = re.compile(r"^(\w+)\s*(?:\((.*)\)|\[(.*)\])?$")
+
+# Attributes table columns, by lower-cased header. A Field or Name column
+# makes an attributes table only with a Type column beside it; without one
+# (| Field | Validation |) the table adds constraints to attributes.
+NAME_COLUMNS = ("attribute", "field", "name")
+CONSTRAINT_COLUMNS = ("constraints", "validation", "pattern")
+# Columns of Constraints, Relationships and Foreign Keys tables, which
+# list no attributes
+OTHER_TABLE_COLUMNS = {"fields", "target", "references"}
+
+# Required cells, lower-cased
+REQUIRED_YES = {"yes", "y", "true", "required", "✓", "✔"}
+REQUIRED_NO = {"no", "n", "false", "optional"}
+
+# A PII annotation in any cell: [PII], **PII**, **PII-SENSITIVE**
+PII_MARKER = re.compile(r"\[PII[^\]]*\]|\*\*PII[^*]*\*\*")
+
+# States table marks, per STATE-MACHINES.md
+INITIAL_MARK = re.compile(r"\binitial\b", re.IGNORECASE)
+TERMINAL_MARK = re.compile(r"\b(?:terminal|final)\b", re.IGNORECASE)
+
+# From cells meaning any state
+ANY_STATE = {"*", "any", "any state", "(any)"}
+
+# Attribute type kinds that reference another entity: Reference(User)
+REFERENCE_KINDS = {"reference", "ref", "fk", "foreignkey"}
+
+# "belongs to Workspace", "has many Tags"; only capitalised names are entities
+RELATION_PROSE = re.compile(
+    r"\b((?:[Bb]elongs\s+to|[Hh]as\s+(?:many|one))\s+(?:an?\s+|the\s+)?([A-Z]\w*))"
+)
+
+# Relationship diagram edges: User ──1:N──▶ Task, User ◀──N:M──▶ Project (via ProjectMember)
+DIAGRAM_EDGE = re.compile(
+    r"^[ \t]*(\w+)[ \t]*(?:◀|<)?[─-]+[ \t]*([1NM]:[1NM])[ \t]*[─-]+(?:▶|>)[ \t]*(\w+)"
+    r"(?:[ \t]*\(via[ \t]+(\w+)\))?",
+    re.MULTILINE,
+)
+
+# Cardinality as written in a Relationships table Type cell
+CARDINALITY = re.compile(r"\b([1NM]):([1NM])\b", re.IGNORECASE)
+CARDINALITY_WORDS = {
+    "one-to-one": "1:1", "one-to-many": "1:N", "many-to-one": "N:1", "many-to-many": "N:M",
+}
+PROSE_CARDINALITY = {"belongs": "N:1", "has many": "1:N", "has one": "1:1"}
+
+# Unique and Unique(scope) in a Validation or Constraints cell
+UNIQUE = re.compile(r"\bUnique\b(?:\s*\(([^)]*)\))?", re.IGNORECASE)
+
+# - Unique: (userId, projectId) - user can join project once
+UNIQUE_BULLET = re.compile(r"^[ \t]*[-*][ \t]*Unique:?[ \t]*\(([^)]+)\)", re.IGNORECASE | re.MULTILINE)
+
+# **Expected rows**: ~2M, - Volume: 50,000 rows
+EXPECTED_ROWS = re.compile(
+    r"^[ \t]*(?:[-*][ \t]+)?\**(?:Expected[ \t]+(?:rows|volume|row[ \t]+count)|Volume|Row[ \t]+count)\**"
+    r"[ \t]*:[ \t]*\**[ \t]*[~≈]?[ \t]*(\d[\d,_]*(?:\.\d+)?)[ \t]*(k|m|b|thousand|million|billion)?\b",
+    re.IGNORECASE | re.MULTILINE,
+)
+ROW_MULTIPLIERS = {"k": 10**3, "thousand": 10**3, "m": 10**6, "million": 10**6, "b": 10**9, "billion": 10**9}
+
+
+def read_document(filepath) -> Document:
+    """Load and parse a data-model.md file."""
+    if not Path(filepath).exists():
+        raise ArtifactNotFoundError(f"File not found: {filepath}")
+    return load_document(filepath)
+
+
+def extract_entities(doc: Document) -> list[Entity]:
+    """
+    Extract entities from a parsed data-model.md.
+
+    Looks for level-2 sections like:
+    - ## Entity: EntityName
+    - ## Entity: EntityName [NEW]
+    - ## Entity: EntityName [EXTENDS EXISTING]
+
+    An entity runs until the next level-1 or level-2 heading.
+    """
+    entities = []
+    starts = [table.start for table in doc.tables]
+
+    for section in doc.sections_at(2):
+        match = ENTITY_HEADER.match(doc.lines[section.line - 1])
+        if match:
+            tables = doc.tables[bisect_left(starts, section.start):bisect_left(starts, section.end)]
+            entities.append(parse_entity(doc, section, match.group(1), match.group(2) or "NEW", tables))
+
+    # If no entities found with ## Entity: format, try summary table
+    if not entities:
+        entities = extract_entities_from_summary(doc)
+
+    return entities
+
+
+def parse_entity(doc: Document, section: Section, name: str, status: str, tables: list[Table]) -> Entity:
+    """Build the Entity record for one entity section and the tables inside it."""
+    content = doc.body(section)
+    state = STATE_FIELD.search(content)
+    attributes, relations = [], []
+    for table in tables:
+        attributes += parse_attributes(table)
+        relations += parse_relationship_table(name, table)
+    for table in tables:
+        add_constraints(attributes, table)
+
+    for attribute in attributes:
+        if attribute.kind.lower() in REFERENCE_KINDS and attribute.arguments:
+            relations.append(Relation(
+                kind="reference",
+                source=name,
+                target=attribute.arguments[0],
+                text=attribute.type,
+                line=attribute.line,
+                column=attribute.column,
+                via=attribute.name,
+                required=attribute.required is True,
+                cardinality="N:1",
+            ))
+    for match in RELATION_PROSE.finditer(content):
+        line, column = doc.index.position(section.body_start + match.start())
+        phrase = " ".join(match.group(1).lower().split()[:2])
+        relations.append(Relation(
+            kind="prose", source=name, target=match.group(2), text=f"'{match.group(1)}'", line=line, column=column,
+            cardinality=PROSE_CARDINALITY.get(phrase, PROSE_CARDINALITY["belongs"]),
+        ))
+
+    return Entity(
+        name=name,
+        status=status,
+        content=content,
+        line=section.line,
+        offset=section.body_start,
+        attributes=attributes,
+        markers=find_markers(content),
+        state=(state.group(1), state.group(2), state.start()) if state else None,
+        relations=relations,
+        rows=expected_rows(content),
+    )
+
+
+def expected_rows(content: str) -> Optional[int]:
+    """The row count an entity section says to expect, if any: "**Expected rows**: 2M"."""
+    match = EXPECTED_ROWS.search(content)
+    if not match:
+        return None
+    count = float(match.group(1).replace(",", "").replace("_", ""))
+    return round(count * ROW_MULTIPLIERS.get((match.group(2) or "").lower(), 1))
+
+
+def found(patterns: tuple[re.Pattern, ...], content: str) -> bool:
+    """Whether any of the patterns occurs in content."""
+    return any(pattern.search(content) for pattern in patterns)
+
+
+def find_markers(content: str) -> frozenset[str]:
+    """The kinds of documentation an entity's text contains.
+
+    attributes       an attributes table or section
+    attribute_rows   table rows other than a header or delimiter
+    relationships    a relationship keyword or section
+    transitions      state transition or state documentation
+    """
+    markers = set()
+    if ATTRIBUTE_HEADER.search(content) or "### Attributes" in content or "### Standard Fields" in content:
+        markers.add("attributes")
+    if any("Attribute" not in row and "---" not in row for row in ATTRIBUTE_ROW.findall(content)):
+        markers.add("attribute_rows")
+    if found(RELATIONSHIP, content) or "### Relationships" in content:
+        markers.add("relationships")
+    if found(TRANSITIONS, content):
+        markers.add("transitions")
+    return frozenset(markers)
+
+
+def tabulated(entity: Entity) -> bool:
+    """Whether the entity has attribute records or table rows; one with neither fails required_attributes."""
+    return bool(entity.attributes) or "attribute_rows" in entity.markers
+
+
+def is_identifier(entity: Entity, attribute: Attribute) -> bool:
+    """An id or <entity>Id attribute, one of an identifier type, or one constrained as the primary key."""
+    name = attribute.name.lower().replace("_", "")
+    return (name in ("id", entity.name.lower() + "id") or attribute.kind.lower() in IDENTIFIER_KINDS
+            or bool(PRIMARY_KEY.search(attribute.constraints)))
+
+
+def is_audit_field(attribute: Attribute) -> bool:
+    """A createdAt/updatedAt field, or a timestamp whose name mentions created or updated."""
+    name = attribute.name.lower().replace("_", "")
+    return name in AUDIT_FIELDS or (
+        attribute.kind.lower() in AUDIT_KINDS and ("created" in name or "updated" in name))
+
+
+def is_constrained(attribute: Attribute) -> bool:
+    """A Required cell, a constraint, or a bounded type (Text(200), Enum[a,b], Decimal(10,2))."""
+    return attribute.required is not None or bool(attribute.arguments) or \
+        plain(attribute.constraints) not in ("", "-")
+
+
+def plain(cell: str) -> str:
+    """A cell without Markdown emphasis or code marks."""
+    return cell.strip("*`_ ")
+
+
+def table_columns(table: Table) -> list[str]:
+    return [plain(cell).lower() for cell in table.columns]
+
+
+def is_attributes_table(columns: list[str]) -> bool:
+    """An Attribute column, or a Field or Name column beside a Type column, and no Fields, Target or References column."""
+    return not OTHER_TABLE_COLUMNS.intersection(columns) and \
+        ("attribute" in columns or ("type" in columns and any(name in columns for name in NAME_COLUMNS)))
+
+
+def parse_attributes(table: Table) -> list[Attribute]:
+    """Attribute records for the rows of an attributes table; [] for any other table."""
+    columns = table_columns(table)
+    if not is_attributes_table(columns):
+        return []
+    width = len(columns)
+
+    def find(*names):
+        # A missing column reads the blank cell padded onto every row
+        return next((i for i, column in enumerate(columns) if column in names), width)
+
+    name_column = find(*NAME_COLUMNS)
+    type_column = find("type")
+    required_column = find("required")
+    constraint_column = find(*CONSTRAINT_COLUMNS)
+    default_column = find("default")
+    pii_column = find("pii")
+    blank = [""] * (width + 1)
+
+    attributes = []
+    for row in table.rows:
+        cells = row.cells[:width]
+        cells += blank[len(cells):]
+        name = plain(cells[name_column])
+        if not name:
+            continue
+
+        written = plain(cells[type_column])
+        kind, arguments = written, []
+        if "(" in written or "[" in written:
+            match = TYPE.match(written)
+            if match:
+                kind = match.group(1)
+                inner = match.group(2) if match.group(2) is not None else match.group(3)
+                arguments = [argument.strip() for argument in inner.split(",")] if inner else []
+
+        required = plain(cells[required_column]).lower()
+        pii = plain(cells[pii_column]).lower() not in ("", "-", "no", "n", "false")
+        attributes.append(Attribute(
+            name=name,
+            type=written,
+            kind=kind,
+            arguments=arguments,
+            required=True if required in REQUIRED_YES else False if required in REQUIRED_NO else None,
+            constraints=cells[constraint_column],
+            default=plain(cells[default_column]),
+            pii=pii or ("PII" in row.raw and bool(PII_MARKER.search(row.raw))),
+            line=row.line,
+            column=row.raw.find(cells[name_column]) + 1,
+        ))
+    return attributes
+
+
+def add_constraints(attributes: list[Attribute], table: Table) -> None:
+    """Add the cells of a | Field | Validation | table to the constraints of the attributes it names."""
+    columns = table_columns(table)
+    if is_attributes_table(columns) or OTHER_TABLE_COLUMNS.intersection(columns):
+        return
+    name_column = next((i for i, column in enumerate(columns) if column in NAME_COLUMNS), None)
+    constraint_column = next((i for i, column in enumerate(columns) if column in CONSTRAINT_COLUMNS), None)
+    if name_column is None or constraint_column is None:
+        return
+    by_name = {attribute.name: attribute for attribute in attributes}
+    for row in table.rows:
+        if max(name_column, constraint_column) >= len(row.cells):
+            continue
+        attribute = by_name.get(plain(row.cells[name_column]))
+        constraint = row.cells[constraint_column].strip()
+        if attribute is not None and plain(constraint) not in ("", "-"):
+            attribute.constraints = ", ".join(filter(None, (attribute.constraints.strip(), constraint)))
+
+
+def parse_relationship_table(name: str, table: Table) -> list[Relation]:
+    """Relations for the rows of a Relationships table (one with a Target column); [] for any other table."""
+    columns = table_columns(table)
+    if "target" not in columns:
+        return []
+    target_column = columns.index("target")
+    via_column = columns.index("relationship") if "relationship" in columns else None
+    type_column = columns.index("type") if "type" in columns else None
+
+    relations = []
+    for row in table.rows:
+        if target_column >= len(row.cells):
+            continue
+        target = plain(row.cells[target_column])
+        via = plain(row.cells[via_column]) if via_column is not None and via_column < len(row.cells) else ""
+        written = plain(row.cells[type_column]) if type_column is not None and type_column < len(row.cells) else ""
+        if target:
+            relations.append(Relation(
+                kind="relationship",
+                source=name,
+                target=target,
+                text=f"relationship '{via}'" if via else f"relationship to '{target}'",
+                line=row.line,
+                column=row.raw.find(row.cells[target_column]) + 1,
+                via=via,
+                cardinality=cardinality(written),
+            ))
+    return relations
+
+
+def cardinality(written: str) -> str:
+    """'1:N', 'N:1', '1:1' or 'N:M' from a Type cell such as 'N:1' or 'One-to-Many'; '' if neither."""
+    match = CARDINALITY.search(written)
+    if match:
+        ends = [end.upper().replace("M", "N") for end in match.groups()]
+        return "N:M" if ends == ["N", "N"] else ":".join(ends)
+    lowered = written.lower()
+    return next((value for words, value in CARDINALITY_WORDS.items() if words in lowered), "")
+
+
+def build_graph(entities: list[Entity], doc: Document) -> EntityGraph:
+    """The relationship graph of the entities, including the document's diagram edges."""
+    graph = EntityGraph(entity.name for entity in entities)
+    for entity in entities:
+        for relation in entity.relations:
+            graph.add(relation)
+
+    for match in DIAGRAM_EDGE.finditer(doc.text):
+        line, column = doc.index.position(match.start(1))
+        text = f"'{match.group(0).strip()}'"
+        graph.add(Relation(kind="diagram", source=match.group(1), target=match.group(3),
+                           text=text, line=line, column=column, cardinality=cardinality(match.group(2))))
+        if match.group(4):
+            # The join entity relates to both ends
+            for end in (match.group(1), match.group(3)):
+                graph.add(Relation(kind="join", source=match.group(4), target=end,
+                                   text=text, line=line, column=column, cardinality="N:1"))
+    return graph
+
+
+def state_name(cell: str) -> str:
+    """A state as written in a table cell, without code marks or brackets."""
+    return cell.strip().strip("`[]'\"").strip()
+
+
+def read_state_table(machine: StateMachine, table: Table) -> None:
+    """Add a From/To transitions table or a States table to machine; other tables are ignored."""
+    columns = table_columns(table)
+    if "from" in columns and "to" in columns:
+        source_column, target_column = columns.index("from"), columns.index("to")
+        for row in table.rows:
+            if max(source_column, target_column) >= len(row.cells):
+                continue
+            targets = [state_name(cell) for cell in row.cells[target_column].split(",") if state_name(cell)]
+            column = row.raw.find(row.cells[source_column]) + 1
+            for written in row.cells[source_column].split(","):
+                source = None if written.strip().lower() in ANY_STATE else state_name(written)
+                if source == "":
+                    continue
+                for target in targets:
+                    machine.transitions.append((source, target, row.line, column))
+    elif "state" in columns:
+        state_column = columns.index("state")
+        for row in table.rows:
+            state = state_name(row.cells[state_column]) if state_column < len(row.cells) else ""
+            if not state:
+                continue
+            machine.rows.setdefault(state, (row.line, row.raw.find(row.cells[state_column]) + 1))
+            # The marks are in the other cells: "Initial state", "Terminal"
+            rest = " ".join(cell for i, cell in enumerate(row.cells) if i != state_column)
+            if INITIAL_MARK.search(rest):
+                machine.initial.add(state)
+            if TERMINAL_MARK.search(rest):
+                machine.terminal.add(state)
+
+
+def table_finder(doc: Document):
+    """A function returning the document's tables that start between two offsets, by bisection."""
+    starts = [table.start for table in doc.tables]
+
+    def tables_between(start: int, end: int) -> list[Table]:
+        return doc.tables[bisect_left(starts, start):bisect_left(starts, end)]
+    return tables_between
+
+
+def collect_state_machines(entities: list[Entity], doc: Document) -> list[StateMachine]:
+    """A StateMachine per entity state field, read from its section and any State Machine section naming it."""
+    machines = {}
+    tables_between = table_finder(doc)
+
+    for entity in entities:
+        if entity.state is None or entity.name.lower() in machines:
+            continue
+        field, values, offset = entity.state
+        machine = StateMachine(
+            entity.name, field, [state_name(value) for value in values.split(",")],
+            *doc.index.position(entity.offset + offset)
+        )
+        default = next((a.default for a in entity.attributes if a.name.lower() == field.lower()), "")
+        if state_name(default) in machine.values:
+            machine.initial.add(state_name(default))
+        machines[entity.name.lower()] = machine
+        for table in tables_between(entity.offset, entity.offset + len(entity.content) + 1):
+            read_state_table(machine, table)
+
+    def named(title):
+        return next((machines[word.lower()] for word in re.findall(r"\w+", title) if word.lower() in machines), None)
+
+    # "## State Machine: Task Status", or "## State Machines" with a subsection per entity
+    for section in doc.sections_at(2):
+        if not section.title.lower().startswith("state machine"):
+            continue
+        _, colon, name = section.title.partition(":")
+        parts = [(name, section)] if colon else [(child.title, child) for child in section.children]
+        for title, part in parts:
+            machine = named(title)
+            if machine is not None:
+                for table in tables_between(part.start, part.end):
+                    read_state_table(machine, table)
+
+    return [machine for machine in machines.values() if machine.transitions]
+
+
+def collect_unique_keys(entities: list[Entity], doc: Document) -> dict[str, list[UniqueKey]]:
+    """Per entity, the columns of each unique key it documents, with where it is written.
+
+    Keys come from Unique / Unique(scope) in attribute Validation cells,
+    Unique rows of a Constraints table (Type and Fields columns) and
+    "- Unique: (a, b)" lines, as in VALIDATION-RULES.md.
+    """
+    tables_between = table_finder(doc)
+    keys = {}
+    for entity in entities:
+        found = keys.setdefault(entity.name, [])
+        for attribute in entity.attributes:
+            match = UNIQUE.search(attribute.constraints)
+            if match:
+                scope = tuple(c.strip() for c in (match.group(1) or "").split(",") if c.strip())
+                found.append((scope + (attribute.name,), attribute.line, attribute.column))
+
+        for table in tables_between(entity.offset, entity.offset + len(entity.content) + 1):
+            columns = table_columns(table)
+            if "type" not in columns or "fields" not in columns:
+                continue
+            type_column, fields_column = columns.index("type"), columns.index("fields")
+            for row in table.rows:
+                if max(type_column, fields_column) < len(row.cells) and \
+                        plain(row.cells[type_column]).lower() == "unique":
+                    fields = tuple(plain(c) for c in row.cells[fields_column].split(",") if plain(c))
+                    if fields:
+                        found.append((fields, row.line, row.raw.find(row.cells[fields_column]) + 1))
+
+        for match in UNIQUE_BULLET.finditer(entity.content):
+            fields = tuple(plain(c) for c in match.group(1).split(",") if plain(c))
+            if fields:
+                found.append((fields, *doc.index.position(entity.offset + match.start(1))))
+    return keys
+
+
+def advise_model(entities: list[Entity], doc: Document, graph: EntityGraph) -> ModelAdvice:
+    """Indexes, N+1 access patterns and size estimates for the plan phase; see indexes and capacity."""
+    advice = advise(entities, graph, collect_unique_keys(entities, doc))
+    advice.capacity = [estimate(entity, advice.indexes) for entity in entities
+                       if entity.attributes and entity.status != "REUSES EXISTING"]
+    return advice
+
+
+def extract_entities_from_summary(doc: Document) -> list[Entity]:
+    """Extract entity names from summary table if present."""
+    entities = []
+
+    for table in doc.tables:
+        rows = [table.header] + table.rows if table.header else table.rows
+        in_summary = False
+        for row in rows:
+            if "| Entity |" in row.raw or "| Entity|" in row.raw:
+                in_summary = True
+                continue
+            if not in_summary:
+                continue
+            match = SUMMARY_ROW.match(row.raw.strip())
+            if match and match.group(1) not in ["Entity", "---", ""]:
+                entities.append(Entity(
+                    name=match.group(1),
+                    status=match.group(2).strip("[]"),
+                    content="",
+                    line=row.line,
+                    offset=row.start
+                ))
+
+    return entities
+
+
+def fail_entity(result: CheckResult, entity: Entity, message: str) -> None:
+    """Record an issue located at the entity header."""
+    result.add(f"{entity.name}: {message}", entity.line, 1)
+
+
+def check_entity_format(entities: list[Entity]) -> CheckResult:
+    """Check that entities follow the expected format."""
+    result = CheckResult("entity_format")
+
+    if not entities:
+        result.add("No entities found in document. Expected '## Entity: Name' format.")
+
+    for entity in entities:
+        if not entity.name:
+            result.add("Found entity section without a name", entity.line, 1)
+        elif not entity.name[0].isupper():
+            fail_entity(result, entity, "Entity name should be PascalCase")
+
+    return result
+
+
+def check_required_attributes(entities: list[Entity]) -> CheckResult:
+    """Check that entities have attributes defined."""
+    result = CheckResult("required_attributes")
+
+    for entity in entities:
+        # Skip check for [REUSES EXISTING] entities
+        if entity.status == "REUSES EXISTING":
+            continue
+
+        if "attributes" not in entity.markers:
+            fail_entity(result, entity, "No attributes table found")
+        elif "attribute_rows" not in entity.markers:
+            fail_entity(result, entity, "Attributes table appears empty")
+
+    return result
+
+
+def check_relationships(entities: list[Entity], doc: Document) -> CheckResult:
+    """Check that relationships are documented."""
+    result = CheckResult("relationships")
+
+    # Check if there's a relationships section globally
+    has_global_relationships = any(
+        section.title.startswith("Relationships") for section in doc.sections_at(2)
+    )
+
+    for entity in entities:
+        # Skip check for [REUSES EXISTING] entities
+        if entity.status == "REUSES EXISTING":
+            continue
+
+        # Relationship keywords or a ### Relationships subsection
+        if "relationships" not in entity.markers and not has_global_relationships:
+            fail_entity(result, entity, "No relationships defined")
+
+    return result
+
+
+def check_state_machines(entities: list[Entity], doc: Document) -> CheckResult:
+    """Check that entities with state/status fields have state machine documentation."""
+    result = CheckResult("state_machines")
+
+    # Check for global state machine section
+    has_state_section = any(
+        section.level >= 2 and re.search(r"State\s+Machine", section.title, re.IGNORECASE)
+        for section in doc.headings
+    )
+
+    for entity in entities:
+        # Entity has a state field, check for state machine docs
+        if entity.state is not None:
+            state_field, states, offset = entity.state
+
+            if "transitions" not in entity.markers and not has_state_section:
+                result.add(
+                    f"{entity.name}.{state_field}: Has state field with values [{states}] but no state transitions documented",
+                    *doc.index.position(entity.offset + offset)
+                )
+
+    return result
+
+
+def check_state_transitions(machines: list[StateMachine]) -> CheckResult:
+    """Check documented state machines for undeclared, unreachable and dead-end states."""
+    result = CheckResult("state_transitions")
+
+    for machine in machines:
+        for message, line, column in machine.problems():
+            result.add(message, line, column)
+
+    return result
+
+
+def check_validation_rules(entities: list[Entity]) -> CheckResult:
+    """Check that validation constraints are documented."""
+    result = CheckResult("validation_rules")
+
+    for entity in entities:
+        # Skip check for [REUSES EXISTING] entities
+        if entity.status == "REUSES EXISTING":
+            continue
+
+        # A table of no attributes fails; no table at all is reported by required_attributes
+        if tabulated(entity) and not any(is_constrained(attribute) for attribute in entity.attributes):
+            fail_entity(result, entity, "No validation constraints documented")
+
+    return result
+
+
+def check_audit_fields(entities: list[Entity]) -> CheckResult:
+    """Check that entities have audit timestamp fields."""
+    result = CheckResult("audit_fields")
+
+    for entity in entities:
+        # Skip check for [REUSES EXISTING] or [EXTENDS EXISTING] entities
+        if entity.status in ["REUSES EXISTING", "EXTENDS EXISTING"]:
+            continue
+
+        if tabulated(entity) and not any(is_audit_field(attribute) for attribute in entity.attributes):
+            fail_entity(result, entity, "Missing audit fields (createdAt/updatedAt)")
+
+    return result
+
+
+def check_id_fields(entities: list[Entity]) -> CheckResult:
+    """Check that entities have an identifier field."""
+    result = CheckResult("id_fields")
+
+    for entity in entities:
+        # Skip check for [REUSES EXISTING] or [EXTENDS EXISTING] entities
+        if entity.status in ["REUSES EXISTING", "EXTENDS EXISTING"]:
+            continue
+
+        if tabulated(entity) and not any(is_identifier(entity, attribute) for attribute in entity.attributes):
+            fail_entity(result, entity, "Missing identifier field (id)")
+
+    return result
+
+
+def check_dangling_references(graph: EntityGraph) -> CheckResult:
+    """Check that every relation points at an entity defined in the model."""
+    result = CheckResult("dangling_references")
+
+    # A diagram edge with a join entity adds several relations at one place
+    reported = set()
+    for relation, name in graph.dangling:
+        if (relation.line, relation.column, name) in reported:
+            continue
+        reported.add((relation.line, relation.column, name))
+        where = f"{relation.source}.{relation.via}" if relation.kind == "reference" else relation.source
+        if relation.kind in ("diagram", "join"):
+            message = f"Diagram edge {relation.text} names undefined entity '{name}'"
+        else:
+            message = f"{where}: {relation.text} points at undefined entity '{name}'"
+        result.add(message, relation.line, relation.column)
+
+    return result
+
+
+def check_required_reference_cycles(graph: EntityGraph) -> CheckResult:
+    """Check that required references do not form a cycle, which would make inserts impossible."""
+    result = CheckResult("required_reference_cycles")
+
+    for cycle in graph.required_cycles():
+        steps = ", ".join(f"{r.source}.{r.via} → {graph.resolve(r.target)}" for r in cycle)
+        result.add(
+            f"Required references form a cycle, so no row can be inserted first: {steps}",
+            cycle[0].line, cycle[0].column
+        )
+
+    return result
+
+
+def check_orphan_entities(entities: list[Entity], graph: EntityGraph) -> CheckResult:
+    """Check that every entity is related to at least one other."""
+    result = CheckResult("orphan_entities")
+
+    # A single entity has nothing to relate to
+    if len(entities) < 2:
+        return result
+
+    orphans = set(graph.orphans())
+    for entity in entities:
+        # Summary-table rows carry no definition; reused entities are context
+        if entity.name in orphans and entity.content.strip() and entity.status != "REUSES EXISTING":
+            fail_entity(result, entity, "Not related to any other entity")
+
+    return result
+
+
+def check_row_size(entities: list[Entity]) -> CheckResult:
+    """Check estimated row widths against page-size thresholds, and unbounded text in large entities."""
+    result = CheckResult("row_size")
+
+    for entity in entities:
+        # Reused entities are stored already; summary-table rows have no attributes
+        if entity.status == "REUSES EXISTING" or not entity.attributes:
+            continue
+        for message, line, column in capacity_problems(entity, estimate(entity, [])):
+            result.add(message, line, column)
+
+    return result
+
+
+def validate_data_model(filepath, listener: Optional[CheckListener] = None, advise: bool = False) -> DataModelResult:
+    """Run all validation checks on a data-model.md file, passing each to listener as it completes.
+
+    With advise, the result also carries index, access-pattern and size advice.
+    """
+    doc = read_document(filepath)
+    entities = extract_entities(doc)
+
+    checks = CheckList(listener)
+    checks.append(check_entity_format(entities))
+    checks.append(check_required_attributes(entities))
+    checks.append(check_relationships(entities, doc))
+    checks.append(check_state_machines(entities, doc))
+    checks.append(check_state_transitions(collect_state_machines(entities, doc)))
+    checks.append(check_validation_rules(entities))
+    checks.append(check_audit_fields(entities))
+    checks.append(check_id_fields(entities))
+
+    graph = build_graph(entities, doc)
+    checks.append(check_dangling_references(graph))
+    checks.append(check_required_reference_cycles(graph))
+    checks.append(check_orphan_entities(entities, graph))
+    checks.append(check_row_size(entities))
+
+    return DataModelResult(file=Path(filepath).name, checks=checks, entities=entities,
+                           advice=advise_model(entities, doc, graph) if advise else None)
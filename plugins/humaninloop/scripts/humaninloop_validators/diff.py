@@ -0,0 +1,570 @@
+"""
+Structural diff of two OpenAPI contracts, classified by client impact.
+
+Every subtree has a digest, and two subtrees with equal digests are
+skipped without being walked, so the diff only descends along what
+changed. The contracts are first compared as parsed, with digests in
+which a $ref hashes as its target: the paths object and each path item
+are hashed Merkle-style from their children's digests, and a path item
+whose digest is unchanged, including everything it refers to, is never
+resolved. Only the path items that differ are resolved (see refs) and
+compared further, over digests of their resolved views. Below the top
+levels a subtree is hashed when its parent differs, serialized by
+marshal in one call rather than node by node, so each byte of the
+contract is serialized about once; a subtree holding a $ref adds the
+digests of its targets. Subtrees marshal cannot serialize (recursive
+schemas, YAML timestamps) are hashed from their children's digests.
+
+What remains is classified:
+- operations: removed is breaking, added is not
+- parameters and request bodies: newly required is breaking
+- schemas: a change that narrows what a request may send, or widens
+  what a response may return, is breaking; the opposite is not. A new
+  required field in a request and a type or enum narrowed in a request
+  are breaking; a field removed from a response is breaking.
+- media types and success responses: removed is breaking
+- security: new or changed requirements are breaking
+
+Documentation-only edits (descriptions, summaries, examples) are not
+reported.
+"""
+
+import hashlib
+import marshal
+import os
+from functools import partial
+from pathlib import Path
+from typing import Any, Optional
+
+from .cache import SpecCache
+from . import openapi
+from .openapi import OPERATION_METHODS
+from .refs import RefError, RefResolver
+from .routes import PARAMETER
+from .results import Change, CheckList, CheckListener, CheckResult, OpenAPIDiffResult
+from .schemas import json_equal
+
+# Request schemas limit what clients send, response schemas what they receive
+REQUEST = 'request'
+RESPONSE = 'response'
+
+# How a schema change affects the values allowed: fewer, more, some of
+# each, or only new fields beside the existing ones
+NARROWS = 'narrows'
+WIDENS = 'widens'
+REPLACES = 'replaces'
+EXTENDS = 'extends'
+
+# Bound keywords: (keyword, a higher value narrows)
+BOUNDS = [
+    ('minimum', True), ('maximum', False),
+    ('minLength', True), ('maxLength', False),
+    ('minItems', True), ('maxItems', False),
+    ('minProperties', True), ('maxProperties', False),
+]
+
+# Levels of a contract hashed from their children's digests (the paths
+# object, each path item); deeper subtrees are hashed whole
+MERKLE_LEVELS = 2
+
+# Scalars a digest can hold as they are
+PLAIN = (str, int, float, bool, type(None))
+
+# A schema without 'type' allows every type
+ANY_TYPE = frozenset({'null', 'boolean', 'integer', 'number', 'string', 'array', 'object'})
+
+
+class Digests:
+    """Digests of the subtrees of one contract, computed on demand.
+
+    The nodes hashed are the contract as parsed, where a reference that
+    resolves hashes as its target, so a digest covers everything the
+    subtree refers to without the contract being resolved. With views,
+    they are the resolver's resolved views instead; those that loop back
+    on themselves are hashed from their children's digests.
+    """
+
+    def __init__(self, resolver: RefResolver, views: bool = False):
+        self.resolver = resolver
+        self.views = views
+        self.digests = {}
+        # Nodes being hashed from their children, by id: depth
+        self.active = {}
+        # Keeps hashed nodes alive so their ids are not reused
+        self.nodes = []
+        self.hashed = 0
+
+    def digest(self, node: Any, levels: int = 0, base: Optional[Path] = None) -> bytes:
+        """The digest of node, read from base, hashed from its children's digests levels deep."""
+        if not self.views:
+            node, base = self.target(node, base or self.resolver.root)
+        key = id(node)
+        found = self.digests.get(key)
+        if found is not None:
+            return found
+        if key in self.active:
+            # A recursive schema reaching itself
+            return b'cycle:%d' % (len(self.active) - self.active[key])
+
+        data = None
+        if not levels and not (self.views and key in self.resolver.recursive):
+            try:
+                data = marshal.dumps(node, 2)
+            except ValueError:
+                pass
+            else:
+                if not self.views and b'$ref' in data:
+                    data += self.targets(node, base)
+        if data is None:
+            data = self.merkle(node, max(levels - 1, 0), base)
+        found = self.digests[key] = hashlib.blake2b(data, digest_size=16).digest()
+        self.nodes.append(node)
+        self.hashed += len(data)
+        return found
+
+    def merkle(self, node: Any, levels: int, base: Optional[Path]) -> bytes:
+        """Serialize node with its containers replaced by their digests."""
+        self.active[id(node)] = len(self.active)
+        try:
+            if type(node) is dict:
+                parts = [(self.value(name, levels, base), self.value(child, levels, base))
+                         for name, child in node.items()]
+            else:
+                parts = [self.value(child, levels, base) for child in node]
+        finally:
+            del self.active[id(node)]
+        return marshal.dumps((type(node) is dict, parts), 2)
+
+    def value(self, child: Any, levels: int, base: Optional[Path]) -> Any:
+        if type(child) is dict or type(child) is list:
+            return self.digest(child, levels, base)
+        return child if isinstance(child, PLAIN) else repr(child)
+
+    def targets(self, node: Any, base: Path) -> bytes:
+        """The digests of what the references below node resolve to, in document order."""
+        self.active[id(node)] = len(self.active)
+        try:
+            found = []
+            stack = [node]
+            while stack:
+                item = stack.pop()
+                if type(item) is dict:
+                    target, target_base = self.target(item, base)
+                    if target is not item:
+                        found.append(self.value(target, 0, target_base))
+                        continue
+                    children = item.values()
+                else:
+                    children = item
+                stack.extend(reversed([child for child in children if type(child) is dict or type(child) is list]))
+        finally:
+            del self.active[id(node)]
+        return marshal.dumps(found, 2)
+
+    def target(self, node: Any, base: Path) -> tuple[Any, Path]:
+        """node, or its target if it is a reference that resolves."""
+        try:
+            return self.resolver.follow(node, base)
+        except RefError:
+            return node, base
+
+
+def schema_types(schema: dict) -> frozenset:
+    """The JSON types a schema allows, with 'integer' implied by 'number'."""
+    types = schema.get('type')
+    if isinstance(types, str):
+        types = [types]
+    if not isinstance(types, list) or not types:
+        return ANY_TYPE
+    allowed = {t for t in types if isinstance(t, str)}
+    if schema.get('nullable') is True:
+        allowed.add('null')
+    if 'number' in allowed:
+        allowed.add('integer')
+    return frozenset(allowed)
+
+
+def describe_types(types: frozenset) -> str:
+    if types == ANY_TYPE:
+        return 'any type'
+    shown = sorted(types - {'integer'} if 'number' in types else types)
+    return ' or '.join(shown)
+
+
+def parameters(item: dict, operation: dict, renames: Optional[dict] = None) -> dict:
+    """(in, name) -> parameter, for the path item's parameters overridden by the operation's.
+
+    renames maps old path parameter names to new ones.
+    """
+    renames = renames or {}
+    found = {}
+    for owner in (item, operation):
+        declared = owner.get('parameters')
+        if isinstance(declared, list):
+            for parameter in declared:
+                if isinstance(parameter, dict) and isinstance(parameter.get('name'), str):
+                    name = parameter['name']
+                    if parameter.get('in') == 'path':
+                        name = renames.get(name, name)
+                    found[(parameter.get('in'), name)] = parameter
+    return found
+
+
+def route_shape(path: str) -> str:
+    """path with its parameter names left out."""
+    return PARAMETER.sub('{}', path)
+
+
+def mapping(node: Any, key: str) -> dict:
+    value = node.get(key) if isinstance(node, dict) else None
+    return value if isinstance(value, dict) else {}
+
+
+class ContractDiff:
+    """The changes from one contract to another, each given by its resolver.
+
+    Only the path items that differ are resolved.
+    """
+
+    def __init__(self, old: RefResolver, new: RefResolver):
+        self.old_spec = old.document(old.root)
+        self.new_spec = new.document(new.root)
+        # Digests of the contracts as parsed, and of resolved views
+        self.old_source = Digests(old)
+        self.new_source = Digests(new)
+        self.old = Digests(old, views=True)
+        self.new = Digests(new, views=True)
+        self.old_view = partial(old.resolve, base=old.root)
+        self.new_view = partial(new.resolve, base=new.root)
+        # (old schema id, new schema id, direction) -> changes relative to the schema
+        self.schemas = {}
+        self.found = []
+        self.security_changed = False
+
+    def same(self, old: Any, new: Any) -> bool:
+        if type(old) is not type(new):
+            return False
+        if type(old) is dict or type(old) is list:
+            return self.old.digest(old) == self.new.digest(new)
+        return json_equal(old, new)
+
+    def same_source(self, old: Any, new: Any, levels: int = 0) -> bool:
+        """Like same(), for nodes of the contracts as parsed."""
+        if type(old) is not type(new):
+            return False
+        if type(old) is dict or type(old) is list:
+            return self.old_source.digest(old, levels) == self.new_source.digest(new, levels)
+        return json_equal(old, new)
+
+    def changes(self) -> list[Change]:
+        # Operations without security of their own inherit the document's
+        self.security_changed = not self.same_source(self.old_spec.get('security'), self.new_spec.get('security'))
+        self.compare_paths(mapping(self.old_spec, 'paths'), mapping(self.new_spec, 'paths'))
+        return self.found
+
+    def add(self, location: str, message: str, breaking: bool) -> None:
+        self.found.append(Change(location, message, breaking))
+
+    def compare_paths(self, old: dict, new: dict) -> None:
+        """Compare the paths objects as parsed, resolving only the path items that differ."""
+        if not self.security_changed and self.same_source(old, new, MERKLE_LEVELS):
+            return
+        removed, added = [], []
+        for path, old_item in old.items():
+            new_item = new.get(path)
+            if new_item is None:
+                removed.append(path)
+            elif self.security_changed or not self.same_source(old_item, new_item):
+                self.compare_path_item(path, self.old_view(old_item), self.new_view(new_item))
+        added = [path for path in new if path not in old]
+
+        # A renamed path parameter ("/users/{id}" to "/users/{userId}") is the same route
+        shapes = {route_shape(path): path for path in added}
+        for path in removed:
+            renamed = shapes.pop(route_shape(path), None)
+            if renamed is not None:
+                renames = dict(zip((p[1:-1] for p in PARAMETER.findall(path)),
+                                   (p[1:-1] for p in PARAMETER.findall(renamed))))
+                self.compare_path_item(renamed, self.old_view(old[path]), self.new_view(new[renamed]), renames, path)
+            else:
+                for method in self.methods(self.old_view(old[path])):
+                    self.add(f"{method.upper()} {path}", 'operation removed', True)
+        for path in shapes.values():
+            for method in self.methods(self.new_view(new[path])):
+                self.add(f"{method.upper()} {path}", 'operation added', False)
+
+    @staticmethod
+    def methods(item: Any) -> list[str]:
+        if not isinstance(item, dict):
+            return []
+        return [method for method in item if method in OPERATION_METHODS]
+
+    def compare_path_item(self, path: str, old_item: Any, new_item: Any,
+                          renames: Optional[dict] = None, old_path: Optional[str] = None) -> None:
+        """Compare the operations of a route; renames and old_path are set if its parameters were renamed."""
+        old_item = old_item if isinstance(old_item, dict) else {}
+        new_item = new_item if isinstance(new_item, dict) else {}
+        for method in self.methods(old_item):
+            where = f"{method.upper()} {path}"
+            if method not in new_item:
+                self.add(f"{method.upper()} {old_path or path}", 'operation removed', True)
+                continue
+            old_operation, new_operation = old_item[method], new_item[method]
+            if not isinstance(old_operation, dict) or not isinstance(new_operation, dict):
+                continue
+            # Path-level parameters apply to every operation
+            if not renames and self.same(old_operation, new_operation) and \
+                    self.same(old_item.get('parameters'), new_item.get('parameters')) and \
+                    ('security' in old_operation or not self.security_changed):
+                continue
+            self.compare_operation(where, parameters(old_item, old_operation, renames), old_operation,
+                                   parameters(new_item, new_operation), new_operation)
+        for method in self.methods(new_item):
+            if method not in old_item:
+                self.add(f"{method.upper()} {path}", 'operation added', False)
+
+    def compare_operation(self, where: str, old_parameters: dict, old: dict, new_parameters: dict, new: dict) -> None:
+        if new.get('deprecated') is True and old.get('deprecated') is not True:
+            self.add(where, 'operation deprecated', False)
+
+        self.compare_parameters(where, old_parameters, new_parameters)
+        self.compare_request_body(where, old.get('requestBody'), new.get('requestBody'))
+        self.compare_responses(where, mapping(old, 'responses'), mapping(new, 'responses'))
+
+        old_security = old.get('security', self.old_view(self.old_spec.get('security')))
+        new_security = new.get('security', self.new_view(self.new_spec.get('security')))
+        if not self.same(old_security, new_security):
+            if new_security:
+                self.add(where, 'security requirements changed', True)
+            else:
+                self.add(where, 'security requirements removed', False)
+
+    def compare_parameters(self, where: str, old: dict, new: dict) -> None:
+        for key, old_parameter in old.items():
+            name = f"{key[0]} parameter '{key[1]}'"
+            new_parameter = new.get(key)
+            if new_parameter is None:
+                self.add(where, f"{name} removed", False)
+            elif not self.same(old_parameter, new_parameter):
+                if new_parameter.get('required') is True and old_parameter.get('required') is not True:
+                    self.add(where, f"{name} is now required", True)
+                elif old_parameter.get('required') is True and new_parameter.get('required') is not True:
+                    self.add(where, f"{name} is no longer required", False)
+                self.compare_schema(f"{where} {name}", old_parameter.get('schema'),
+                                    new_parameter.get('schema'), REQUEST)
+        for key, new_parameter in new.items():
+            if key not in old:
+                name = f"{key[0]} parameter '{key[1]}'"
+                if new_parameter.get('required') is True:
+                    self.add(where, f"new required {name}", True)
+                else:
+                    self.add(where, f"{name} added", False)
+
+    def compare_request_body(self, where: str, old: Any, new: Any) -> None:
+        if self.same(old, new):
+            return
+        old = old if isinstance(old, dict) else None
+        new = new if isinstance(new, dict) else None
+        if old is None:
+            if new is not None:
+                self.add(where, 'request body added', new.get('required') is True)
+            return
+        if new is None:
+            self.add(where, 'request body removed', False)
+            return
+        if new.get('required') is True and old.get('required') is not True:
+            self.add(where, 'request body is now required', True)
+        self.compare_content(f"{where} request body", mapping(old, 'content'), mapping(new, 'content'), REQUEST)
+
+    def compare_responses(self, where: str, old: dict, new: dict) -> None:
+        if self.same(old, new):
+            return
+        for code, old_response in old.items():
+            name = f"response {code}"
+            new_response = new.get(code)
+            if new_response is None:
+                self.add(where, f"{name} removed", str(code).startswith('2'))
+            elif not self.same(old_response, new_response):
+                self.compare_content(f"{where} {name}", mapping(old_response, 'content'),
+                                     mapping(new_response, 'content'), RESPONSE)
+        for code in new:
+            if code not in old:
+                self.add(where, f"response {code} added", False)
+
+    def compare_content(self, where: str, old: dict, new: dict, direction: str) -> None:
+        if self.same(old, new):
+            return
+        for media, old_media in old.items():
+            new_media = new.get(media)
+            if new_media is None:
+                self.add(where, f"media type {media} removed", True)
+            else:
+                self.compare_schema(f"{where} {media}", mapping(old_media, 'schema') or None,
+                                    mapping(new_media, 'schema') or None, direction)
+        for media in new:
+            if media not in old:
+                self.add(where, f"media type {media} added", False)
+
+    def compare_schema(self, where: str, old: Any, new: Any, direction: str) -> None:
+        if old is None and new is None:
+            return
+        # Narrowing breaks senders, widening breaks receivers
+        breaks = NARROWS if direction == REQUEST else WIDENS
+        for at, message, effect in self.schema_changes(old, new, direction):
+            self.add(f"{where} {at}", message, effect == breaks or effect == REPLACES)
+
+    def schema_changes(self, old: Any, new: Any, direction: str) -> list[tuple[str, str, str]]:
+        """(location, message, effect) per change from old to new, memoized per schema pair."""
+        if self.same(old, new):
+            return []
+        key = (id(old), id(new), direction)
+        if key in self.schemas:
+            # None while the pair is being compared: a recursive schema
+            return self.schemas[key] or []
+        self.schemas[key] = None
+        changes = []
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            changes.append(('$', 'schema replaced', REPLACES))
+        else:
+            self.compare_keywords(old, new, direction, changes)
+        self.schemas[key] = changes
+        return changes
+
+    def compare_keywords(self, old: dict, new: dict, direction: str, changes: list) -> None:
+        def nested(at: str, old_schema: Any, new_schema: Any) -> None:
+            for location, message, effect in self.schema_changes(old_schema, new_schema, direction):
+                changes.append((at + location[1:], message, effect))
+
+        old_types, new_types = schema_types(old), schema_types(new)
+        if old_types != new_types:
+            message = f"type changed from {describe_types(old_types)} to {describe_types(new_types)}"
+            if old_types > new_types:
+                changes.append(('$', message, NARROWS))
+            elif old_types < new_types:
+                changes.append(('$', message, WIDENS))
+            else:
+                changes.append(('$', message, REPLACES))
+
+        self.compare_enum(old.get('enum'), new.get('enum'), changes)
+
+        for keyword, higher_narrows in BOUNDS:
+            old_bound, new_bound = old.get(keyword), new.get(keyword)
+            if old_bound == new_bound:
+                continue
+            if old_bound is None:
+                changes.append(('$', f"{keyword} {new_bound} added", NARROWS))
+            elif new_bound is None:
+                changes.append(('$', f"{keyword} {old_bound} removed", WIDENS))
+            else:
+                raised = new_bound > old_bound
+                verb = 'raised' if raised else 'lowered'
+                changes.append(('$', f"{keyword} {verb} from {old_bound} to {new_bound}",
+                                NARROWS if raised == higher_narrows else WIDENS))
+
+        for keyword in ('pattern', 'format'):
+            old_value, new_value = old.get(keyword), new.get(keyword)
+            if old_value != new_value:
+                if new_value is None:
+                    changes.append(('$', f"{keyword} '{old_value}' removed", WIDENS))
+                elif old_value is None:
+                    changes.append(('$', f"{keyword} '{new_value}' added", NARROWS))
+                else:
+                    changes.append(('$', f"{keyword} changed from '{old_value}' to '{new_value}'", REPLACES))
+
+        old_required, new_required = self.required(old), self.required(new)
+        for name in new_required - old_required:
+            changes.append(('$', f"new required field '{name}'", NARROWS))
+        for name in old_required - new_required:
+            changes.append(('$', f"field '{name}' is no longer required", WIDENS))
+
+        old_properties, new_properties = mapping(old, 'properties'), mapping(new, 'properties')
+        for name, old_property in old_properties.items():
+            if name not in new_properties:
+                changes.append((f"$.{name}", 'property removed', WIDENS))
+            else:
+                nested(f"$.{name}", old_property, new_properties[name])
+        for name in new_properties:
+            if name not in old_properties:
+                changes.append((f"$.{name}", 'property added', EXTENDS))
+
+        old_extra, new_extra = old.get('additionalProperties', True), new.get('additionalProperties', True)
+        if old_extra is not False and new_extra is False:
+            changes.append(('$', 'additional properties no longer allowed', NARROWS))
+        elif old_extra is False and new_extra is not False:
+            changes.append(('$', 'additional properties now allowed', WIDENS))
+        elif isinstance(old_extra, dict) and isinstance(new_extra, dict):
+            nested('$.*', old_extra, new_extra)
+
+        if 'items' in old and 'items' in new:
+            nested('$[]', old['items'], new['items'])
+
+        for keyword in ('allOf', 'anyOf', 'oneOf'):
+            old_list, new_list = old.get(keyword), new.get(keyword)
+            old_list = old_list if isinstance(old_list, list) else []
+            new_list = new_list if isinstance(new_list, list) else []
+            for index, (old_schema, new_schema) in enumerate(zip(old_list, new_list)):
+                nested(f"$.{keyword}[{index}]", old_schema, new_schema)
+            # More allOf members allow less; more anyOf/oneOf members allow more
+            added = NARROWS if keyword == 'allOf' else WIDENS
+            if len(new_list) > len(old_list):
+                changes.append(('$', f"{keyword} member added", added))
+            elif len(new_list) < len(old_list):
+                changes.append(('$', f"{keyword} member removed", WIDENS if added == NARROWS else NARROWS))
+
+    @staticmethod
+    def compare_enum(old: Any, new: Any, changes: list) -> None:
+        old = old if isinstance(old, list) else None
+        new = new if isinstance(new, list) else None
+        if old is None and new is None:
+            return
+        if old is None:
+            changes.append(('$', 'enum added', NARROWS))
+            return
+        if new is None:
+            changes.append(('$', 'enum removed', WIDENS))
+            return
+        removed = [value for value in old if not any(json_equal(value, other) for other in new)]
+        added = [value for value in new if not any(json_equal(value, other) for other in old)]
+        if removed:
+            changes.append(('$', f"enum values removed: {', '.join(repr(v) for v in removed)}", NARROWS))
+        if added:
+            changes.append(('$', f"enum values added: {', '.join(repr(v) for v in added)}", WIDENS))
+
+    @staticmethod
+    def required(schema: dict) -> set:
+        names = schema.get('required')
+        return {name for name in names if isinstance(name, str)} if isinstance(names, list) else set()
+
+
+def diff_openapi(old_path, new_path, listener: Optional[CheckListener] = None,
+                 spec_cache: Optional[SpecCache] = None) -> OpenAPIDiffResult:
+    """Compare two OpenAPI spec files, passing the breaking_changes check to listener.
+
+    The check fails if any change is breaking. $refs are followed, so a
+    change in a shared schema is reported at every operation that uses
+    it, but only the path items that changed are resolved.
+    """
+    # Looked up on the module, where the validator server installs its warm cache
+    def load(path):
+        return openapi.load_spec(path, spec_cache)
+
+    resolvers = [RefResolver(path, load(path), load) for path in (old_path, new_path)]
+    changes = ContractDiff(*resolvers).changes()
+
+    check = CheckResult('breaking_changes', located=False)
+    for change in changes:
+        if change.breaking:
+            check.add(f"{change.location}: {change.message}")
+    checks = CheckList(listener)
+    checks.append(check)
+
+    referenced = []
+    for path, resolver in zip((old_path, new_path), resolvers):
+        referenced += [os.path.normpath(Path(path).parent / resolver.name(file)) for file in resolver.files]
+    return OpenAPIDiffResult(
+        checks=checks,
+        old_file=str(old_path),
+        new_file=str(new_path),
+        changes=changes,
+        referenced_files=sorted(set(referenced)),
+    )
@@ -0,0 +1,133 @@
+"""
+Relationship graph for data-model analysis.
+
+Entities are the nodes; every Relation an entity declares, and every
+edge of the document's relationship diagrams, is an edge. Targets are
+resolved by name, case-insensitively and allowing a plural ("has many
+Tags" points at Tag). The graph keeps, per entity, the list of its
+outgoing relations and the number of incoming ones, so each analysis is
+a single pass over entities plus edges:
+- dangling: relations whose source or target names no entity
+- required cycles: strongly connected groups of entities linked by
+  required references, found with Tarjan's algorithm; no row of any of
+  them can be inserted first
+- orphans: entities with no relation in or out
+"""
+
+from typing import Iterable, Optional
+
+from .results import Relation
+
+
+class EntityGraph:
+    """Adjacency-indexed graph of entity relations."""
+
+    def __init__(self, names: Iterable[str]):
+        # Lower-cased name -> entity name; the first definition wins
+        self.names = {}
+        for name in names:
+            self.names.setdefault(name.lower(), name)
+        self.outgoing = {name: [] for name in self.names.values()}
+        self.incoming = dict.fromkeys(self.names.values(), 0)
+        # Required references between resolved entities: (relation, target)
+        self.required = {name: [] for name in self.names.values()}
+        # (relation, the name that did not resolve)
+        self.dangling = []
+
+    def resolve(self, name: str) -> Optional[str]:
+        """The entity a written name refers to, or None."""
+        lowered = name.lower()
+        found = self.names.get(lowered)
+        if found is None and lowered.endswith("s"):
+            if lowered.endswith("ies"):
+                found = self.names.get(lowered[:-3] + "y")
+            found = found or self.names.get(lowered[:-1])
+            if found is None and lowered.endswith("es"):
+                found = self.names.get(lowered[:-2])
+        return found
+
+    def add(self, relation: Relation) -> None:
+        """Add an edge, or record it as dangling if an end names no entity."""
+        source = self.resolve(relation.source)
+        target = self.resolve(relation.target)
+        if source is None:
+            self.dangling.append((relation, relation.source))
+        if target is None:
+            self.dangling.append((relation, relation.target))
+        if source is not None:
+            self.outgoing[source].append(relation)
+            if target is not None:
+                self.incoming[target] += 1
+                if relation.required:
+                    self.required[source].append((relation, target))
+        elif target is not None:
+            # Still relates the target to something
+            self.incoming[target] += 1
+
+    def orphans(self) -> list[str]:
+        """Entities that no relation starts or ends at."""
+        return [name for name in self.outgoing if not self.outgoing[name] and not self.incoming[name]]
+
+    def required_cycles(self) -> list[list[Relation]]:
+        """One cycle of required references per strongly connected group that has one."""
+        required = self.required
+        # Iterative Tarjan: index and lowlink per entity, explicit DFS stack
+        index, lowlink = {}, {}
+        stack, on_stack = [], set()
+        groups = []
+        for root in self.outgoing:
+            if root in index:
+                continue
+            work = [(root, iter(required[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                name, edges = work[-1]
+                for _, target in edges:
+                    if target not in index:
+                        index[target] = lowlink[target] = len(index)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(required[target])))
+                        break
+                    if target in on_stack:
+                        lowlink[name] = min(lowlink[name], index[target])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[name])
+                    if lowlink[name] == index[name]:
+                        group = set()
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            group.add(member)
+                            if member == name:
+                                break
+                        groups.append((name, group))
+
+        cycles = []
+        for name, group in groups:
+            cycle = self.cycle_in(name, group)
+            if cycle:
+                cycles.append(cycle)
+        # Report in document order of the entities involved
+        order = {name: position for position, name in enumerate(self.outgoing)}
+        cycles.sort(key=lambda cycle: min(order[self.resolve(r.source)] for r in cycle))
+        return cycles
+
+    def cycle_in(self, start: str, group: set[str]) -> list[Relation]:
+        """A cycle of required references within a strongly connected group; [] if it has none."""
+        path, seen = [], {}
+        name = start
+        while name not in seen:
+            seen[name] = len(path)
+            step = next(((relation, target) for relation, target in self.required[name] if target in group), None)
+            if step is None:
+                # A single entity without a reference to itself
+                return []
+            path.append(step[0])
+            name = step[1]
+        return path[seen[name]:]
@@ -0,0 +1,231 @@
+"""
+Index and access-path advice for a data model.
+
+Derives the indexes a model's access paths need from its Entity records
+and relationship graph:
+- a foreign key index per Reference attribute
+- a unique index per Unique attribute, Unique(scope) and unique
+  constraint
+- (status, timestamp) for entities with a state field, serving the
+  usual "items in this state, newest first" listing
+- a composite key over the two references of an N:M join entity
+An index whose columns lead a longer one on the same entity is dropped
+in favour of it, and its reasons carry over. Primary keys (id) are
+assumed to be indexed already, and entities the feature reuses
+unchanged get no advice.
+
+Has-many relations (a reference from B to A means A has many B, unless
+the reference is unique) form a second graph. A has-many relation out
+of an entity that is itself reached through one makes a chain: loading
+the parents, then each parent's children, then each child's children,
+issues one query per row. One breadth-first pass finds every such
+relation and reports it once, with the parent that reaches it.
+"""
+
+import re
+from collections import deque
+from typing import Optional
+
+from .entity_graph import EntityGraph
+from .results import AccessPattern, Entity, IndexRecommendation, ModelAdvice, Relation
+
+# Columns every entity's primary key already indexes
+PRIMARY_KEYS = {"id"}
+
+# Attribute type kinds that hold a point in time
+TIMESTAMP_KINDS = {"timestamp", "datetime", "date"}
+
+# Preferred timestamp for a (status, timestamp) listing, by lower-cased name
+CREATION_NAMES = ("createdat", "created_at", "creationtime", "created")
+
+# (columns, line, column) of a unique key
+UniqueKey = tuple[tuple[str, ...], int, int]
+
+
+def snake(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name).lower()
+
+
+class IndexAdvisor:
+    """Collects index recommendations, merging those on the same columns."""
+
+    def __init__(self):
+        # (entity, columns) -> [unique, reasons, line, column], in insertion order
+        self.found = {}
+
+    def add(self, entity: str, columns: tuple[str, ...], reason: str, line: int, column: int,
+            unique: bool = False) -> None:
+        if not columns or (len(columns) == 1 and columns[0].lower() in PRIMARY_KEYS):
+            return
+        entry = self.found.get((entity, columns))
+        if entry is None:
+            self.found[(entity, columns)] = [unique, [reason], line, column]
+        else:
+            entry[0] = entry[0] or unique
+            if reason not in entry[1]:
+                entry[1].append(reason)
+
+    def indexes(self) -> list[IndexRecommendation]:
+        """The recommendations, without non-unique indexes that lead a longer one."""
+        # Leading columns -> the longest index on them
+        longest = {}
+        for entity, columns in self.found:
+            for size in range(1, len(columns)):
+                key = (entity, columns[:size])
+                if len(longest.get(key, ())) < len(columns):
+                    longest[key] = columns
+
+        merged = {}
+        for (entity, columns), (unique, reasons, line, column) in self.found.items():
+            wider = longest.get((entity, columns))
+            if wider is not None and not unique:
+                merged.setdefault((entity, wider), []).extend(reasons)
+                continue
+            merged.setdefault((entity, columns), [])
+
+        recommendations = []
+        for (entity, columns), (unique, reasons, line, column) in self.found.items():
+            if (entity, columns) not in merged:
+                continue
+            reasons = reasons + [r for r in merged[(entity, columns)] if r not in reasons]
+            name = f"{'uk' if unique else 'ix'}_{snake(entity)}_{'_'.join(snake(c) for c in columns)}"
+            recommendations.append(IndexRecommendation(
+                name=name, entity=entity, columns=columns, unique=unique, reasons=tuple(reasons),
+                line=line, column=column
+            ))
+        return recommendations
+
+
+def is_join(entity: Entity, graph: EntityGraph, references: list[Relation], keys: list[UniqueKey]) -> bool:
+    """Whether the entity joins two others N:M."""
+    if len({graph.resolve(r.target) for r in references}) < 2:
+        return False
+    if any(relation.kind == "join" for relation in graph.outgoing.get(entity.name, [])):
+        return True
+    if "join entity" in entity.content.lower():
+        return True
+    # A unique key over two of its references
+    referenced = {r.via for r in references}
+    return any(len(referenced.intersection(columns)) >= 2 for columns, _, _ in keys)
+
+
+def timestamp_for(entity: Entity) -> Optional[str]:
+    """The timestamp a listing of the entity sorts by: its creation time, else its first timestamp."""
+    stamps = [a.name for a in entity.attributes if a.kind.lower() in TIMESTAMP_KINDS]
+    return next((name for name in stamps if name.lower() in CREATION_NAMES), stamps[0] if stamps else None)
+
+
+def advise(entities: list[Entity], graph: EntityGraph, unique_keys: dict[str, list[UniqueKey]]) -> ModelAdvice:
+    """Index recommendations and N+1 access patterns for the model."""
+    advisor = IndexAdvisor()
+    # (entity, reference attribute) pairs unique on their own: 1:1, not has-many
+    one_to_one = set()
+
+    for entity in entities:
+        keys = unique_keys.get(entity.name, [])
+        for columns, _, _ in keys:
+            if len(columns) == 1:
+                one_to_one.add((entity.name, columns[0]))
+        if entity.status == "REUSES EXISTING":
+            continue
+
+        references = [r for r in entity.relations if r.kind == "reference" and graph.resolve(r.target)]
+        if is_join(entity, graph, references, keys):
+            first = references[0]
+            second = next(r for r in references if graph.resolve(r.target) != graph.resolve(first.target))
+            advisor.add(entity.name, (first.via, second.via),
+                        f"N:M join of {graph.resolve(first.target)} and {graph.resolve(second.target)}",
+                        first.line, first.column, unique=True)
+
+        for columns, line, column in keys:
+            advisor.add(entity.name, columns, "unique constraint", line, column, unique=True)
+
+        for relation in references:
+            advisor.add(entity.name, (relation.via,), f"foreign key to {graph.resolve(relation.target)}",
+                        relation.line, relation.column)
+
+        if entity.state is not None:
+            stamp = timestamp_for(entity)
+            field = entity.state[0]
+            attribute = next((a for a in entity.attributes if a.name.lower() == field.lower()), None)
+            if stamp is not None and attribute is not None:
+                advisor.add(entity.name, (attribute.name, stamp), f"listing by {attribute.name}, newest first",
+                            attribute.line, attribute.column)
+
+    return ModelAdvice(indexes=advisor.indexes(), access_patterns=n_plus_one(entities, graph, one_to_one))
+
+
+def has_many(relation: Relation, source: str, target: str, one_to_one: set) -> Optional[tuple[str, str]]:
+    """(parent, child) if the relation makes one entity have many of another."""
+    if relation.cardinality == "1:N":
+        return source, target
+    if relation.cardinality == "N:1" and (source, relation.via) not in one_to_one:
+        return target, source
+    return None
+
+
+def n_plus_one(entities: list[Entity], graph: EntityGraph, one_to_one: set) -> list[AccessPattern]:
+    """Has-many relations reached through another has-many relation."""
+    children = {name: {} for name in graph.outgoing}
+    has_parent = set()
+    for name, relations in graph.outgoing.items():
+        for relation in relations:
+            target = graph.resolve(relation.target)
+            pair = has_many(relation, name, target, one_to_one) if target is not None else None
+            if pair is not None:
+                parent, child = pair
+                # The first relation written for a pair describes it
+                if child not in children[parent]:
+                    children[parent][child] = relation
+                    if child != parent:
+                        has_parent.add(child)
+
+    # Breadth-first from the entities nothing has many of, then from any left in cycles
+    parent_of = {}
+    patterns = []
+    order = [name for name in graph.outgoing if name not in has_parent] + list(graph.outgoing)
+    for root in order:
+        if root in parent_of:
+            continue
+        parent_of[root] = None
+        queue = deque([root])
+        while queue:
+            name = queue.popleft()
+            for child, relation in children[name].items():
+                if child == name:
+                    patterns.append(AccessPattern(
+                        path=(name, name),
+                        relations=(describe(relation, name, child),),
+                        message=(f"{name} has many {name}: walking the hierarchy row by row issues a query "
+                                 f"per level; load it with a recursive query or a stored path"),
+                        line=relation.line, column=relation.column,
+                    ))
+                    continue
+                parent = parent_of[name]
+                if parent is not None:
+                    via = children[parent][name]
+                    patterns.append(AccessPattern(
+                        path=(parent, name, child),
+                        relations=(describe(via, parent, name), describe(relation, name, child)),
+                        message=(f"{parent} → {name} → {child}: loading each {name}'s {child} rows separately "
+                                 f"issues one query per {name} (N+1); load them in one query by "
+                                 f"{reference_column(relation, name, child)} or a join"),
+                        line=relation.line, column=relation.column,
+                    ))
+                if child not in parent_of:
+                    parent_of[child] = name
+                    queue.append(child)
+    return patterns
+
+
+def describe(relation: Relation, parent: str, child: str) -> str:
+    """A has-many relation by its foreign key if it has one: 'Task.projectId'."""
+    if relation.kind == "reference":
+        return f"{child}.{relation.via}"
+    return f"{parent} has many {child}"
+
+
+def reference_column(relation: Relation, parent: str, child: str) -> str:
+    if relation.kind == "reference":
+        return f"{child}.{relation.via}"
+    return f"their {parent} reference"
@@ -0,0 +1,66 @@
+"""
+Line-offset index for mapping character offsets to line/column positions.
+
+The index records the start offset of every line once per document, so
+any match offset resolves to a 1-based line and column with a binary
+search instead of re-counting newlines in the content prefix.
+"""
+
+from bisect import bisect_right
+
+
+class LineIndex:
+    """Start offsets of every line in a document."""
+
+    __slots__ = ('_starts', '_length')
+
+    def __init__(self, content: str):
+        starts = [0]
+        find = content.find
+        pos = find('\n')
+        while pos != -1:
+            starts.append(pos + 1)
+            pos = find('\n', pos + 1)
+        self._starts = starts
+        self._length = len(content)
+
+    @classmethod
+    def from_starts(cls, starts: list[int], length: int) -> 'LineIndex':
+        """Build an index from line start offsets a caller already collected."""
+        index = cls.__new__(cls)
+        index._starts = starts
+        index._length = length
+        return index
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in the document."""
+        return len(self._starts)
+
+    def line(self, offset: int) -> int:
+        """Return the 1-based line number containing offset."""
+        return bisect_right(self._starts, offset)
+
+    def column(self, offset: int) -> int:
+        """Return the 1-based column of offset within its line."""
+        return offset - self._starts[bisect_right(self._starts, offset) - 1] + 1
+
+    def position(self, offset: int) -> tuple[int, int]:
+        """Return (line, column) for offset, both 1-based."""
+        line = bisect_right(self._starts, offset)
+        return line, offset - self._starts[line - 1] + 1
+
+    def location(self, offset: int) -> dict:
+        """Return {'line': ..., 'column': ...} for offset."""
+        line, column = self.position(offset)
+        return {'line': line, 'column': column}
+
+    def line_start(self, line: int) -> int:
+        """Return the offset of the first character on a 1-based line."""
+        return self._starts[line - 1]
+
+    def line_end(self, line: int) -> int:
+        """Return the offset just past the last character on a line (excluding newline)."""
+        if line < len(self._starts):
+            return self._starts[line] - 1
+        return self._length
@@ -0,0 +1,296 @@
+"""
+Shared Markdown document model for the validators.
+
+A Document is built in one pass over an artifact and records:
+- the section tree (ATX headings with levels, line numbers and offsets)
+- tables, split into header and rows of cells
+- lists, grouped into blocks of items
+
+Headings, tables and lists inside fenced code blocks are ignored.
+Offsets are character offsets into Document.text, the same coordinates
+LineIndex uses. load_document() caches parsed documents by content hash,
+so several validators looking at the same file share one parse.
+"""
+
+import hashlib
+import re
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .lines import LineIndex
+
+
+# Parsed documents kept per content hash
+DOCUMENT_CACHE_SIZE = 32
+
+HEADING = re.compile(r'^ {0,3}(#{1,6})(?:[ \t]+(.*?))?(?:[ \t]+#+)?[ \t]*$')
+FENCE = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+LIST_ITEM = re.compile(r'^([ \t]*)([-*+]|\d+[.)])[ \t]+(.*)$')
+TABLE_DELIMITER = re.compile(r'^\|?[ \t]*:?-+:?[ \t]*(\|[ \t]*:?-+:?[ \t]*)*\|?$')
+
+
+@dataclass(slots=True, eq=False)
+class Section:
+    """A heading and everything up to the next heading of the same or higher level.
+
+    start is the offset of the heading line, body_start the offset of the
+    line after it, and end the offset where the section stops. The root
+    section has level 0 and spans the whole document.
+    """
+    title: str
+    level: int
+    line: int
+    start: int
+    body_start: int
+    end: int = 0
+    children: list['Section'] = field(default_factory=list, repr=False)
+    parent: Optional['Section'] = field(default=None, repr=False)
+
+    def walk(self) -> Iterator['Section']:
+        """Yield this section's descendants in document order."""
+        for child in self.children:
+            yield child
+            yield from child.walk()
+
+
+@dataclass(slots=True)
+class TableRow:
+    cells: list[str]
+    line: int
+    start: int
+    raw: str
+
+
+@dataclass(slots=True)
+class Table:
+    """Consecutive '|' lines; header is set when a delimiter row follows it."""
+    line: int
+    start: int
+    end: int
+    header: Optional[TableRow]
+    rows: list[TableRow]
+
+    @property
+    def columns(self) -> list[str]:
+        return self.header.cells if self.header else []
+
+
+@dataclass(slots=True)
+class ListItem:
+    marker: str
+    text: str
+    indent: int
+    line: int
+    start: int
+
+    @property
+    def ordered(self) -> bool:
+        return self.marker[0].isdigit()
+
+
+@dataclass(slots=True)
+class ListBlock:
+    line: int
+    start: int
+    end: int
+    items: list[ListItem]
+
+
+@dataclass(slots=True, eq=False)
+class Document:
+    text: str
+    lines: list[str]
+    index: LineIndex
+    root: Section
+    tables: list[Table]
+    lists: list[ListBlock]
+    digest: str
+
+    @property
+    def headings(self) -> list[Section]:
+        """Every section in document order, excluding the root."""
+        return list(self.root.walk())
+
+    def sections_at(self, level: int) -> list[Section]:
+        return [s for s in self.root.walk() if s.level == level]
+
+    def find(self, title: str, level: Optional[int] = None) -> Optional[Section]:
+        """Return the first section whose title matches (case-insensitive)."""
+        wanted = title.strip().lower()
+        for section in self.root.walk():
+            if section.title.lower() == wanted and (level is None or section.level == level):
+                return section
+        return None
+
+    def section_at(self, offset: int) -> Section:
+        """Return the innermost section containing offset."""
+        section = self.root
+        while True:
+            for child in section.children:
+                if child.start <= offset < child.end:
+                    section = child
+                    break
+            else:
+                return section
+
+    def body(self, section: Section) -> str:
+        """Text between a section's heading line and the next heading, newline-joined."""
+        if section.end < len(self.text):
+            return self.text[section.body_start:section.end - 1]
+        return self.text[section.body_start:]
+
+    def tables_in(self, section: Section) -> list[Table]:
+        return [t for t in self.tables if section.start <= t.start < section.end]
+
+    def lists_in(self, section: Section) -> list[ListBlock]:
+        return [b for b in self.lists if section.start <= b.start < section.end]
+
+
+def split_cells(line: str) -> list[str]:
+    """Split a '| a | b |' row into stripped cells."""
+    row = line.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    return [cell.strip().replace('\\|', '|') for cell in re.split(r'(?<!\\)\|', row)]
+
+
+def parse_document(text: str, digest: Optional[str] = None) -> Document:
+    """Build the document model in a single pass over text."""
+    lines = text.split('\n')
+    starts = []
+    root = Section(title='', level=0, line=0, start=0, body_start=0)
+    stack = [root]
+    tables = []
+    lists = []
+    table = None
+    block = None
+    fence = None
+
+    def close_sections(level: int, offset: int):
+        while stack[-1].level >= level:
+            stack.pop().end = offset
+
+    offset = 0
+    for line_num, line in enumerate(lines, 1):
+        starts.append(offset)
+        line_end = offset + len(line)
+        next_offset = line_end + 1
+
+        # Fenced code hides everything until the matching fence
+        fence_match = FENCE.match(line)
+        if fence is not None:
+            if fence_match and fence_match.group(1)[0] == fence[0] and len(fence_match.group(1)) >= len(fence):
+                fence = None
+            offset = next_offset
+            continue
+
+        stripped = line.strip()
+
+        # Tables: runs of lines starting with '|'
+        if stripped.startswith('|'):
+            row = TableRow(split_cells(line), line_num, offset, line)
+            if table is None:
+                table = Table(line=line_num, start=offset, end=line_end, header=None, rows=[row])
+                tables.append(table)
+            elif table.header is None and len(table.rows) == 1 and TABLE_DELIMITER.match(stripped):
+                table.header = table.rows.pop()
+            else:
+                table.rows.append(row)
+            table.end = line_end
+        else:
+            table = None
+
+        # Lists: items plus indented continuations; blank lines do not end a block
+        item_match = LIST_ITEM.match(line) if not stripped.startswith('|') else None
+        if item_match:
+            item = ListItem(
+                marker=item_match.group(2),
+                text=item_match.group(3).strip(),
+                indent=len(item_match.group(1).expandtabs(4)),
+                line=line_num,
+                start=offset
+            )
+            if block is None:
+                block = ListBlock(line=line_num, start=offset, end=line_end, items=[])
+                lists.append(block)
+            block.items.append(item)
+            block.end = line_end
+        elif block is not None:
+            if not stripped:
+                offset = next_offset
+                continue
+            if line[:1] in (' ', '\t'):
+                block.items[-1].text += '\n' + stripped
+                block.end = line_end
+            else:
+                block = None
+
+        if fence_match:
+            fence = fence_match.group(1)
+            block = None
+            table = None
+        else:
+            heading = HEADING.match(line)
+            if heading:
+                level = len(heading.group(1))
+                close_sections(level, offset)
+                section = Section(
+                    title=(heading.group(2) or '').strip(),
+                    level=level,
+                    line=line_num,
+                    start=offset,
+                    body_start=min(next_offset, len(text)),
+                    parent=stack[-1]
+                )
+                stack[-1].children.append(section)
+                stack.append(section)
+                block = None
+
+        offset = next_offset
+
+    close_sections(1, len(text))
+    root.end = len(text)
+    if digest is None:
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    return Document(
+        text=text,
+        lines=lines,
+        index=LineIndex.from_starts(starts, len(text)),
+        root=root,
+        tables=tables,
+        lists=lists,
+        digest=digest
+    )
+
+
+_documents = OrderedDict()
+
+
+def load_document(file_path) -> Document:
+    """Read and parse a Markdown file, reusing an earlier parse of identical content.
+
+    Newlines are normalized the same way text-mode reads do. Raises
+    FileNotFoundError or UnicodeDecodeError like Path.read_text.
+    """
+    data = Path(file_path).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+
+    document = _documents.get(digest)
+    if document is not None:
+        _documents.move_to_end(digest)
+        return document
+
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+
+    document = parse_document(text, digest)
+    _documents[digest] = document
+    if len(_documents) > DOCUMENT_CACHE_SIZE:
+        _documents.popitem(last=False)
+    return document
@@ -0,0 +1,753 @@
+"""
+OpenAPI 3.x specification validation.
+
+Checks:
+- Valid OpenAPI 3.x syntax (YAML/JSON)
+- REST naming conventions (plural nouns, kebab-case)
+- No conflicting, shadowed or ambiguous path templates
+- Error responses defined for endpoints
+- Security schemes documented
+- Examples provided in schemas, and conforming to them
+- $refs resolve
+
+$refs to local JSON pointers and relative files are resolved without
+expanding the document, so checks see referenced responses, schemas and
+path items. All checks are OpenAPICheck plugins run in a single traversal of the
+paths and operations; register_check adds custom ones.
+"""
+
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterator, Optional
+
+from .cache import SpecCache
+from .refs import RefResolver
+from .routes import RouteTrie
+from .schemas import SchemaCompiler
+from .results import (
+    ArtifactNotFoundError, CheckList, CheckListener, CheckResult, OpenAPIResult, SpecParseError
+)
+
+# Try to import yaml, fall back to json-only mode
+try:
+    import yaml
+    HAS_YAML = True
+    # libyaml's parser when PyYAML was built with it
+    YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+except ImportError:
+    HAS_YAML = False
+
+
+# Common singular nouns that should be plural in REST paths
+SINGULAR_NOUNS = [
+    'user', 'task', 'project', 'item', 'product', 'order', 'comment',
+    'post', 'article', 'category', 'tag', 'file', 'image', 'document',
+    'message', 'notification', 'setting', 'preference', 'session',
+    'token', 'role', 'permission', 'team', 'organization', 'workspace',
+    'invoice', 'payment', 'subscription', 'plan', 'feature', 'report',
+    'event', 'log', 'audit', 'webhook', 'integration', 'connection'
+]
+
+# Operations checked for error responses, operationIds and descriptions
+HTTP_METHODS = frozenset({'get', 'post', 'put', 'patch', 'delete'})
+
+# Every operation a path item can hold
+OPERATION_METHODS = HTTP_METHODS | {'head', 'options', 'trace'}
+
+# HTTP methods that typically need error responses
+METHODS_NEEDING_ERRORS = ['post', 'put', 'patch', 'delete']
+
+# Standard error status codes to check for
+EXPECTED_ERROR_CODES = ['400', '401', '403', '404', '500']
+
+
+# A top-level openapi/swagger key, in YAML or JSON
+ROOT_KEY = re.compile(r'^["\']?(?:openapi|swagger)["\']?\s*:|"(?:openapi|swagger)"\s*:', re.MULTILINE)
+
+
+def parse_yaml(content: str):
+    """Parse YAML with the fastest safe loader available.
+
+    Errors are re-raised from the pure-Python loader, whose messages
+    include the offending line.
+    """
+    try:
+        return yaml.load(content, Loader=YAML_LOADER)
+    except yaml.YAMLError:
+        if YAML_LOADER is yaml.SafeLoader:
+            raise
+    return yaml.safe_load(content)
+
+
+def parse_spec(path: Path, content: str) -> dict:
+    """Parse OpenAPI spec content as YAML or JSON, depending on the file."""
+    # Detect file type
+    is_yaml_file = path.suffix in ['.yaml', '.yml']
+    is_json_content = content.strip().startswith('{')
+
+    # Try YAML first (if available and appropriate)
+    if HAS_YAML and (is_yaml_file or not is_json_content):
+        try:
+            return parse_yaml(content)
+        except yaml.YAMLError as e:
+            raise SpecParseError(f"Invalid YAML: {e}")
+
+    # YAML file but no PyYAML
+    if is_yaml_file and not HAS_YAML:
+        raise SpecParseError(
+            "YAML file detected but PyYAML not installed. "
+            "Install with: pip install pyyaml"
+        )
+
+    # Try JSON
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError as e:
+        if not is_json_content and not HAS_YAML:
+            raise SpecParseError(
+                f"File appears to be YAML but PyYAML not installed. "
+                f"Install with: pip install pyyaml"
+            )
+        raise SpecParseError(f"Invalid JSON: {e}")
+
+
+def decode(data: bytes) -> str:
+    """Decode file bytes the way a text-mode read does."""
+    text = data.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def load_spec(file_path: str, cache: Optional[SpecCache] = None) -> dict:
+    """Load OpenAPI spec from YAML or JSON file, reusing a cached parse if one is given."""
+    path = Path(file_path)
+
+    if not path.exists():
+        raise ArtifactNotFoundError(f"File not found: {file_path}")
+
+    if cache is not None:
+        return cache.load(path, lambda data: parse_spec(path, decode(data)))
+    return parse_spec(path, path.read_text(encoding='utf-8'))
+
+
+def is_root_contract(path) -> bool:
+    """True if path declares an OpenAPI version rather than being a $ref fragment."""
+    try:
+        return bool(ROOT_KEY.search(Path(path).read_text(encoding='utf-8')))
+    except (OSError, UnicodeDecodeError):
+        return True
+
+
+def referenced_files(result: dict) -> list[str]:
+    """Files a validate_openapi result was computed from besides the contract itself."""
+    return result.get('referenced_files', [])
+
+
+class OpenAPICheck:
+    """A check run by the single-pass OpenAPI visitor.
+
+    The visitor calls start(spec), then walks spec['paths'] once. For
+    each path it calls
+    visit_path(path, item, segments), where segments are the path's
+    non-parameter segments. For each operation object whose lower-cased
+    method is in the check's methods (every object in the path item when
+    methods is None) it calls visit_operation(path, method, operation).
+    finish(spec) then returns the check's result. Checks that look at the
+    whole spec only override finish(). spec is the $ref-resolved view, and
+    self.resolver the RefResolver behind it, if any.
+
+    In a sharded run (jobs > 1) the paths are split into shards visited in
+    worker processes, by fresh instances that have been through start()
+    without a resolver. Each returns partial(), and the check in the
+    calling process merge()s them in path order before finish(). State
+    that spans paths, such as names seen so far, is therefore collected
+    while visiting and reduced in finish(), and a custom check with such
+    state overrides partial() and merge(). Checks visited in workers must
+    be importable there.
+
+    Register a check with @register_check to run it on every contract.
+    """
+    name = ''
+    located = False
+    methods: Optional[frozenset] = frozenset()
+    resolver: Optional[RefResolver] = None
+
+    def __init__(self):
+        self.result = CheckResult(self.name, located=self.located)
+
+    def start(self, spec: dict) -> None:
+        pass
+
+    def visit_path(self, path: str, item, segments: list[str]) -> None:
+        pass
+
+    def visit_operation(self, path: str, method: str, operation: dict) -> None:
+        pass
+
+    def partial(self):
+        """What visiting one shard produced, sent back from a worker: by default the issues."""
+        return self.result.issues
+
+    def merge(self, partial) -> None:
+        """Fold in one shard's partial(); shards are merged in path order."""
+        self.result.issues.extend(partial)
+
+    def finish(self, spec: dict) -> CheckResult:
+        return self.result
+
+
+# Registered check classes, in report order
+CHECKS: list[type[OpenAPICheck]] = []
+
+
+def register_check(cls: type[OpenAPICheck]) -> type[OpenAPICheck]:
+    """Class decorator adding a check to every validate_openapi run."""
+    CHECKS.append(cls)
+    return cls
+
+
+def visitors(checks: list[OpenAPICheck]) -> list[OpenAPICheck]:
+    """The checks that visit paths or operations."""
+    return [c for c in checks if type(c).visit_path is not OpenAPICheck.visit_path
+            or type(c).visit_operation is not OpenAPICheck.visit_operation]
+
+
+def walk(paths, checks: list[OpenAPICheck]) -> None:
+    """Visit (path, item) pairs and their operations once, dispatching each to the checks that want it."""
+    path_visitors = [c for c in checks if type(c).visit_path is not OpenAPICheck.visit_path]
+    operation_visitors = [c for c in checks if type(c).visit_operation is not OpenAPICheck.visit_operation]
+    any_method = [c for c in operation_visitors if c.methods is None]
+    by_method = {}
+
+    for path, item in paths:
+        if path_visitors:
+            segments = [s for s in path.split('/') if s and not s.startswith('{')]
+            for check in path_visitors:
+                check.visit_path(path, item, segments)
+
+        if not operation_visitors or not isinstance(item, dict):
+            continue
+
+        for method, operation in item.items():
+            if not isinstance(operation, dict):
+                continue
+            if not isinstance(method, str):
+                visitors = any_method
+            else:
+                visitors = by_method.get(method)
+                if visitors is None:
+                    key = method.lower()
+                    visitors = by_method[method] = [
+                        c for c in operation_visitors if c.methods is None or key in c.methods
+                    ]
+            for check in visitors:
+                check.visit_operation(path, method, operation)
+
+
+def shard_paths(paths: dict, count: int) -> list[tuple[int, int]]:
+    """Split paths into up to count contiguous (start, stop) runs with similar numbers of operations.
+
+    Runs are cut where the first path segment changes, so a resource's
+    routes stay together, unless a run grows to twice its share.
+    """
+    sizes = [len(item) if isinstance(item, dict) else 1 for item in paths.values()]
+    share = max(1, sum(sizes) // count)
+    shards = []
+    start = size = 0
+    prefix = None
+    for index, (path, weight) in enumerate(zip(paths, sizes)):
+        first = path.split('/', 2)[1] if path.count('/') else path
+        if index > start and (size >= share * 2 or (size >= share and first != prefix)):
+            shards.append((start, index))
+            start, size = index, 0
+        size += weight
+        prefix = first
+    shards.append((start, len(sizes)))
+    return shards
+
+
+# Paths each worker should have before a run is sharded
+MIN_SHARD_PATHS = 250
+
+# Set in each worker process by start_worker(): the check classes, the
+# spec and its (path, item) pairs
+WORKER = {}
+
+
+def start_worker(classes: list[type[OpenAPICheck]], spec: dict) -> None:
+    WORKER['classes'] = classes
+    WORKER['spec'] = spec
+    WORKER['paths'] = list(spec['paths'].items())
+
+
+def visit_shard(shard: tuple[int, int]) -> list:
+    """Visit the paths of one shard in a worker; returns each check's partial()."""
+    checks = [cls() for cls in WORKER['classes']]
+    for check in checks:
+        check.start(WORKER['spec'])
+    walk(WORKER['paths'][shard[0]:shard[1]], checks)
+    return [check.partial() for check in checks]
+
+
+def visit_operations(spec: dict, checks: list[OpenAPICheck],
+                     resolver: Optional[RefResolver] = None, jobs: int = 1) -> Iterator[CheckResult]:
+    """Run checks over spec, walking its paths and operations once, and yield each result in order.
+
+    Each check is finished only once the previous result has been taken,
+    and the checks ahead of the first visitor are finished before the
+    walk, so a caller that stops early skips the remaining work, possibly
+    the walk itself. With jobs > 1 and enough paths, the paths are sharded across that many
+    worker processes and the shards' results merged in path order, so the
+    results are the same as a sequential run's. Workers receive the spec
+    once, when they start (for free where processes are forked), and
+    then only the bounds of each shard.
+    """
+    for check in checks:
+        check.resolver = resolver
+        check.start(spec)
+
+    sharded = visitors(checks)
+    ahead = checks.index(sharded[0]) if sharded else len(checks)
+    for check in checks[:ahead]:
+        yield check.finish(spec)
+    if not sharded:
+        return
+
+    paths = spec.get('paths', {})
+    if jobs > 1 and sharded and len(paths) >= jobs * MIN_SHARD_PATHS:
+        # More shards than workers evens out the load
+        with ProcessPoolExecutor(max_workers=jobs, initializer=start_worker,
+                                 initargs=([type(c) for c in sharded], spec)) as pool:
+            for partials in pool.map(visit_shard, shard_paths(paths, jobs * 4)):
+                for check, partial in zip(sharded, partials):
+                    check.merge(partial)
+    else:
+        walk(paths.items(), checks)
+
+    for check in checks[ahead:]:
+        yield check.finish(spec)
+
+
+@register_check
+class OpenAPIVersion(OpenAPICheck):
+    """Check for valid OpenAPI version."""
+    name = 'openapi_version'
+
+    def finish(self, spec: dict) -> CheckResult:
+        version = spec.get('openapi', '')
+
+        if not version:
+            self.result.add("Missing 'openapi' version field")
+        elif not version.startswith('3.'):
+            self.result.add(f"Expected OpenAPI 3.x, found: {version}")
+
+        self.result.details = {'version': version if version else None}
+        return self.result
+
+
+@register_check
+class InfoSection(OpenAPICheck):
+    """Check for required info section."""
+    name = 'info_section'
+
+    def finish(self, spec: dict) -> CheckResult:
+        info = spec.get('info', {})
+
+        if not info:
+            self.result.add("Missing 'info' section")
+        else:
+            if not info.get('title'):
+                self.result.add("Missing 'info.title'")
+            if not info.get('version'):
+                self.result.add("Missing 'info.version'")
+
+        return self.result
+
+
+@register_check
+class PluralNouns(OpenAPICheck):
+    """Check that path segments use plural nouns."""
+    name = 'plural_nouns'
+
+    def visit_path(self, path: str, item, segments: list[str]) -> None:
+        for segment in segments:
+            # Check if segment is a singular noun
+            segment_lower = segment.lower().replace('-', '').replace('_', '')
+
+            for singular in SINGULAR_NOUNS:
+                # Check for exact singular match (not already plural)
+                if segment_lower == singular and not segment_lower.endswith('s'):
+                    self.result.add(f"'{path}': Use plural '{singular}s' instead of '{segment}'")
+                    break
+
+
+@register_check
+class KebabCase(OpenAPICheck):
+    """Check that path segments use kebab-case (not camelCase or snake_case)."""
+    name = 'kebab_case'
+
+    def visit_path(self, path: str, item, segments: list[str]) -> None:
+        for segment in segments:
+            # Check for camelCase (lowercase followed by uppercase)
+            if re.search(r'[a-z][A-Z]', segment):
+                kebab = re.sub(r'([a-z])([A-Z])', r'\1-\2', segment).lower()
+                self.result.add(f"'{path}': Use kebab-case '{kebab}' instead of '{segment}'")
+
+            # Check for snake_case
+            elif '_' in segment:
+                kebab = segment.replace('_', '-').lower()
+                self.result.add(f"'{path}': Use kebab-case '{kebab}' instead of '{segment}'")
+
+
+@register_check
+class ErrorResponses(OpenAPICheck):
+    """Check that endpoints have error responses defined."""
+    name = 'error_responses'
+    methods = HTTP_METHODS
+
+    def start(self, spec: dict) -> None:
+        self.spec_security = spec.get('security', [])
+
+    def visit_operation(self, path: str, method: str, operation: dict) -> None:
+        responses = operation.get('responses', {})
+
+        # Check for at least one error response (4xx or 5xx)
+        has_error_response = any(
+            str(code).startswith('4') or str(code).startswith('5')
+            for code in responses.keys()
+            if code != 'default'
+        )
+
+        if not has_error_response and method.lower() in METHODS_NEEDING_ERRORS:
+            self.result.add(f"{method.upper()} {path}: Missing error responses (4xx/5xx)")
+
+        # Check for 401 on authenticated endpoints
+        security = operation.get('security', self.spec_security)
+        if security and '401' not in responses and 'default' not in responses:
+            self.result.add(f"{method.upper()} {path}: Has security but missing 401 response")
+
+
+@register_check
+class RequestBodies(OpenAPICheck):
+    """Check that POST/PUT/PATCH have request bodies defined."""
+    name = 'request_bodies'
+    methods = frozenset({'post', 'put', 'patch'})
+
+    def visit_operation(self, path: str, method: str, operation: dict) -> None:
+        # Skip if it's an action endpoint (like /users/{id}/activate)
+        if path.split('/')[-1].startswith('{'):
+            return
+
+        request_body = operation.get('requestBody')
+
+        if not request_body:
+            # Check if it's a simple action (no path params at end suggests it needs a body)
+            last_segment = path.rstrip('/').split('/')[-1]
+            if not last_segment.startswith('{'):
+                self.result.add(f"{method.upper()} {path}: Missing requestBody")
+
+
+@register_check
+class OperationIds(OpenAPICheck):
+    """Check that operations have operationId defined."""
+    name = 'operation_ids'
+    methods = HTTP_METHODS
+
+    def __init__(self):
+        super().__init__()
+        # (operation, operationId) in path order; uniqueness is decided in finish()
+        self.operations = []
+
+    def visit_operation(self, path: str, method: str, operation: dict) -> None:
+        op_id = operation.get('operationId')
+        self.operations.append((f"{method.upper()} {path}", op_id if op_id else None))
+
+    def partial(self):
+        return self.operations
+
+    def merge(self, partial) -> None:
+        self.operations += partial
+
+    def finish(self, spec: dict) -> CheckResult:
+        seen = set()
+        for where, op_id in self.operations:
+            if op_id is None:
+                self.result.add(f"{where}: Missing operationId")
+            elif op_id in seen:
+                self.result.add(f"{where}: Duplicate operationId '{op_id}'")
+            else:
+                seen.add(op_id)
+
+        return self.result
+
+
+@register_check
+class SecuritySchemes(OpenAPICheck):
+    """Check for security scheme definitions if security is used."""
+    name = 'security_schemes'
+    methods = None
+
+    def __init__(self):
+        super().__init__()
+        self.used = False
+
+    def visit_operation(self, path: str, method: str, operation: dict) -> None:
+        if operation.get('security'):
+            self.used = True
+
+    def partial(self):
+        return self.used
+
+    def merge(self, partial) -> None:
+        self.used = self.used or partial
+
+    def finish(self, spec: dict) -> CheckResult:
+        if self.used or spec.get('security'):
+            components = spec.get('components', {})
+            security_schemes = components.get('securitySchemes', {})
+
+            if not security_schemes:
+                self.result.add("Security is used but no securitySchemes defined in components")
+
+        return self.result
+
+
+@register_check
+class SchemaExamples(OpenAPICheck):
+    """Check that schemas have examples, and that every example conforms to its schema.
+
+    Schema-level and property-level examples in components.schemas, and
+    the examples of every request and response media type, are validated
+    by schemas compiled once per schema object and direction, so a
+    request example need not carry readOnly properties nor a response
+    example writeOnly ones.
+    """
+    name = 'schema_examples'
+    methods = OPERATION_METHODS
+
+    def __init__(self):
+        super().__init__()
+        self.compiler = SchemaCompiler()
+        self.media_problems = []
+
+    def visit_operation(self, path: str, method: str, operation: dict) -> None:
+        body = operation.get('requestBody')
+        if isinstance(body, dict):
+            self.check_content(body.get('content'), f"{method.upper()} {path} request body", 'request')
+
+        responses = operation.get('responses')
+        if isinstance(responses, dict):
+            for code, response in responses.items():
+                if isinstance(response, dict):
+                    self.check_content(response.get('content'), f"{method.upper()} {path} response {code}",
+                                       'response')
+
+    def partial(self):
+        return self.media_problems
+
+    def merge(self, partial) -> None:
+        self.media_problems += partial
+
+    def check_content(self, content, where: str, direction: str) -> None:
+        if not isinstance(content, dict):
+            return
+        for media_type, media in content.items():
+            if not isinstance(media, dict) or 'schema' not in media:
+                continue
+            examples = []
+            if 'example' in media:
+                examples.append(('example', media['example']))
+            if isinstance(media.get('examples'), dict):
+                examples += [(f"example '{name}'", example['value'])
+                             for name, example in media['examples'].items()
+                             if isinstance(example, dict) and 'value' in example]
+            if examples:
+                self.check_values(self.compiler.compile(media['schema'], direction), examples,
+                                  f"{where} ({media_type})", self.media_problems)
+
+    @staticmethod
+    def check_values(validate, examples: list, where: str, problems: list) -> None:
+        for label, value in examples:
+            problem = validate(value, '$')
+            if problem:
+                problems.append(f"{where} {label}: {problem}")
+
+    def check_schema(self, schema: dict, where: str, owned: set, seen: set, problems: list) -> None:
+        """Validate the examples of schema and of its nested properties."""
+        if id(schema) in seen:
+            return
+        seen.add(id(schema))
+
+        examples = []
+        if 'example' in schema:
+            examples.append(('example', schema['example']))
+        if isinstance(schema.get('examples'), list):
+            examples += [(f'examples[{i}]', value) for i, value in enumerate(schema['examples'])]
+        if examples:
+            self.check_values(self.compiler.compile(schema), examples, where, problems)
+
+        properties = schema.get('properties')
+        if isinstance(properties, dict):
+            for name, prop in properties.items():
+                # Component schemas are checked under their own names
+                if isinstance(prop, dict) and id(prop) not in owned:
+                    self.check_schema(prop, f"{where} property '{name}'", owned, seen, problems)
+
+    def finish(self, spec: dict) -> CheckResult:
+        components = spec.get('components', {})
+        schemas = components.get('schemas', {})
+
+        schemas_without_examples = []
+        problems = []
+        owned = {id(schema) for schema in schemas.values()}
+        seen = set()
+
+        for name, schema in schemas.items():
+            if not isinstance(schema, dict):
+                continue
+
+            # Check for example at schema level or in properties
+            has_example = 'example' in schema or 'examples' in schema
+
+            if not has_example and schema.get('properties'):
+                # Check if any property has an example
+                has_example = any(
+                    'example' in prop
+                    for prop in schema['properties'].values()
+                    if isinstance(prop, dict)
+                )
+
+            if not has_example:
+                schemas_without_examples.append(name)
+
+            self.check_schema(schema, f"Schema '{name}'", owned, seen, problems)
+
+        if schemas_without_examples:
+            message = f"Schemas missing examples: {', '.join(schemas_without_examples[:5])}"
+            if len(schemas_without_examples) > 5:
+                message += f" (+{len(schemas_without_examples) - 5} more)"
+            self.result.add(message)
+
+        for problem in problems + self.media_problems:
+            self.result.add(problem)
+
+        return self.result
+
+
+@register_check
+class Descriptions(OpenAPICheck):
+    """Check that operations have descriptions or summaries."""
+    name = 'descriptions'
+    methods = HTTP_METHODS
+
+    def visit_operation(self, path: str, method: str, operation: dict) -> None:
+        has_desc = operation.get('summary') or operation.get('description')
+
+        if not has_desc:
+            self.result.add(f"{method.upper()} {path}: Missing summary/description")
+
+
+def path_parameter_types(item) -> dict[str, Optional[str]]:
+    """Schema type of each path parameter a path item or its operations declare."""
+    types = {}
+    if not isinstance(item, dict):
+        return types
+    for owner in (item, *item.values()):
+        parameters = owner.get('parameters') if isinstance(owner, dict) else None
+        if not isinstance(parameters, list):
+            continue
+        for parameter in parameters:
+            if isinstance(parameter, dict) and parameter.get('in') == 'path' and isinstance(parameter.get('name'), str):
+                schema = parameter.get('schema')
+                kind = schema.get('type') if isinstance(schema, dict) else None
+                types.setdefault(parameter['name'], kind if isinstance(kind, str) else None)
+    return types
+
+
+@register_check
+class RouteConflicts(OpenAPICheck):
+    """Check for path templates that conflict, overlap or name a parameter inconsistently."""
+    name = 'route_conflicts'
+
+    def __init__(self):
+        super().__init__()
+        # (path, parameter types) in path order; the trie is built in finish()
+        self.routes = []
+
+    def visit_path(self, path: str, item, segments: list[str]) -> None:
+        self.routes.append((path, path_parameter_types(item) if '{' in path else None))
+
+    def partial(self):
+        return self.routes
+
+    def merge(self, partial) -> None:
+        self.routes += partial
+
+    def finish(self, spec: dict) -> CheckResult:
+        trie = RouteTrie()
+        for path, types in self.routes:
+            trie.add(path, types)
+
+        for path, other in trie.conflicts:
+            self.result.add(f"'{path}' and '{other}' are the same route")
+
+        for route, name, other_route, other_name in trie.inconsistent_names():
+            self.result.add(f"'{route}' names a path parameter '{name}' that '{other_route}' names '{other_name}'")
+
+        for route, other, ambiguous in trie.overlaps():
+            if ambiguous:
+                self.result.add(f"'{route}' and '{other}' are ambiguous: a request can match both")
+            else:
+                self.result.add(f"'{route}' shadows '{other}'")
+
+        return self.result
+
+
+@register_check
+class References(OpenAPICheck):
+    """Check that every $ref reachable from the root resolves."""
+    name = 'references'
+
+    def finish(self, spec: dict) -> CheckResult:
+        if self.resolver is not None:
+            for (base, ref), reason in self.resolver.errors.items():
+                self.result.add(f"Cannot resolve $ref '{ref}' in {self.resolver.name(base)}: {reason}")
+
+        return self.result
+
+
+def validate_openapi(file_path, listener: Optional[CheckListener] = None,
+                     spec_cache: Optional[SpecCache] = None, jobs: int = 1) -> OpenAPIResult:
+    """Validate an OpenAPI spec file, passing each check to listener as it completes.
+
+    Every registered check runs in one traversal of the paths, over a view
+    in which $refs read as their targets. With a SpecCache, an unchanged
+    file, including a referenced one, is not parsed again. jobs > 1 shards
+    the traversal of a large contract across processes; the result is
+    the same. A listener that raises stops the run: checks not yet
+    finished, and the traversal if no visiting check has been reached,
+    are skipped.
+    """
+    resolver = RefResolver(file_path, load_spec(file_path, spec_cache),
+                           lambda path: load_spec(path, spec_cache))
+    spec = resolver.spec
+
+    checks = CheckList(listener)
+    for result in visit_operations(spec, [check() for check in CHECKS], resolver, jobs):
+        checks.append(result)
+
+    version_check = next(c for c in checks if c.check == 'openapi_version')
+    return OpenAPIResult(
+        file=str(file_path),
+        checks=checks,
+        valid_openapi=version_check.passed,
+        openapi_version=version_check.details.get('version'),
+        paths_count=len(spec.get('paths', {})),
+        schemas_count=len(spec.get('components', {}).get('schemas', {})),
+        referenced_files=[os.path.normpath(Path(file_path).parent / resolver.name(path))
+                          for path in resolver.files]
+    )
@@ -0,0 +1,167 @@
+"""
+Output modes shared by the validator scripts.
+
+    --format=json     the full result document once validation finishes (default)
+    --format=ndjson   one issue per line as each check completes, then a
+                      summary line
+    --max-issues N    stop validating once N issues have been reported
+    --fail-fast       same as --max-issues 1
+
+A run stops at the first issue past the limit, and checks that had not
+started are never run. The JSON document then holds only the checks
+that ran, cut to the limit, with "truncated": true; a run with exactly
+N issues finishes and is not truncated. Cached results are replayed
+through the same limit.
+
+NDJSON records:
+
+    {"type": "issue", "check": ..., "message": ..., "line": ..., "column": ...}
+    {"type": "summary", "issues": N, "truncated": false, "summary": {...}, ...}
+
+line and column are null for checks that do not report positions.
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from .results import CheckListener, CheckResult
+
+FORMATS = ('json', 'ndjson')
+
+# Usage text for the flags, appended to each script's usage line
+USAGE = '[--format=json|ndjson] [--fail-fast] [--max-issues N]'
+
+
+class IssueLimitReached(Exception):
+    """Raised from a listener to stop a run once the issue limit is hit."""
+
+
+@dataclass(slots=True)
+class OutputOptions:
+    format: str = 'json'
+    max_issues: Optional[int] = None
+
+    @property
+    def streaming(self) -> bool:
+        """True if issues have to be seen as checks complete rather than at the end."""
+        return self.format == 'ndjson' or self.max_issues is not None
+
+
+def parse_output_args(argv: list[str]) -> tuple[list[str], OutputOptions]:
+    """Split the output flags from a script's arguments.
+
+    Accepts '--format ndjson' and '--format=ndjson' (likewise --max-issues).
+    Raises ValueError for an unknown format or a limit that is not a
+    positive integer.
+    """
+    options = OutputOptions()
+    rest = []
+    args = iter(argv)
+    for arg in args:
+        name, has_value, value = arg.partition('=')
+        if name in ('--format', '--max-issues'):
+            if not has_value:
+                value = next(args, '')
+            if name == '--format':
+                if value not in FORMATS:
+                    raise ValueError(f"--format must be one of: {', '.join(FORMATS)}")
+                options.format = value
+            else:
+                if not value.isdigit() or int(value) < 1:
+                    raise ValueError('--max-issues must be a positive integer')
+                options.max_issues = int(value)
+        elif arg == '--fail-fast':
+            options.max_issues = 1
+        else:
+            rest.append(arg)
+    return rest, options
+
+
+class IssueStream:
+    """Reports checks as they complete and enforces the issue limit."""
+
+    def __init__(self, options: OutputOptions, out=None):
+        self.options = options
+        self.out = out if out is not None else sys.stdout
+        self.checks = []
+        self.count = 0
+        self.truncated = False
+
+    @property
+    def listener(self) -> CheckListener:
+        def report(check: CheckResult) -> None:
+            self.check(check.to_dict())
+        return report
+
+    def check(self, check: dict) -> None:
+        """Report one check in its dict form; raises IssueLimitReached once an issue is dropped."""
+        issues = check['issues']
+        locations = check.get('locations') or [None] * len(issues)
+        limit = self.options.max_issues
+        if limit is not None and self.count + len(issues) > limit:
+            self.truncated = True
+            keep = limit - self.count
+            check = {**check, 'issues': issues[:keep]}
+            if 'locations' in check:
+                check['locations'] = locations[:keep]
+            issues = issues[:keep]
+
+        self.checks.append(check)
+        if self.options.format == 'ndjson':
+            for message, location in zip(issues, locations):
+                location = location or {}
+                self.out.write(json.dumps({
+                    'type': 'issue',
+                    'check': check['check'],
+                    'message': message,
+                    'line': location.get('line'),
+                    'column': location.get('column'),
+                }) + '\n')
+            self.out.flush()
+        self.count += len(issues)
+
+        if self.truncated:
+            raise IssueLimitReached()
+
+    def collect(self, run: Callable[[CheckListener], dict], base: Optional[dict] = None) -> dict:
+        """Run validation with this stream as its listener and return the result.
+
+        run(listener) returns the result document. A result that arrives
+        without any checks being reported (a cache hit) is replayed through
+        the stream. If the limit is hit, the result is rebuilt from the
+        checks reported so far on top of base.
+        """
+        try:
+            result = run(self.listener)
+            if not self.checks:
+                for check in result.get('checks', []):
+                    self.check(check)
+        except IssueLimitReached:
+            counted = [c for c in self.checks if not c.get('skipped')]
+            passed = sum(1 for c in counted if c['passed'])
+            return {
+                **(base or {}),
+                'checks': self.checks,
+                'summary': {'total': len(counted), 'passed': passed, 'failed': len(counted) - passed},
+                'truncated': True
+            }
+        return result
+
+    def summary(self, result: dict) -> dict:
+        """The closing NDJSON record: the result without its checks and per-item details."""
+        record = {'type': 'summary', 'issues': self.count, 'truncated': self.truncated}
+        for key, value in result.items():
+            if key == 'checks' or (isinstance(value, list) and value and isinstance(value[0], dict)):
+                continue
+            record[key] = value
+        return record
+
+
+def emit(result: dict, stream: Optional[IssueStream]) -> None:
+    """Print a script's final output: the JSON document, or the NDJSON summary line."""
+    if stream is not None and stream.options.format == 'ndjson':
+        print(json.dumps(stream.summary(result)), flush=True)
+    else:
+        print(json.dumps(result, indent=2))
@@ -0,0 +1,230 @@
+"""
+$ref resolution for OpenAPI contracts.
+
+RefResolver presents a parsed contract as a view in which every
+reference object ({"$ref": ...}) is replaced by its target. Local JSON
+pointers ("#/components/schemas/User") and relative files
+("schemas/user.yaml", "common.yaml#/responses/NotFound") are supported;
+remote URLs are left as reference objects.
+
+The document is not expanded. Targets are shared rather than copied,
+and only the containers on the way to a reference are copied, shallowly;
+a contract without references is used as parsed. The walk keeps its own
+stack, so however deeply a contract nests it does not hit Python's
+recursion limit. Each referenced file is loaded at most once, each
+reference resolved once, and each target resolved once however many
+references point to it. A reference that cannot be resolved, including
+a chain of references that loops back on itself, stays a reference
+object and is recorded in errors. Views that loop back on themselves,
+and the views holding them, are listed in recursive, for callers that
+must not serialize them whole.
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Any, Callable, Generator
+from urllib.parse import unquote
+
+from .results import ArtifactNotFoundError, ValidationError
+
+# A URI scheme such as http: or https:
+REMOTE_REF = re.compile(r'^[A-Za-z][A-Za-z0-9+.-]*:')
+
+
+class RefError(ValidationError):
+    """A $ref that does not resolve."""
+
+
+def has_refs(document: Any) -> bool:
+    """Whether a '$ref' key appears anywhere in a parsed document; stops at the first one."""
+    if type(document) is not dict and type(document) is not list:
+        return False
+    # Shared nodes (YAML aliases) are looked at once
+    stack, seen = [document], {id(document)}
+    while stack:
+        node = stack.pop()
+        if type(node) is dict:
+            if '$ref' in node:
+                return True
+            node = node.values()
+        for child in node:
+            if type(child) is dict or type(child) is list:
+                key = id(child)
+                if key not in seen:
+                    seen.add(key)
+                    stack.append(child)
+    return False
+
+
+class RefResolver:
+    """Follows the references of one root contract and the files it points to."""
+
+    def __init__(self, root, spec: Any, load: Callable[[Path], Any]):
+        self.root = Path(root).resolve()
+        self.load = load
+        self.documents = {self.root: spec}
+        self.resolved = {}
+        self.resolving = set()
+        self.views = {}
+        self.pending = {}
+        # ids of the views that reach themselves again (recursive schemas) or hold one that does
+        self.recursive = set()
+        self.errors = {}
+
+    @property
+    def spec(self) -> Any:
+        """The dereferenced view of the root document."""
+        document = self.documents[self.root]
+        if not has_refs(document):
+            return document
+        return self.resolve(document, self.root)
+
+    @property
+    def files(self) -> list[Path]:
+        """Referenced files loaded, in load order, excluding the root."""
+        return [path for path, document in self.documents.items()
+                if path != self.root and not isinstance(document, RefError)]
+
+    def document(self, path: Path) -> Any:
+        if path not in self.documents:
+            try:
+                self.documents[path] = self.load(path)
+            except (ArtifactNotFoundError, FileNotFoundError):
+                self.documents[path] = RefError(f"{self.name(path)} not found")
+            except (ValidationError, OSError, UnicodeDecodeError) as e:
+                self.documents[path] = RefError(str(e))
+        document = self.documents[path]
+        if isinstance(document, RefError):
+            raise document
+        return document
+
+    def target(self, ref: str, base: Path) -> tuple[Any, Path]:
+        """Return the node ref points to from base and the file it is in."""
+        key = (base, ref)
+        if key in self.resolved:
+            found = self.resolved[key]
+            if isinstance(found, RefError):
+                raise found
+            return found
+        if key in self.resolving:
+            raise RefError('circular reference')
+
+        self.resolving.add(key)
+        try:
+            location, _, pointer = ref.partition('#')
+            path = base if not location else (base.parent / unquote(location)).resolve()
+            node = self.document(path)
+            for token in pointer.split('/')[1:] if pointer else ():
+                token = unquote(token).replace('~1', '/').replace('~0', '~')
+                node, path = self.follow(node, path)
+                if isinstance(node, dict) and token in node:
+                    node = node[token]
+                elif isinstance(node, list) and token.isdigit() and int(token) < len(node):
+                    node = node[int(token)]
+                else:
+                    raise RefError(f"no '{token}' in {self.name(path)}")
+            found = self.follow(node, path)
+        except RefError as e:
+            self.resolved[key] = e
+            raise
+        finally:
+            self.resolving.discard(key)
+        self.resolved[key] = found
+        return found
+
+    def follow(self, node: Any, base: Path) -> tuple[Any, Path]:
+        """Return node, or its target if it is a reference object."""
+        if type(node) is dict:
+            ref = node.get('$ref')
+            if isinstance(ref, str) and not REMOTE_REF.match(ref):
+                return self.target(ref, base)
+        return node, base
+
+    def resolve(self, node: Any, base: Path) -> Any:
+        """Return node read from base with every reference below it replaced by its target.
+
+        A container with nothing to replace is returned as is, so only the
+        containers on the way to a reference are copied, shallowly. Each
+        node being resolved is a step() on an explicit stack rather than
+        a recursive call.
+        """
+        if type(node) is not dict and type(node) is not list:
+            return node
+        if id(node) in self.views:
+            return self.views[id(node)]
+        stack = [self.step(node, base)]
+        view = None
+        while stack:
+            try:
+                child, child_base = stack[-1].send(view)
+            except StopIteration as done:
+                stack.pop()
+                view = done.value
+                continue
+            view = self.views.get(id(child))
+            if view is None:
+                stack.append(self.step(child, child_base))
+        return view
+
+    def step(self, node: Any, base: Path) -> Generator[tuple[Any, Path], Any, Any]:
+        """Resolve one container: yields (child, base) for each child to resolve, is sent its view."""
+        key = id(node)
+        # While node is being resolved, references back into it (recursive
+        # schemas) read as node itself; those slots are patched once its
+        # view is known.
+        self.views[key] = node
+        self.pending[key] = []
+
+        view = node
+        if type(node) is dict:
+            ref = node.get('$ref')
+            if isinstance(ref, str):
+                if not REMOTE_REF.match(ref):
+                    try:
+                        target, target_base = self.target(ref, base)
+                    except RefError as e:
+                        self.errors.setdefault((base, ref), str(e))
+                    else:
+                        view = target
+                        if type(target) is dict or type(target) is list:
+                            view = yield target, target_base
+                            self.hold(view, self.views, key)
+                return self.settle(key, node, view)
+            children = node.items()
+        else:
+            children = enumerate(node)
+
+        recursive = False
+        for name, child in children:
+            if type(child) is dict or type(child) is list:
+                child_view = yield child, base
+                if id(child_view) in self.pending or id(child_view) in self.recursive:
+                    recursive = True
+                if child_view is not child:
+                    if view is node:
+                        view = type(node)(node)
+                    view[name] = child_view
+                    self.hold(child_view, view, name)
+        if recursive:
+            self.recursive.add(id(view))
+        return self.settle(key, node, view)
+
+    def hold(self, view: Any, container, name) -> None:
+        """Note that container[name] holds a node still being resolved."""
+        if id(view) in self.pending:
+            self.pending[id(view)].append((container, name))
+
+    def settle(self, key: int, node: Any, view: Any) -> Any:
+        self.views[key] = view
+        slots = self.pending.pop(key)
+        if view is not node:
+            for container, name in slots:
+                container[name] = view
+                self.hold(view, container, name)
+        return view
+
+    def name(self, path: Path) -> str:
+        """path relative to the root contract's directory, for messages."""
+        return os.path.relpath(path, self.root.parent)
+
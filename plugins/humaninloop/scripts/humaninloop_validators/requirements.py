@@ -0,0 +1,342 @@
+"""
+Functional requirement and success criteria validation.
+
+Checks:
+- FR-XXX format and sequential numbering
+- RFC 2119 keywords present (MUST, SHOULD, MAY)
+- SC-XXX format and sequential numbering
+- Technology-agnostic language (no banned terms)
+
+Projects can add or drop banned terms with a term pack at
+.humaninloop/banned-terms.txt (one term per line, '!term' removes one).
+
+Every check except check_sequence looks at one requirement at a time, so
+validate_requirements can take a BlockStore holding each block's issues
+from the previous run. Only new or edited blocks are re-checked, and the
+sequence check is rebuilt from the extracted IDs.
+"""
+
+import io
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .cache import BlockStore
+from .lines import LineIndex
+from .results import (
+    ArtifactNotFoundError, CheckList, CheckListener, CheckResult, Issue, Requirement, RequirementsResult
+)
+from .terms import TermMatcher, project_matcher
+
+
+# Terms that indicate technology/implementation leakage
+BANNED_TERMS = [
+    # Databases
+    'postgresql', 'postgres', 'mysql', 'mongodb', 'redis', 'sqlite',
+    'dynamodb', 'cassandra', 'elasticsearch',
+    # Frameworks
+    'react', 'vue', 'angular', 'django', 'flask', 'express', 'rails',
+    'spring', 'laravel', 'nextjs', 'next.js',
+    # Languages (as implementation detail)
+    'python', 'javascript', 'typescript', 'java', 'golang', 'rust',
+    # Infrastructure
+    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'k8s', 'lambda',
+    'ec2', 's3', 'cloudfront', 'heroku', 'vercel',
+    # Technical metrics
+    'api response', 'latency', 'throughput', 'cpu', 'memory usage',
+    'query time', 'database query', 'http status',
+    # Implementation patterns
+    'endpoint', 'rest api', 'graphql', 'webhook', 'microservice',
+    'cron job', 'queue', 'worker', 'cache layer',
+    # Code-level
+    'function', 'class', 'method', 'module', 'component', 'hook',
+    'middleware', 'controller', 'service layer', 'repository pattern'
+]
+
+# Plural forms of the banned nouns. Listed rather than derived, so words
+# that merely end in 's' ('expresses', 'classes') are not flagged.
+BANNED_PLURALS = {
+    'endpoint': ('endpoints',), 'webhook': ('webhooks',), 'microservice': ('microservices',),
+    'cron job': ('cron jobs',), 'queue': ('queues',), 'worker': ('workers',),
+    'api response': ('api responses',), 'database query': ('database queries',),
+    'lambda': ('lambdas',), 'cache layer': ('cache layers',),
+    'function': ('functions',), 'method': ('methods',), 'module': ('modules',),
+    'component': ('components',), 'hook': ('hooks',), 'middleware': ('middlewares',),
+    'controller': ('controllers',),
+}
+
+# Compiled once; project term packs are layered on top per spec
+TECH_TERMS = TermMatcher(BANNED_TERMS, BANNED_PLURALS)
+
+# A requirement starts on a line like '**FR-001**:' or '- **SC-002**:'
+REQUIREMENT_MARKER = re.compile(
+    r'^([ \t]*(?:[-*+][ \t]+|\d+\.[ \t]+)?)\*\*((FR|SC)-(\d{3}))[\*:]+[ \t]*',
+    re.IGNORECASE
+)
+
+# RFC 2119 keywords
+RFC_KEYWORDS = ['must', 'must not', 'shall', 'shall not', 'should',
+                'should not', 'required', 'recommended', 'may', 'optional']
+
+# Patterns that suggest technical metrics instead of outcomes
+TECHNICAL_METRIC_PATTERNS = [
+    re.compile(r'\d+\s*ms\b'),  # milliseconds
+    re.compile(r'\d+%\s*(cpu|memory|coverage)'),  # technical percentages
+    re.compile(r'uptime'),
+    re.compile(r'error rate.*\d'),  # numeric error rates (vs "decreased errors")
+    re.compile(r'requests?\s*per\s*second'),
+    re.compile(r'concurrent\s*(users?|connections?)\s*>\s*\d'),
+]
+
+
+def text_position(req: Requirement, index: LineIndex, offset: int) -> tuple[int, int]:
+    """Return the document (line, column) of an offset within a requirement's text, given its index."""
+    line, column = index.position(offset)
+    if line == 1:
+        column += req.text_column - 1
+    return req.text_line + line - 1, column
+
+
+def iter_requirements(lines: Iterable[str]) -> Iterator[Requirement]:
+    """
+    Yield FR and SC records from spec lines in a single pass.
+
+    A requirement runs from its marker line until the next marker, the next
+    heading, or the end of input. Only the current block is held in memory,
+    so lines may come straight from an open file.
+    """
+    current = None
+    body = []
+
+    def finish():
+        current.text = '\n'.join(body).rstrip()
+        return current
+
+    for line_num, raw in enumerate(lines, 1):
+        line = raw.rstrip('\r\n')
+        match = REQUIREMENT_MARKER.match(line) if '**' in line else None
+
+        if match or line.startswith('##'):
+            if current is not None:
+                yield finish()
+                current = None
+            if not match:
+                continue
+
+            current = Requirement(
+                id=match.group(2).upper(),
+                prefix=match.group(3).upper(),
+                number=int(match.group(4)),
+                text='',
+                line=line_num,
+                column=len(match.group(1)) + 1,
+                text_line=line_num,
+                text_column=match.end() + 1
+            )
+            body = [line[match.end():]]
+        elif current is not None:
+            body.append(line)
+
+    if current is not None:
+        yield finish()
+
+
+def extract_requirements(lines: Iterable[str]) -> tuple[list[Requirement], list[Requirement]]:
+    """Split a single pass over the spec into (FR records, SC records)."""
+    found = {'FR': [], 'SC': []}
+    for req in iter_requirements(lines):
+        found[req.prefix].append(req)
+    return found['FR'], found['SC']
+
+
+def find_requirements(content: str, prefix: str) -> list[Requirement]:
+    """Extract requirements with given prefix (FR or SC) from content."""
+    prefix = prefix.upper()
+    return [r for r in iter_requirements(io.StringIO(content)) if r.prefix == prefix]
+
+
+def format_issues(req: Requirement) -> list[Issue]:
+    """Format problems in one requirement's ID."""
+    # Check format is correct (already matched by regex, so mostly valid)
+    if not re.match(rf'^{req.prefix}-\d{{3}}$', req.id, re.IGNORECASE):
+        return [Issue(f"{req.id}: Invalid format (expected {req.prefix}-XXX)", req.line, req.column)]
+    return []
+
+
+def rfc_issues(req: Requirement) -> list[Issue]:
+    """Missing RFC 2119 keyword in one functional requirement."""
+    text_lower = req.text.lower()
+    if not any(kw in text_lower for kw in RFC_KEYWORDS):
+        return [Issue(f"{req.id}: Missing RFC 2119 keyword (MUST, SHOULD, MAY, etc.)", req.line, req.column)]
+    return []
+
+
+def tech_issues(req: Requirement, matcher: TermMatcher = TECH_TERMS) -> list[Issue]:
+    """Technology terms used in one requirement."""
+    hits = matcher.find_all(req.text)
+    if not hits:
+        return []
+    index = LineIndex(req.text)
+    return [Issue(f"{req.id}: Contains technology term '{hit.term}'", *text_position(req, index, hit.start))
+            for hit in hits]
+
+
+def outcome_issues(sc: Requirement) -> list[Issue]:
+    """Technical metric in one success criterion."""
+    text_lower = sc.text.lower()
+    if any(pattern.search(text_lower) for pattern in TECHNICAL_METRIC_PATTERNS):
+        return [Issue(f"{sc.id}: May contain technical metric instead of user outcome", sc.line, sc.column)]
+    return []
+
+
+# Per-requirement checks of each block kind, in the order they are reported
+BLOCK_CHECKS = {
+    'FR': ('fr_format', 'rfc_keywords', 'tech_agnostic'),
+    'SC': ('sc_format', 'tech_agnostic', 'outcome_focus'),
+}
+
+
+def block_check(name: str, req: Requirement, matcher: TermMatcher = TECH_TERMS) -> list[Issue]:
+    """Run one per-requirement check on one block."""
+    if name == 'rfc_keywords':
+        return rfc_issues(req)
+    if name == 'tech_agnostic':
+        return tech_issues(req, matcher)
+    if name == 'outcome_focus':
+        return outcome_issues(req)
+    return format_issues(req)
+
+
+def block_issues(req: Requirement, matcher: TermMatcher = TECH_TERMS) -> dict[str, list[Issue]]:
+    """Run every per-requirement check on one block, keyed by check name."""
+    return {name: block_check(name, req, matcher) for name in BLOCK_CHECKS[req.prefix]}
+
+
+def check_format(requirements: list[Requirement], prefix: str) -> CheckResult:
+    """Check if requirements follow the correct format."""
+    return CheckResult(f'{prefix.lower()}_format', [i for req in requirements for i in format_issues(req)])
+
+
+def check_sequence(requirements: list[Requirement], prefix: str) -> CheckResult:
+    """Check if requirement numbers are sequential."""
+    result = CheckResult(f'{prefix.lower()}_sequence')
+
+    if not requirements:
+        return result
+
+    ordered = sorted(requirements, key=lambda r: r.number)
+    numbers = [r.number for r in ordered]
+
+    # Check starts at 1
+    if numbers[0] != 1:
+        result.add(f"{prefix} numbering should start at 001, found {prefix}-{numbers[0]:03d}",
+                   ordered[0].line, ordered[0].column)
+
+    # Check for gaps
+    for i, num in enumerate(numbers):
+        expected = i + 1
+        if num != expected:
+            result.add(f"Gap in {prefix} sequence: expected {prefix}-{expected:03d}, found {prefix}-{num:03d}",
+                       ordered[i].line, ordered[i].column)
+            break
+
+    # Check for duplicates
+    seen = set()
+    for req in ordered:
+        if req.number in seen:
+            result.add(f"Duplicate {prefix}-{req.number:03d}", req.line, req.column)
+        seen.add(req.number)
+
+    return result
+
+
+def check_rfc_keywords(requirements: list[Requirement]) -> CheckResult:
+    """Check if functional requirements contain RFC 2119 keywords."""
+    return CheckResult('rfc_keywords', [i for req in requirements for i in rfc_issues(req)])
+
+
+def check_tech_agnostic(requirements: list[Requirement], prefix: str,
+                        matcher: TermMatcher = TECH_TERMS) -> CheckResult:
+    """Check if requirements are technology-agnostic."""
+    return CheckResult('tech_agnostic', [i for req in requirements for i in tech_issues(req, matcher)])
+
+
+def check_outcome_focus(success_criteria: list[Requirement]) -> CheckResult:
+    """Check if success criteria focus on user/business outcomes."""
+    return CheckResult('outcome_focus', [i for sc in success_criteria for i in outcome_issues(sc)])
+
+
+def checked_blocks(requirements: list[Requirement], matcher: TermMatcher,
+                   store: Optional[BlockStore] = None) -> Iterator[CheckResult]:
+    """Yield each per-block check over all the requirements, reusing stored blocks when possible.
+
+    A check runs only when the previous one has been taken, so a caller
+    that stops early never runs the rest. Blocks the store did not know
+    are remembered once all their checks have run.
+    """
+    stored = [store.lookup(req) if store is not None else None for req in requirements]
+    checked = [{} if issues is None else None for issues in stored]
+    for name in BLOCK_CHECKS[requirements[0].prefix]:
+        result = CheckResult(name)
+        for req, issues, fresh in zip(requirements, stored, checked):
+            if issues is None:
+                issues = fresh
+                fresh[name] = block_check(name, req, matcher)
+            result.issues.extend(issues[name])
+        yield result
+
+    if store is not None:
+        for req, fresh in zip(requirements, checked):
+            if fresh is not None:
+                store.remember(req, fresh)
+
+
+def validate_requirements(file_path, store: Optional[BlockStore] = None,
+                          listener: Optional[CheckListener] = None) -> RequirementsResult:
+    """Validate the requirements and success criteria in a spec file.
+
+    With a BlockStore, unchanged FR/SC blocks reuse their issues from the
+    previous run; the result is identical to a full run. Each check is
+    passed to listener as it completes, and runs only once the previous
+    one has been passed, so a listener that raises stops the run there.
+    """
+    path = Path(file_path)
+
+    if not path.exists():
+        raise ArtifactNotFoundError(f"File not found: {file_path}")
+
+    matcher, term_pack = project_matcher(TECH_TERMS, path.parent)
+
+    # Find requirements in one pass, streaming the file
+    with path.open(encoding='utf-8') as spec:
+        fr_requirements, sc_requirements = extract_requirements(spec)
+
+    checks = CheckList(listener)
+
+    # FR checks
+    if fr_requirements:
+        fr_checks = checked_blocks(fr_requirements, matcher, store)
+        checks.append(next(fr_checks))
+        checks.append(check_sequence(fr_requirements, 'FR'))
+        for check in fr_checks:
+            checks.append(check)
+    else:
+        checks.append(CheckResult('fr_format', details={'message': 'No functional requirements found'}))
+
+    # SC checks
+    if sc_requirements:
+        sc_checks = checked_blocks(sc_requirements, matcher, store)
+        checks.append(next(sc_checks))
+        checks.append(check_sequence(sc_requirements, 'SC'))
+        for check in sc_checks:
+            checks.append(check)
+    else:
+        checks.append(CheckResult('sc_format', details={'message': 'No success criteria found'}))
+
+    return RequirementsResult(
+        file=str(file_path),
+        checks=checks,
+        requirements=fr_requirements,
+        success_criteria=sc_requirements,
+        term_pack=str(term_pack) if term_pack else None
+    )
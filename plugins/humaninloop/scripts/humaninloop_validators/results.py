@@ -0,0 +1,491 @@
+"""
+Typed results returned by the validator library.
+
+Every validator returns a ValidationResult subclass holding CheckResult
+entries. to_dict() renders the JSON document the CLI scripts print, so
+in-process callers and subprocess callers see the same data.
+"""
+
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+
+class ValidationError(Exception):
+    """Base class for errors raised by the validator library."""
+
+
+class ArtifactNotFoundError(ValidationError, FileNotFoundError):
+    """The artifact to validate does not exist."""
+
+
+class SpecParseError(ValidationError, ValueError):
+    """The artifact exists but could not be parsed."""
+
+
+@dataclass(slots=True, frozen=True)
+class Issue:
+    """One problem found by a check, with its source position if known."""
+    message: str
+    line: Optional[int] = None
+    column: Optional[int] = None
+
+    @property
+    def location(self) -> Optional[dict]:
+        if self.line is None:
+            return None
+        return {'line': self.line, 'column': self.column}
+
+
+@dataclass(slots=True)
+class CheckResult:
+    """Outcome of one named check.
+
+    located marks checks that report source positions; their dict form
+    carries a 'locations' list aligned with 'issues'. details holds extra
+    keys specific to a check (e.g. 'version', 'skipped', 'reason').
+    """
+    check: str
+    issues: list[Issue] = field(default_factory=list)
+    located: bool = True
+    details: dict = field(default_factory=dict)
+
+    @property
+    def passed(self) -> bool:
+        return not self.issues
+
+    @property
+    def skipped(self) -> bool:
+        return bool(self.details.get('skipped'))
+
+    def add(self, message: str, line: Optional[int] = None, column: Optional[int] = None) -> None:
+        self.issues.append(Issue(message, line, column))
+
+    def extend(self, other: 'CheckResult') -> None:
+        self.issues.extend(other.issues)
+
+    def to_dict(self) -> dict:
+        result = {
+            'check': self.check,
+            'passed': self.passed,
+            'issues': [issue.message for issue in self.issues],
+        }
+        if self.located:
+            result['locations'] = [issue.location for issue in self.issues]
+        result.update(self.details)
+        return result
+
+
+# Called with each check of a run as soon as it completes
+CheckListener = Callable[[CheckResult], None]
+
+
+class CheckList(list):
+    """The checks of one validation run, passed to a listener as they are added.
+
+    A listener may raise to stop the run early; checks not yet started are
+    then never run.
+    """
+
+    def __init__(self, listener: Optional[CheckListener] = None):
+        super().__init__()
+        self.listener = listener
+
+    def append(self, check: CheckResult) -> None:
+        super().append(check)
+        if self.listener is not None:
+            self.listener(check)
+
+
+@dataclass(slots=True, frozen=True)
+class Summary:
+    total: int
+    passed: int
+    failed: int
+
+    def to_dict(self) -> dict:
+        return {'total': self.total, 'passed': self.passed, 'failed': self.failed}
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """Checks run against one or more artifacts."""
+    checks: list[CheckResult]
+
+    @property
+    def summary(self) -> Summary:
+        counted = [c for c in self.checks if not c.skipped]
+        passed = sum(1 for c in counted if c.passed)
+        return Summary(len(counted), passed, len(counted) - passed)
+
+    @property
+    def passed(self) -> bool:
+        return self.summary.failed == 0
+
+    def to_dict(self) -> dict:
+        return {
+            'checks': [c.to_dict() for c in self.checks],
+            'summary': self.summary.to_dict()
+        }
+
+
+@dataclass(slots=True)
+class Requirement:
+    """An FR-XXX or SC-XXX entry from a spec."""
+    id: str
+    prefix: str
+    number: int
+    text: str
+    line: int
+    column: int
+    text_line: int
+    text_column: int
+
+    def to_dict(self) -> dict:
+        return {'id': self.id, 'line': self.line, 'column': self.column}
+
+
+@dataclass(slots=True)
+class RequirementsResult(ValidationResult):
+    file: str
+    requirements: list[Requirement]
+    success_criteria: list[Requirement]
+    term_pack: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'file': self.file,
+            'requirements_found': len(self.requirements),
+            'success_criteria_found': len(self.success_criteria),
+            'term_pack': self.term_pack,
+            'requirements': [r.to_dict() for r in self.requirements],
+            'success_criteria': [r.to_dict() for r in self.success_criteria],
+            'checks': [c.to_dict() for c in self.checks],
+            'summary': self.summary.to_dict()
+        }
+
+
+# (start, end) character offsets into a document's text
+Span = tuple[int, int]
+
+
+@dataclass(slots=True)
+class Scenario:
+    """A numbered acceptance scenario.
+
+    line/column locate its 'N.' marker; clauses maps 'given', 'when' and
+    'then' to the (line, column) of the first whole-word occurrence.
+    """
+    start: int
+    end: int
+    line: int
+    column: int
+    clauses: dict[str, tuple[int, int]] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Story:
+    """A '### User Story N - Title (Priority: PX)' section.
+
+    The story runs from start (its heading line) to end. Its blocks are
+    recorded as spans of text rather than copies: the value after
+    '**Why this priority**:' and '**Independent Test**:'. Acceptance
+    scenarios are parsed into Scenario records. A block that is absent
+    is None; scenarios is an empty list when the acceptance section has
+    no numbered items.
+    """
+    number: int
+    title: str
+    priority: str
+    line: int
+    column: int
+    start: int
+    end: int
+    header_end: int
+    justification: Optional[Span] = None
+    independent_test: Optional[Span] = None
+    scenarios: Optional[list[Scenario]] = None
+    text: str = field(default='', repr=False)
+
+    @property
+    def header(self) -> str:
+        return self.text[self.start:self.header_end]
+
+    def block(self, span: Span) -> str:
+        return self.text[span[0]:span[1]]
+
+    def to_dict(self) -> dict:
+        return {'number': self.number, 'title': self.title, 'priority': self.priority,
+                'line': self.line, 'column': self.column}
+
+
+@dataclass(slots=True)
+class UserStoriesResult(ValidationResult):
+    file: str
+    stories: list[Story]
+    message: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        result = {
+            'file': self.file,
+            'stories_found': len(self.stories),
+        }
+        if self.stories:
+            result['stories'] = [s.to_dict() for s in self.stories]
+        result['checks'] = [c.to_dict() for c in self.checks]
+        result['summary'] = self.summary.to_dict()
+        if self.message:
+            result['message'] = self.message
+        return result
+
+
+@dataclass(slots=True)
+class Attribute:
+    """A row of an entity's attributes table.
+
+    type is the conceptual type as written ('Text(200)', 'Enum[a,b]');
+    kind and arguments split it ('Text', ['200']). required is None when
+    the table has no Required column or the cell is neither yes nor no.
+    constraints is the Constraints, Validation or Pattern cell, with the
+    cells of a | Field | Validation | table naming the attribute, and
+    default the Default cell, if any; pii is set by a PII column or a
+    [PII] or **PII** mark in the row.
+    """
+    name: str
+    type: str
+    kind: str
+    arguments: list[str]
+    required: Optional[bool]
+    constraints: str
+    default: str
+    pii: bool
+    line: int
+    column: int
+
+
+@dataclass(slots=True)
+class Relation:
+    """A relationship from one entity to another, as written.
+
+    kind says where it was written: 'reference' (a Reference(Target)
+    attribute, named by via), 'relationship' (a row of a Relationships
+    table, named by via), 'prose' ("belongs to Target"), 'diagram'
+    ("A ──1:N──▶ B") or 'join' (from the join entity of a diagram's
+    "(via Join)" to each end). target is the name as written; the graph
+    resolves it to an entity. required is set for required Reference
+    attributes.
+    cardinality is '1:1', '1:N', 'N:1' or 'N:M' from source to target,
+    or '' if not written. text is the written form quoted in issues.
+    """
+    kind: str
+    source: str
+    target: str
+    text: str
+    line: int
+    column: int
+    via: str = ""
+    required: bool = False
+    cardinality: str = ""
+
+
+@dataclass(slots=True)
+class Entity:
+    """An '## Entity: Name [STATUS]' section of data-model.md.
+
+    Parsed once: attributes holds its attribute table rows, markers the
+    kinds of documentation its text contains (see data_model.find_markers),
+    state its status/state Enum field as (name, values, offset into
+    content), if it has one, relations the relationships its section
+    declares, and rows its expected row count, if annotated.
+    """
+    name: str
+    status: str
+    content: str
+    line: int
+    offset: int
+    attributes: list[Attribute] = field(default_factory=list)
+    markers: frozenset[str] = frozenset()
+    state: Optional[tuple[str, str, int]] = None
+    relations: list[Relation] = field(default_factory=list)
+    rows: Optional[int] = None
+
+
+@dataclass(slots=True, frozen=True)
+class IndexRecommendation:
+    """An index the model's access paths need, with the reasons for it.
+
+    name follows the uk_/ix_ naming of VALIDATION-RULES.md; line and
+    column locate the attribute or constraint that called for it.
+    """
+    name: str
+    entity: str
+    columns: tuple[str, ...]
+    unique: bool
+    reasons: tuple[str, ...]
+    line: int
+    column: int
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'entity': self.entity,
+            'columns': list(self.columns),
+            'unique': self.unique,
+            'reasons': list(self.reasons),
+            'line': self.line,
+            'column': self.column,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class AccessPattern:
+    """A chain of has-many relations that invites N+1 queries when walked row by row."""
+    path: tuple[str, ...]
+    relations: tuple[str, ...]
+    message: str
+    line: int
+    column: int
+
+    def to_dict(self) -> dict:
+        return {
+            'path': list(self.path),
+            'relations': list(self.relations),
+            'message': self.message,
+            'line': self.line,
+            'column': self.column,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class EntitySize:
+    """Estimated storage of an entity's rows.
+
+    row_bytes is the stored row: its header plus the widths of the
+    bounded attributes; unbounded and unknown name the attributes it
+    leaves out. table_bytes and
+    index_bytes (by index name) are projected only when rows, the
+    expected row count, is known.
+    """
+    entity: str
+    row_bytes: int
+    unbounded: tuple[str, ...]
+    unknown: tuple[str, ...]
+    rows: Optional[int]
+    table_bytes: Optional[int]
+    index_bytes: Optional[dict[str, int]]
+    line: int
+
+    def to_dict(self) -> dict:
+        return {
+            'entity': self.entity,
+            'row_bytes': self.row_bytes,
+            'unbounded': list(self.unbounded),
+            'unknown': list(self.unknown),
+            'rows': self.rows,
+            'table_bytes': self.table_bytes,
+            'index_bytes': self.index_bytes,
+            'line': self.line,
+        }
+
+
+@dataclass(slots=True)
+class ModelAdvice:
+    """Indexes, access-pattern warnings and size estimates derived from a data model, for the plan phase."""
+    indexes: list[IndexRecommendation]
+    access_patterns: list[AccessPattern]
+    capacity: list[EntitySize] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            'indexes': [index.to_dict() for index in self.indexes],
+            'access_patterns': [pattern.to_dict() for pattern in self.access_patterns],
+            'capacity': [size.to_dict() for size in self.capacity],
+        }
+
+
+@dataclass(slots=True)
+class DataModelResult(ValidationResult):
+    file: str
+    entities: list[Entity]
+    advice: Optional[ModelAdvice] = None
+
+    def to_dict(self) -> dict:
+        result = {
+            'file': self.file,
+            'entities_found': [e.name for e in self.entities],
+            'checks': [c.to_dict() for c in self.checks],
+            'summary': self.summary.to_dict()
+        }
+        if self.advice is not None:
+            result['advice'] = self.advice.to_dict()
+        return result
+
+
+@dataclass(slots=True)
+class OpenAPIResult(ValidationResult):
+    file: str
+    valid_openapi: bool
+    openapi_version: Optional[str]
+    paths_count: int
+    schemas_count: int
+    referenced_files: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        result = {
+            'file': self.file,
+            'valid_openapi': self.valid_openapi,
+            'openapi_version': self.openapi_version,
+            'paths_count': self.paths_count,
+            'schemas_count': self.schemas_count,
+        }
+        if self.referenced_files:
+            result['referenced_files'] = self.referenced_files
+        result['checks'] = [c.to_dict() for c in self.checks]
+        result['summary'] = self.summary.to_dict()
+        return result
+
+
+@dataclass(slots=True, frozen=True)
+class Change:
+    """One difference between two contracts and whether it breaks existing clients."""
+    location: str
+    message: str
+    breaking: bool
+
+    def to_dict(self) -> dict:
+        return {'location': self.location, 'message': self.message, 'breaking': self.breaking}
+
+
+@dataclass(slots=True)
+class OpenAPIDiffResult(ValidationResult):
+    """The changes from old_file to new_file; its one check fails on a breaking change."""
+    old_file: str
+    new_file: str
+    changes: list[Change]
+    referenced_files: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        breaking = sum(1 for change in self.changes if change.breaking)
+        result = {
+            'old_file': self.old_file,
+            'new_file': self.new_file,
+            'breaking_changes': breaking,
+            'non_breaking_changes': len(self.changes) - breaking,
+            'changes': [change.to_dict() for change in self.changes],
+        }
+        if self.referenced_files:
+            result['referenced_files'] = self.referenced_files
+        result['checks'] = [c.to_dict() for c in self.checks]
+        result['summary'] = self.summary.to_dict()
+        return result
+
+
+@dataclass(slots=True)
+class ArtifactsResult(ValidationResult):
+    files: list[str]
+
+    def to_dict(self) -> dict:
+        return {
+            'files': self.files,
+            'checks': [c.to_dict() for c in self.checks],
+            'summary': self.summary.to_dict()
+        }
@@ -0,0 +1,152 @@
+"""
+Path-template trie for OpenAPI route analysis.
+
+Each path is inserted segment by segment. Literal segments are keyed
+children; a whole-segment parameter ("{id}") is a single parameter child
+whatever its name, typed by the schema its operations declare for it.
+Segments mixing text and parameters ("v{major}", "{id}.json") are keyed
+by their shape ("v{}", "{}.json") and otherwise treated as literals.
+
+Building the trie finds, in one pass over the segments:
+- conflicts: templates that differ only in parameter names
+- inconsistent names: one parameter position named differently by
+  different routes
+
+Overlaps are found from every node that has both literal children and a
+parameter child, by walking the two subtrees side by side along the
+segments a single request could match. Only those subtrees are walked.
+An overlap where one route is more specific at every point of
+difference is shadowing; otherwise the routes are ambiguous.
+"""
+
+import re
+from typing import Optional
+
+# A parameter inside a mixed segment
+PARAMETER = re.compile(r'\{[^}]*\}')
+
+# Literal segments a parameter of each schema type can match
+TYPE_PATTERNS = {
+    'integer': re.compile(r'[+-]?\d+'),
+    'number': re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?'),
+    'boolean': re.compile(r'true|false'),
+}
+
+
+class RouteNode:
+    """One segment position in the trie."""
+
+    __slots__ = ('literals', 'param', 'names', 'types', 'route')
+
+    def __init__(self):
+        self.literals = {}
+        self.param = None
+        # Parameter nodes: first route per parameter name, declared schema types
+        self.names = {}
+        self.types = set()
+        # The path ending here
+        self.route = None
+
+    def accepts(self, segment: str) -> bool:
+        """True if this parameter node can match the literal segment."""
+        for kind in self.types:
+            pattern = TYPE_PATTERNS.get(kind)
+            if pattern is None or pattern.fullmatch(segment):
+                return True
+        return False
+
+
+def parameter_name(segment: str) -> Optional[str]:
+    """The name of a whole-segment parameter, or None."""
+    if segment.startswith('{') and segment.endswith('}') and segment.count('{') == 1:
+        return segment[1:-1]
+    return None
+
+
+class RouteTrie:
+    """The paths of one contract, with conflicts found as they are added."""
+
+    def __init__(self):
+        self.root = RouteNode()
+        self.conflicts = []
+
+    def add(self, path: str, types: Optional[dict] = None) -> None:
+        """Insert path; types maps its parameter names to schema types."""
+        types = types or {}
+        node = self.root
+        params = []
+        for segment in path.split('/'):
+            name = parameter_name(segment)
+            if name is None:
+                key = PARAMETER.sub('{}', segment) if '{' in segment else segment
+                child = node.literals.get(key)
+                if child is None:
+                    child = node.literals[key] = RouteNode()
+                node = child
+            else:
+                if node.param is None:
+                    node.param = RouteNode()
+                node = node.param
+                node.types.add(types.get(name))
+                params.append((node, name))
+
+        if node.route is not None:
+            self.conflicts.append((path, node.route))
+            return
+        node.route = path
+        for param, name in params:
+            param.names.setdefault(name, path)
+
+    def nodes(self):
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            yield node
+            if node.param is not None:
+                stack.append(node.param)
+            stack.extend(reversed(node.literals.values()))
+
+    def inconsistent_names(self) -> list[tuple[str, str, str, str]]:
+        """(route, name, other route, other name) per parameter position named two ways."""
+        found = []
+        for node in self.nodes():
+            if len(node.names) > 1:
+                (name, route), (other_name, other_route) = list(node.names.items())[:2]
+                found.append((route, name, other_route, other_name))
+        return found
+
+    def overlaps(self) -> list[tuple[str, str, bool]]:
+        """(route, other route, ambiguous) per pair of routes a request can match both of.
+
+        route is the more specific one where only one of them is.
+        """
+        found = []
+        for node in self.nodes():
+            if node.param is None or not node.literals:
+                continue
+            for key, child in node.literals.items():
+                if node.param.accepts(key):
+                    self.walk(child, node.param, found)
+        return found
+
+    @staticmethod
+    def walk(literal: RouteNode, param: RouteNode, found: list) -> None:
+        """Align the subtrees below a literal and its sibling parameter."""
+        # (node on the literal side, node on the parameter side, parameter side more specific somewhere)
+        stack = [(literal, param, False)]
+        while stack:
+            a, b, b_specific = stack.pop()
+            if a.route is not None and b.route is not None:
+                found.append((a.route, b.route, b_specific))
+            for key, child in a.literals.items():
+                other = b.literals.get(key)
+                if other is not None:
+                    stack.append((child, other, b_specific))
+                if b.param is not None and b.param.accepts(key):
+                    stack.append((child, b.param, b_specific))
+            if a.param is not None:
+                for key, child in b.literals.items():
+                    if a.param.accepts(key):
+                        stack.append((a.param, child, True))
+                if b.param is not None:
+                    stack.append((a.param, b.param, b_specific))
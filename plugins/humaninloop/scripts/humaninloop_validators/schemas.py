@@ -0,0 +1,433 @@
+"""
+Compiled validation of example values against OpenAPI Schema Objects.
+
+SchemaCompiler turns a schema into a validator: a function taking a
+value and its location ("$", "$.items[0]") and returning the first
+problem found, or None. Compiling walks the schema once; validating
+then runs only the keyword checks the schema uses. Validators are
+cached per schema object and direction, so a schema reached through
+many $refs (the resolver shares targets) is compiled once for each
+direction it is used in, and recursive schemas compile to validators
+that call themselves.
+
+Supported keywords: type (with OpenAPI 3.0 nullable), enum, const,
+properties, required, additionalProperties, items, minItems, maxItems,
+uniqueItems, minProperties, maxProperties, minLength, maxLength,
+pattern, minimum, maximum, exclusiveMinimum, exclusiveMaximum (3.0
+boolean and 3.1 numeric forms), multipleOf, allOf, anyOf, oneOf and
+not. format is treated as an annotation. A $ref left unresolved
+accepts anything; the references check reports it.
+
+A schema is compiled for a direction. OpenAPI applies required to a
+readOnly property in responses only and to a writeOnly property in
+requests only, so a request's validator does not require readOnly
+properties and a response's does not require writeOnly ones. Without
+a direction (a component schema's own examples) both are required. A
+schema with no such required property below it, the common case, is
+compiled once and shared by every direction.
+"""
+
+import datetime
+import re
+from typing import Any, Callable, Optional
+
+# value, location -> problem or None
+Validator = Callable[[Any, str], Optional[str]]
+
+# Direction -> the keyword marking properties that are not required in it
+NOT_REQUIRED = {'request': 'readOnly', 'response': 'writeOnly'}
+
+
+def json_type(value: Any) -> str:
+    """The JSON type name of a parsed value."""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'number'
+    if isinstance(value, (str, datetime.date)):
+        # YAML reads unquoted dates as date objects; they are strings in JSON
+        return 'string'
+    if isinstance(value, list):
+        return 'array'
+    if isinstance(value, dict):
+        return 'object'
+    return type(value).__name__
+
+
+def is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_integer(value: Any) -> bool:
+    if isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+# JSON type name -> test; unknown names match nothing
+TYPE_TESTS = {
+    'null': lambda value: value is None,
+    'boolean': lambda value: isinstance(value, bool),
+    'integer': is_integer,
+    'number': is_number,
+    'string': lambda value: isinstance(value, (str, datetime.date)),
+    'array': lambda value: isinstance(value, list),
+    'object': lambda value: isinstance(value, dict),
+}
+
+
+def json_equal(a: Any, b: Any) -> bool:
+    """Equality under JSON rules: true is not 1, 1 is 1.0."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(json_equal(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(json_equal(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def accept(value: Any, at: str) -> Optional[str]:
+    return None
+
+
+def reject(value: Any, at: str) -> Optional[str]:
+    return f"{at}: no value is allowed here"
+
+
+class SchemaCompiler:
+    """Compiles schemas to validators, caching one validator per schema object and direction."""
+
+    def __init__(self):
+        self.compiled = {}
+        # Keeps compiled schemas alive so their ids are not reused
+        self.schemas = []
+        self.patterns = {}
+        # ids of the schemas compiled to the same validator in every direction
+        self.undirected = set()
+        # Per schema being built: [whether its validator depends on the direction,
+        # the outermost schema being built that it reaches, by depth]
+        self.building = []
+        # Key of each schema being built -> its depth in building
+        self.depths = {}
+
+    def compile(self, schema: Any, direction: Optional[str] = None) -> Validator:
+        """The validator of schema for values sent in direction ('request', 'response' or None)."""
+        if schema is True or (isinstance(schema, dict) and not schema):
+            return accept
+        if schema is False:
+            return reject
+        if not isinstance(schema, dict) or '$ref' in schema:
+            return accept
+        if id(schema) in self.undirected:
+            direction = None
+
+        key = (id(schema), direction)
+        found = self.compiled.get(key)
+        if found is not None:
+            if self.building:
+                depth = self.depths.get(key)
+                if depth is not None:
+                    # Recursive: reaching a schema still being built
+                    self.building[-1][1] = min(self.building[-1][1], depth)
+                elif id(schema) not in self.undirected:
+                    self.building[-1][0] = True
+            return found
+
+        # A recursive schema reaches itself before it is built
+        slot = []
+        self.compiled[key] = lambda value, at: slot[0](value, at)
+        self.schemas.append(schema)
+        depth = self.depths[key] = len(self.building)
+        self.building.append([False, depth])
+        validator = self.build(schema, direction)
+        directed, reaches = self.building.pop()
+        del self.depths[key]
+        slot.append(validator)
+        self.compiled[key] = validator
+        if reaches < depth:
+            # Part of a recursive schema still being built, which decides for both
+            holder = self.building[-1]
+            holder[0] = holder[0] or directed
+            holder[1] = min(holder[1], reaches)
+        elif not directed:
+            self.undirected.add(id(schema))
+            del self.compiled[key]
+            self.compiled[id(schema), None] = validator
+        elif self.building:
+            self.building[-1][0] = True
+        return validator
+
+    def build(self, schema: dict, direction: Optional[str]) -> Validator:
+        checks = []
+        types = schema.get('type')
+        if isinstance(types, str):
+            types = [types]
+        if isinstance(types, list) and types:
+            if schema.get('nullable') is True and 'null' not in types:
+                types = [*types, 'null']
+            checks.append(self.type_check(types))
+
+        if isinstance(schema.get('enum'), list):
+            values = schema['enum']
+            if schema.get('nullable') is True and None not in values:
+                values = [*values, None]
+            checks.append(self.enum_check(values))
+        if 'const' in schema:
+            checks.append(self.enum_check([schema['const']], 'must be'))
+
+        checks += self.object_checks(schema, direction)
+        checks += self.array_checks(schema, direction)
+        checks += self.string_checks(schema)
+        checks += self.number_checks(schema)
+        checks += self.combinator_checks(schema, direction)
+
+        if not checks:
+            return accept
+        if len(checks) == 1:
+            return checks[0]
+
+        def validate(value, at):
+            for check in checks:
+                problem = check(value, at)
+                if problem:
+                    return problem
+            return None
+        return validate
+
+    @staticmethod
+    def type_check(types: list) -> Validator:
+        tests = [TYPE_TESTS.get(name, lambda value: False) for name in types]
+
+        def check(value, at):
+            for test in tests:
+                if test(value):
+                    return None
+            return f"{at}: expected {' or '.join(str(t) for t in types)}, got {json_type(value)}"
+        return check
+
+    @staticmethod
+    def enum_check(values: list, verb: str = 'must be one of') -> Validator:
+        def check(value, at):
+            for allowed in values:
+                if json_equal(value, allowed):
+                    return None
+            shown = ', '.join(repr(v) for v in values[:5]) + (', ...' if len(values) > 5 else '')
+            return f"{at}: {verb} {shown}"
+        return check
+
+    def object_checks(self, schema: dict, direction: Optional[str]) -> list[Validator]:
+        checks = []
+        declared = schema.get('properties')
+        declared = declared if isinstance(declared, dict) else {}
+        properties = {}
+        for name, subschema in declared.items():
+            validate = self.compile(subschema, direction)
+            if validate is not accept:
+                properties[name] = validate
+        required = schema.get('required')
+        required = [name for name in required if isinstance(name, str)] if isinstance(required, list) else []
+        marked = {name: marker for name in required for marker in NOT_REQUIRED.values()
+                  if isinstance(declared.get(name), dict) and declared[name].get(marker) is True}
+        if marked:
+            self.building[-1][0] = True
+            required = [name for name in required if marked.get(name) != NOT_REQUIRED.get(direction)]
+        extra = self.compile(schema.get('additionalProperties', True), direction)
+        if extra is accept:
+            extra = None
+
+        if properties or required or extra is not None:
+            def check(value, at):
+                if not isinstance(value, dict):
+                    return None
+                for name in required:
+                    if name not in value:
+                        return f"{at}: missing required property '{name}'"
+                for name, validate in properties.items():
+                    if name in value:
+                        problem = validate(value[name], f"{at}.{name}")
+                        if problem:
+                            return problem
+                if extra is not None:
+                    for name in value:
+                        if name not in declared:
+                            if extra is reject:
+                                return f"{at}: unexpected property '{name}'"
+                            problem = extra(value[name], f"{at}.{name}")
+                            if problem:
+                                return problem
+                return None
+            checks.append(check)
+
+        low, high = schema.get('minProperties'), schema.get('maxProperties')
+        if isinstance(low, int) or isinstance(high, int):
+            checks.append(self.size_check(dict, low, high, 'properties'))
+        return checks
+
+    def array_checks(self, schema: dict, direction: Optional[str]) -> list[Validator]:
+        checks = []
+        items = accept
+        if 'items' in schema and not isinstance(schema['items'], list):
+            items = self.compile(schema['items'], direction)
+        if items is not accept:
+            def check(value, at):
+                if not isinstance(value, list):
+                    return None
+                for index, item in enumerate(value):
+                    problem = items(item, f"{at}[{index}]")
+                    if problem:
+                        return problem
+                return None
+            checks.append(check)
+
+        low, high = schema.get('minItems'), schema.get('maxItems')
+        if isinstance(low, int) or isinstance(high, int):
+            checks.append(self.size_check(list, low, high, 'items'))
+
+        if schema.get('uniqueItems') is True:
+            def unique(value, at):
+                if not isinstance(value, list):
+                    return None
+                for index, item in enumerate(value):
+                    if any(json_equal(item, earlier) for earlier in value[:index]):
+                        return f"{at}: items must be unique, {at}[{index}] repeats an earlier item"
+                return None
+            checks.append(unique)
+        return checks
+
+    @staticmethod
+    def size_check(kind: type, low: Optional[int], high: Optional[int], noun: str) -> Validator:
+        low = low if isinstance(low, int) else None
+        high = high if isinstance(high, int) else None
+
+        def check(value, at):
+            if not isinstance(value, kind):
+                return None
+            if low is not None and len(value) < low:
+                return f"{at}: expected at least {low} {noun}, got {len(value)}"
+            if high is not None and len(value) > high:
+                return f"{at}: expected at most {high} {noun}, got {len(value)}"
+            return None
+        return check
+
+    def string_checks(self, schema: dict) -> list[Validator]:
+        checks = []
+        low, high = schema.get('minLength'), schema.get('maxLength')
+        if isinstance(low, int) or isinstance(high, int):
+            low = low if isinstance(low, int) else None
+            high = high if isinstance(high, int) else None
+
+            def length(value, at):
+                if not isinstance(value, str):
+                    return None
+                if low is not None and len(value) < low:
+                    return f"{at}: expected at least {low} characters, got {len(value)}"
+                if high is not None and len(value) > high:
+                    return f"{at}: expected at most {high} characters, got {len(value)}"
+                return None
+            checks.append(length)
+
+        pattern = self.pattern(schema.get('pattern'))
+        if pattern is not None:
+            def matches(value, at):
+                if isinstance(value, str) and not pattern.search(value):
+                    return f"{at}: does not match pattern '{pattern.pattern}'"
+                return None
+            checks.append(matches)
+        return checks
+
+    def pattern(self, source: Any) -> Optional[re.Pattern]:
+        if not isinstance(source, str):
+            return None
+        if source not in self.patterns:
+            try:
+                self.patterns[source] = re.compile(source)
+            except re.error:
+                self.patterns[source] = None
+        return self.patterns[source]
+
+    @staticmethod
+    def number_checks(schema: dict) -> list[Validator]:
+        bounds = []
+        minimum, maximum = schema.get('minimum'), schema.get('maximum')
+        low_exclusive, high_exclusive = schema.get('exclusiveMinimum'), schema.get('exclusiveMaximum')
+        if is_number(minimum):
+            bounds.append((minimum, low_exclusive is True, 1))
+        if is_number(maximum):
+            bounds.append((maximum, high_exclusive is True, -1))
+        # OpenAPI 3.1 / JSON Schema: the exclusive bound is the number itself
+        if is_number(low_exclusive):
+            bounds.append((low_exclusive, True, 1))
+        if is_number(high_exclusive):
+            bounds.append((high_exclusive, True, -1))
+
+        checks = []
+        if bounds:
+            def in_range(value, at):
+                if not is_number(value):
+                    return None
+                for bound, exclusive, direction in bounds:
+                    distance = (value - bound) * direction
+                    if distance < 0 or (exclusive and distance == 0):
+                        relation = ('>' if direction > 0 else '<') + ('' if exclusive else '=')
+                        return f"{at}: expected {relation} {bound}, got {value}"
+                return None
+            checks.append(in_range)
+
+        step = schema.get('multipleOf')
+        if is_number(step) and step > 0:
+            def multiple(value, at):
+                if is_number(value):
+                    quotient = value / step
+                    if abs(quotient - round(quotient)) > 1e-9:
+                        return f"{at}: expected a multiple of {step}, got {value}"
+                return None
+            checks.append(multiple)
+        return checks
+
+    def combinator_checks(self, schema: dict, direction: Optional[str]) -> list[Validator]:
+        checks = []
+        for keyword in ('allOf', 'anyOf', 'oneOf'):
+            subschemas = schema.get(keyword)
+            if isinstance(subschemas, list) and subschemas:
+                checks.append(self.combinator(keyword, [self.compile(sub, direction) for sub in subschemas]))
+
+        if 'not' in schema:
+            negated = self.compile(schema['not'], direction)
+
+            def check(value, at):
+                if negated(value, at) is None:
+                    return f"{at}: must not match the 'not' schema"
+                return None
+            checks.append(check)
+        return checks
+
+    @staticmethod
+    def combinator(keyword: str, validators: list[Validator]) -> Validator:
+        if keyword == 'allOf':
+            def check(value, at):
+                for validate in validators:
+                    problem = validate(value, at)
+                    if problem:
+                        return problem
+                return None
+        elif keyword == 'anyOf':
+            def check(value, at):
+                problems = []
+                for validate in validators:
+                    problem = validate(value, at)
+                    if problem is None:
+                        return None
+                    problems.append(problem)
+                return f"{at}: matches none of the anyOf schemas (first: {problems[0]})"
+        else:
+            def check(value, at):
+                matched = sum(1 for validate in validators if validate(value, at) is None)
+                if matched == 1:
+                    return None
+                return f"{at}: matches {matched} of the oneOf schemas, expected exactly 1"
+        return check
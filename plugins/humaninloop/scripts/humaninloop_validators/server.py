@@ -0,0 +1,290 @@
+"""
+Resident validator server.
+
+Keeps every skill validation script imported in one long-lived process and
+runs their CLIs on request, so repeated validations skip interpreter
+startup and module imports (PyYAML in particular). Requests are
+newline-delimited JSON-RPC 2.0 over a Unix socket or stdio:
+
+    {"jsonrpc": "2.0", "id": 1, "method": "run",
+     "params": {"validator": "validate-requirements", "args": ["spec.md"], "cwd": "/repo"}}
+
+The result carries the script's exit code, stdout and stderr exactly as a
+separate `python3 <script>` invocation would have produced them.
+
+Methods:
+    run       - Run a validator CLI with args from cwd
+    ping      - Liveness check
+    stats     - Request counters and warm-cache size
+    shutdown  - Stop the server after replying
+"""
+
+import importlib.util
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+import traceback
+from collections import OrderedDict
+from contextlib import redirect_stderr, redirect_stdout
+
+from . import openapi
+from .client import PLUGIN_ROOT, VALIDATORS, default_socket_path
+
+# Parsed documents kept warm between requests
+WARM_CACHE_SIZE = 64
+
+
+class RpcError(Exception):
+    """Error reported back to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class WarmCache:
+    """Small LRU of parsed documents keyed by path, mtime and size."""
+
+    def __init__(self, size: int = WARM_CACHE_SIZE):
+        self.size = size
+        self.entries = OrderedDict()
+
+    def wrap(self, loader):
+        """Return loader memoized on the file's identity and modification time."""
+        def warm_loader(file_path, *args, **kwargs):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                return loader(file_path, *args, **kwargs)
+            key = (loader.__module__, os.path.realpath(file_path), stat.st_mtime_ns, stat.st_size)
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+            value = loader(file_path, *args, **kwargs)
+            self.entries[key] = value
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+            return value
+
+        warm_loader.__wrapped__ = loader
+        return warm_loader
+
+
+class ValidatorHost:
+    """Loads validator scripts once and runs their CLIs in-process."""
+
+    def __init__(self):
+        self.modules = {}
+        self.mtimes = {}
+        self.cache = WarmCache()
+        # Spec loading is the expensive part of OpenAPI validation
+        openapi.load_spec = self.cache.wrap(getattr(openapi.load_spec, '__wrapped__', openapi.load_spec))
+        self.requests = 0
+        self.started = time.time()
+
+    def module(self, name: str):
+        """Return the loaded script module, reloading it if the file changed."""
+        if name not in VALIDATORS:
+            raise RpcError(-32602, f"Unknown validator: {name}")
+
+        path = PLUGIN_ROOT / VALIDATORS[name]
+        mtime = path.stat().st_mtime_ns
+        if self.mtimes.get(name) != mtime:
+            spec = importlib.util.spec_from_file_location(
+                'humaninloop_' + name.replace('-', '_'), path
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self.modules[name] = module
+            self.mtimes[name] = mtime
+        return self.modules[name]
+
+    def preload(self):
+        """Import every validator up front so the first request is warm too."""
+        for name in VALIDATORS:
+            self.module(name)
+
+    def run(self, validator: str, args: list, cwd: str = None) -> dict:
+        """Run a validator's main() as if invoked from the command line."""
+        module = self.module(validator)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        saved_argv, saved_cwd = sys.argv, os.getcwd()
+        start = time.perf_counter()
+        exit_code = 0
+
+        try:
+            if cwd:
+                os.chdir(cwd)
+            sys.argv = [module.__file__, *[str(a) for a in args]]
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    module.main()
+                except SystemExit as exc:
+                    exit_code = exit_status(exc.code)
+                except Exception:
+                    traceback.print_exc()
+                    exit_code = 1
+        finally:
+            sys.argv = saved_argv
+            os.chdir(saved_cwd)
+
+        self.requests += 1
+        return {
+            'exit_code': exit_code,
+            'stdout': stdout.getvalue(),
+            'stderr': stderr.getvalue(),
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 3)
+        }
+
+    def stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'uptime_s': round(time.time() - self.started, 1),
+            'validators': sorted(self.modules),
+            'warm_documents': len(self.cache.entries)
+        }
+
+
+def exit_status(code) -> int:
+    """Translate a SystemExit code the way the interpreter would."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def handle_request(host: ValidatorHost, line: bytes) -> tuple[dict, bool]:
+    """Process one JSON-RPC request line; return (response, shutdown requested)."""
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get('id')
+        method = request.get('method')
+        params = request.get('params') or {}
+
+        if method == 'run':
+            result = host.run(params['validator'], params.get('args', []), params.get('cwd'))
+        elif method == 'ping':
+            result = 'pong'
+        elif method == 'stats':
+            result = host.stats()
+        elif method == 'shutdown':
+            return {'jsonrpc': '2.0', 'id': request_id, 'result': 'bye'}, True
+        else:
+            raise RpcError(-32601, f"Unknown method: {method}")
+    except RpcError as e:
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': e.code, 'message': str(e)}}, False
+    except (ValueError, KeyError, TypeError, OSError) as e:
+        return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': -32600, 'message': f"Invalid request: {e}"}}, False
+
+    return {'jsonrpc': '2.0', 'id': request_id, 'result': result}, False
+
+
+def encode(response: dict) -> bytes:
+    return (json.dumps(response) + '\n').encode('utf-8')
+
+
+def serve_stdio(host: ValidatorHost):
+    """Serve requests from stdin, one JSON object per line, until EOF."""
+    reader, writer = sys.stdin.buffer, sys.stdout.buffer
+    for line in reader:
+        if not line.strip():
+            continue
+        response, stop = handle_request(host, line)
+        writer.write(encode(response))
+        writer.flush()
+        if stop:
+            break
+
+
+def socket_in_use(socket_path: str) -> bool:
+    """Whether a server answers on socket_path; a stale socket file refuses the connection."""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def serve_socket(host: ValidatorHost, socket_path: str, idle_timeout: float = None):
+    """Serve requests on a Unix socket until shutdown or idle timeout.
+
+    Raises FileExistsError if another server is already listening on
+    socket_path; a socket file left behind by a server that exited is
+    replaced.
+    """
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            for line in self.rfile:
+                if not line.strip():
+                    continue
+                response, stop = handle_request(host, line)
+                self.wfile.write(encode(response))
+                self.wfile.flush()
+                if stop:
+                    self.server.stopping = True
+                    break
+
+    class Server(socketserver.UnixStreamServer):
+        stopping = False
+
+        def handle_timeout(self):
+            # Called when no connection arrived within idle_timeout
+            self.stopping = True
+
+    if os.path.exists(socket_path):
+        if socket_in_use(socket_path):
+            raise FileExistsError(f"A validator server is already listening on {socket_path}")
+        os.unlink(socket_path)
+
+    # Create the socket owner-only from the start, rather than chmod after bind
+    umask = os.umask(0o077)
+    try:
+        server = Server(socket_path, Handler)
+    finally:
+        os.umask(umask)
+    server.timeout = idle_timeout
+
+    try:
+        while not server.stopping:
+            server.handle_request()
+    finally:
+        server.server_close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main(argv: list = None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Resident humaninloop validator server')
+    transport = parser.add_mutually_exclusive_group()
+    transport.add_argument('--socket', default=None,
+                           help=f'Unix socket path (default: {default_socket_path()})')
+    transport.add_argument('--stdio', action='store_true',
+                           help='Serve JSON-RPC on stdin/stdout instead of a socket')
+    parser.add_argument('--idle-timeout', type=float, default=None,
+                        help='Exit after this many seconds without a request')
+    args = parser.parse_args(argv)
+
+    host = ValidatorHost()
+    host.preload()
+
+    if args.stdio:
+        serve_stdio(host)
+    else:
+        try:
+            serve_socket(host, args.socket or default_socket_path(), args.idle_timeout)
+        except FileExistsError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
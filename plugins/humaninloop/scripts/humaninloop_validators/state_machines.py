@@ -0,0 +1,120 @@
+"""
+State machine analysis for status/state fields.
+
+A StateMachine holds one entity field's Enum values, its transitions as
+written in From/To tables ('*' in From meaning any state), and the
+states its States table marks initial or terminal. STATE-MACHINES.md
+asks for the initial state to be marked and terminal states to be
+identified; the field's default also counts as initial, and a state
+with no transition out counts as terminal.
+
+problems() makes one pass over the transitions to build the graph, a
+breadth-first search from the initial states for reachability, and one
+backwards from the terminal states for the states that cannot finish.
+A wildcard transition is an edge from every state, so both searches
+handle it once rather than expanding it per state.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+
+@dataclass(slots=True)
+class StateMachine:
+    """The documented lifecycle of one status/state field."""
+    entity: str
+    field: str
+    values: list[str]
+    # Where the field is declared
+    line: int
+    column: int
+    initial: set[str] = field(default_factory=set)
+    terminal: set[str] = field(default_factory=set)
+    # State -> (line, column) of its States table row
+    rows: dict[str, tuple[int, int]] = field(default_factory=dict)
+    # (source, or None for any state, target, line, column)
+    transitions: list[tuple[Optional[str], str, int, int]] = field(default_factory=list)
+
+    def problems(self) -> Iterator[tuple[str, int, int]]:
+        """(message, line, column) for each problem with the documented machine."""
+        name = f"{self.entity}.{self.field}"
+        declared = set(self.values)
+        enum = f"Enum[{','.join(self.values[:8])}{',...' if len(self.values) > 8 else ''}]"
+
+        for source, target, line, column in self.transitions:
+            for state in (source, target):
+                if state is not None and state not in declared:
+                    yield (f"{name}: Transition {source or '*'} → {target} uses '{state}', "
+                           f"which is not a value of {enum}", line, column)
+        for state, (line, column) in self.rows.items():
+            if state not in declared:
+                yield f"{name}: States table lists '{state}', which is not a value of {enum}", line, column
+
+        outgoing = {state: [] for state in self.values}
+        incoming = {state: [] for state in self.values}
+        # Targets of wildcard transitions: reachable from every state
+        anywhere = []
+        for source, target, _, _ in self.transitions:
+            if target not in declared:
+                continue
+            if source is None:
+                anywhere.append(target)
+            elif source in declared:
+                outgoing[source].append(target)
+                incoming[target].append(source)
+
+        def where(state):
+            return self.rows.get(state, (self.line, self.column))
+
+        reachable = declared
+        initial = self.initial & declared
+        if not initial:
+            yield f"{name}: No initial state; mark one in the States table or give the field a default", \
+                self.line, self.column
+        else:
+            reachable = set(initial) | set(anywhere)
+            queue = deque(reachable)
+            while queue:
+                for target in outgoing[queue.popleft()]:
+                    if target not in reachable:
+                        reachable.add(target)
+                        queue.append(target)
+            for state in self.values:
+                if state not in reachable:
+                    yield f"{name}: State '{state}' is unreachable from the initial state", *where(state)
+
+        # A wildcard transition leaves every state but its own target
+        exits = set(anywhere)
+        open_states = {state for state in self.values
+                       if outgoing[state] or len(exits) > 1 or (exits and state not in exits)}
+        for state in sorted(self.terminal & open_states, key=self.values.index):
+            if outgoing[state]:
+                yield f"{name}: State '{state}' is marked terminal but has transitions out", *where(state)
+        ends = declared - open_states
+        if self.terminal:
+            for state in self.values:
+                if state in ends and state in reachable and state not in self.terminal:
+                    yield f"{name}: State '{state}' has no transitions out but is not marked terminal", \
+                        *where(state)
+
+        terminal = ends | (self.terminal & declared)
+        if not terminal:
+            yield f"{name}: No terminal state; every state has a transition out", self.line, self.column
+            return
+
+        finishing = set(terminal)
+        queue = deque(terminal)
+        while queue:
+            state = queue.popleft()
+            if state in exits:
+                # Every other state reaches it through the wildcard
+                finishing = declared
+                break
+            for source in incoming[state]:
+                if source not in finishing:
+                    finishing.add(source)
+                    queue.append(source)
+        for state in self.values:
+            if state in reachable and state not in finishing:
+                yield f"{name}: State '{state}' cannot reach a terminal state", *where(state)
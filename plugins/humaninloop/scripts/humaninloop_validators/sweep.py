@@ -0,0 +1,198 @@
+"""
+Repository-wide validation sweep.
+
+Discovers every specs/NNN-* feature directory (the same layout
+find_feature_dir_by_prefix in common.sh resolves) and runs each
+validator that applies to the artifacts present:
+
+    spec.md                     validate_requirements, validate_user_stories
+    data-model.md               validate_data_model
+    contracts/*.yaml|yml|json   validate_openapi (root documents; $ref
+                                fragments are validated through them)
+    research.md, data-model.md  validate_artifacts
+
+Features are validated across a process pool and reported one NDJSON
+record per feature as they finish, followed by an aggregate summary.
+Results go through the project's result cache unless it is disabled;
+outside a project (no .humaninloop directory above the specs) nothing is
+cached unless asked for.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from .artifacts import validate_artifacts
+from .cache import ResultCache
+from .data_model import validate_data_model
+from .openapi import is_root_contract, referenced_files, validate_openapi
+from .requirements import validate_requirements
+from .results import ValidationError
+from .terms import term_pack_fingerprint
+from .user_stories import validate_user_stories
+
+
+FEATURE_DIR = re.compile(r'^\d{3}-')
+CONTRACT_SUFFIXES = ('.yaml', '.yml', '.json')
+PLAN_ARTIFACTS = ('research.md', 'data-model.md')
+
+
+def find_feature_dirs(specs_dir: Path) -> list[Path]:
+    """Return specs/NNN-* directories in name order."""
+    if not specs_dir.is_dir():
+        return []
+    return sorted(p for p in specs_dir.iterdir() if p.is_dir() and FEATURE_DIR.match(p.name))
+
+
+def feature_contracts(feature_dir: Path) -> list[Path]:
+    """Contracts to validate: the root documents in contracts/.
+
+    Files without an openapi version are $ref fragments, validated through
+    the roots that reference them. With no root present, every file is
+    validated so the missing version is reported.
+    """
+    contracts = feature_dir / 'contracts'
+    if not contracts.is_dir():
+        return []
+    files = [p for p in sorted(contracts.iterdir()) if p.is_file() and p.suffix in CONTRACT_SUFFIXES]
+    return [p for p in files if is_root_contract(p)] or files
+
+
+def feature_jobs(feature_dir: Path) -> Iterator[tuple[str, str, list[str], Callable, str]]:
+    """Yield (validator, label, input files, validate function, extra rules) per artifact present."""
+    spec = feature_dir / 'spec.md'
+    if spec.is_file():
+        yield ('validate-requirements', 'spec.md', [str(spec)], validate_requirements,
+               term_pack_fingerprint(feature_dir))
+        yield 'validate-user-stories', 'spec.md', [str(spec)], validate_user_stories, ''
+
+    data_model = feature_dir / 'data-model.md'
+    if data_model.is_file():
+        yield 'validate-model', 'data-model.md', [str(data_model)], validate_data_model, ''
+
+    for contract in feature_contracts(feature_dir):
+        yield 'validate-openapi', f'contracts/{contract.name}', [str(contract)], validate_openapi, ''
+
+    plan_files = [str(feature_dir / name) for name in PLAN_ARTIFACTS if (feature_dir / name).is_file()]
+    if plan_files:
+        yield ('check-artifacts', ', '.join(Path(f).name for f in plan_files), plan_files,
+               lambda *files: validate_artifacts(list(files)), '')
+
+
+def validate_feature(feature_dir, use_cache: bool = True, create_cache: bool = False) -> dict:
+    """Run every applicable validator on one feature directory."""
+    feature_dir = Path(feature_dir)
+    started = time.perf_counter()
+    cache = ResultCache.for_path(feature_dir, create_cache) if use_cache else None
+    results = []
+    total = passed = 0
+
+    for validator, file_name, files, validate, rules in feature_jobs(feature_dir):
+        entry = {'validator': validator, 'file': file_name}
+
+        def run():
+            return validate(*files).to_dict()
+
+        try:
+            result = cache.fetch(validator, files, run, rules, referenced_files) if cache else run()
+        except (ValidationError, OSError, UnicodeDecodeError) as e:
+            entry['passed'] = False
+            entry['error'] = str(e)
+        except Exception as e:
+            # One malformed artifact must not abort the whole sweep
+            entry['passed'] = False
+            entry['error'] = f"{type(e).__name__}: {e}"
+        else:
+            summary = result['summary']
+            total += summary['total']
+            passed += summary['passed']
+            entry['passed'] = summary['failed'] == 0
+            entry['result'] = result
+        results.append(entry)
+
+    record = {
+        'type': 'feature',
+        'feature': feature_dir.name,
+        'path': str(feature_dir),
+        'passed': all(r['passed'] for r in results),
+        'validators': results,
+        'summary': {'total': total, 'passed': passed, 'failed': total - passed},
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+    }
+    if cache is not None:
+        record['cache'] = cache.stats()
+    return record
+
+
+def sweep(specs_dir, jobs: Optional[int] = None, use_cache: bool = True,
+          create_cache: bool = False) -> Iterator[dict]:
+    """Yield one record per feature as it finishes, then a summary record."""
+    started = time.perf_counter()
+    features = find_feature_dirs(Path(specs_dir))
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(features) or 1))
+
+    totals = {'features': len(features), 'features_passed': 0, 'features_failed': 0,
+              'total': 0, 'passed': 0, 'failed': 0, 'errors': 0}
+    cache_totals = {'hits': 0, 'misses': 0}
+
+    def tally(record: dict) -> dict:
+        totals['features_passed' if record['passed'] else 'features_failed'] += 1
+        for key in ('total', 'passed', 'failed'):
+            totals[key] += record['summary'][key]
+        totals['errors'] += sum(1 for r in record['validators'] if 'error' in r)
+        for key, count in record.get('cache', {}).items():
+            cache_totals[key] += count
+        return record
+
+    if jobs == 1:
+        for feature_dir in features:
+            yield tally(validate_feature(feature_dir, use_cache, create_cache))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(validate_feature, str(feature_dir), use_cache, create_cache)
+                       for feature_dir in features]
+            for future in as_completed(futures):
+                yield tally(future.result())
+
+    summary = {
+        'type': 'summary',
+        'specs_dir': str(specs_dir),
+        'jobs': jobs,
+        **totals,
+        'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+    }
+    if use_cache:
+        summary['cache'] = cache_totals
+    yield summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Validate every specs/NNN-* feature directory in parallel.'
+    )
+    parser.add_argument('specs_dir', nargs='?', default='specs',
+                        help='Directory holding the feature directories (default: specs)')
+    parser.add_argument('--jobs', '-j', type=int, default=None,
+                        help='Worker processes (default: one per CPU core)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-validate every artifact instead of reusing cached results')
+    parser.add_argument('--cache', action='store_true',
+                        help='Outside a project, create .humaninloop/cache in the current directory')
+    args = parser.parse_args(argv)
+
+    if not Path(args.specs_dir).is_dir():
+        print(f"Error: Specs directory not found: {args.specs_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    summary = None
+    for record in sweep(args.specs_dir, args.jobs, not args.no_cache, args.cache):
+        print(json.dumps(record), flush=True)
+        summary = record
+
+    sys.exit(0 if summary['features_failed'] == 0 else 1)
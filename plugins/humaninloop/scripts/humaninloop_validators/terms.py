@@ -0,0 +1,166 @@
+"""
+Multi-pattern term matching for banned-vocabulary checks.
+
+TermMatcher compiles a term list into an Aho-Corasick automaton once, then
+scans text in a single pass regardless of how many terms it holds. Hits
+are case-insensitive and respect word boundaries, so 'class' does not
+fire inside 'classification'. Plurals are not guessed from a suffix rule,
+which would let 'express' match 'expresses'; a term's plural forms are
+listed explicitly, and a hit on one reports the term itself.
+
+Projects can extend or trim the built-in vocabulary with a term pack at
+.humaninloop/banned-terms.txt (one term per line, '#' comments, and
+'!term' to drop a built-in term).
+"""
+
+import hashlib
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+
+TERM_PACK_FILE = 'banned-terms.txt'
+
+
+class TermHit(NamedTuple):
+    """A matched term and its [start, end) offsets in the scanned text."""
+    term: str
+    start: int
+    end: int
+
+
+def is_word_char(ch: str) -> bool:
+    """Return True if ch would continue a word."""
+    return ch.isalnum() or ch == '_'
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text without changing its length (offsets stay valid)."""
+    if text.isascii():
+        return text.lower()
+    return ''.join(low if len(low := ch.lower()) == 1 else ch for ch in text)
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over a fixed set of terms."""
+
+    __slots__ = ('terms', 'plurals', '_patterns', '_goto', '_fail', '_out')
+
+    def __init__(self, terms, plurals: Optional[dict[str, tuple[str, ...]]] = None):
+        """Match terms, and each term's forms in plurals (term -> plural forms)."""
+        self.terms = tuple(dict.fromkeys(t.strip() for t in terms if t.strip()))
+        plurals = plurals or {}
+        self.plurals = {term: tuple(plurals[term]) for term in self.terms if term in plurals}
+        # (text matched, term reported), indexed by the automaton's outputs
+        self._patterns = [(term, term) for term in self.terms]
+        self._patterns += [(form, term) for term, forms in self.plurals.items() for form in forms]
+        goto = [{}]
+        out = [()]
+
+        for term_idx, (pattern, _) in enumerate(self._patterns):
+            state = 0
+            for ch in fold_case(pattern):
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = out[state] + (term_idx,)
+
+        # Breadth-first pass to wire failure links and merge outputs
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                fallback = fail[state]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                if out[fail[nxt]]:
+                    out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def find_all(self, text: str) -> list[TermHit]:
+        """Return every whole-word term occurrence in text, in offset order."""
+        lowered = fold_case(text)
+        length = len(lowered)
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self._patterns
+        hits = []
+        state = 0
+
+        for i, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not out[state]:
+                continue
+
+            for term_idx in out[state]:
+                pattern, term = patterns[term_idx]
+                start = i - len(pattern) + 1
+                if start > 0 and is_word_char(lowered[start - 1]) and is_word_char(pattern[0]):
+                    continue
+                end = i + 1
+                if end < length and is_word_char(lowered[end]) and is_word_char(pattern[-1]):
+                    continue
+                hits.append(TermHit(term, start, end))
+
+        hits.sort(key=lambda hit: hit.start)
+        return hits
+
+
+def find_term_pack(start: Path) -> Optional[Path]:
+    """Locate .humaninloop/banned-terms.txt in start or its parents."""
+    start = start.resolve()
+    for directory in (start, *start.parents):
+        candidate = directory / '.humaninloop' / TERM_PACK_FILE
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def load_term_pack(path: Path) -> tuple[list[str], list[str]]:
+    """Read a term pack and return (added terms, removed terms)."""
+    added, removed = [], []
+    for raw in path.read_text(encoding='utf-8').splitlines():
+        line = raw.split('#', 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith('!'):
+            removed.append(line[1:].strip().lower())
+        else:
+            added.append(line)
+    return added, removed
+
+
+@lru_cache(maxsize=16)
+def _pack_matcher(base_terms: tuple, base_plurals: tuple, pack_path: str, mtime_ns: int) -> TermMatcher:
+    added, removed = load_term_pack(Path(pack_path))
+    dropped = set(removed)
+    # Dropping a term drops its plural forms with it
+    return TermMatcher([t for t in base_terms if t.lower() not in dropped] + added, dict(base_plurals))
+
+
+def project_matcher(base: TermMatcher, start: Path) -> tuple[TermMatcher, Optional[Path]]:
+    """Return base extended with the nearest project term pack, and the pack path."""
+    pack = find_term_pack(start)
+    if pack is None:
+        return base, None
+    return _pack_matcher(base.terms, tuple(base.plurals.items()), str(pack), pack.stat().st_mtime_ns), pack
+
+
+def term_pack_fingerprint(start: Path) -> str:
+    """Identify the term pack in effect for start ('' if none), for cache keys."""
+    pack = find_term_pack(start)
+    if pack is None:
+        return ''
+    return f"{pack}:{hashlib.sha256(pack.read_bytes()).hexdigest()}"
@@ -0,0 +1,271 @@
+"""
+User story validation.
+
+Checks:
+- Priority markers (P1, P2, P3)
+- Given/When/Then syntax completeness and order
+- Independent test presence
+- Priority justification
+- Header format
+"""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+from .markdown import Document, load_document
+from .results import (
+    ArtifactNotFoundError, CheckList, CheckListener, CheckResult, Scenario, Story, UserStoriesResult
+)
+
+
+# Pattern for user story headers
+STORY_HEADER = re.compile(
+    r'^###\s+User\s+Story\s+(\d+)\s*[-–—]\s*(.+?)\s*\(Priority:\s*(P[123])\)',
+    re.IGNORECASE
+)
+
+HEADER_FORMAT = re.compile(
+    r'^###\s+User\s+Story\s+\d+\s*[-–—]\s*.+\s*\(Priority:\s*P[123]\)',
+    re.IGNORECASE
+)
+
+# Block markers within a story; the marker is consumed up to its '**' so
+# overlapping markers are each seen
+STORY_MARKER = re.compile(
+    r'\*\*(?=(why this priority\*\*:)|(independent test\*\*:)|(acceptance scenarios?\*\*))',
+    re.IGNORECASE
+)
+
+# Value after a '**Why this priority**:' or '**Independent Test**:' marker
+MARKER_VALUE = re.compile(r'\s*(.+?)(?=\n\n|\n\*\*|$)', re.DOTALL)
+
+# Acceptance scenarios run to the next heading or the end of the story
+SCENARIOS_BODY = re.compile(r':?\s*(.*?)(?=\n##|\Z)', re.DOTALL)
+
+# A line starting 'N.' ends the previous scenario; 'N.' plus whitespace starts one
+SCENARIO_BREAK = re.compile(r'^\d+\.', re.MULTILINE)
+SCENARIO_START = re.compile(r'\d+\.(?:\s+|$)')
+
+CLAUSE = re.compile(r'\b(given|when|then)\b', re.IGNORECASE)
+CLAUSES = ('Given', 'When', 'Then')
+
+VALID_PRIORITIES = {'P1', 'P2', 'P3'}
+
+# Aggregated check names, in report order
+CHECK_NAMES = [
+    'header_format',
+    'priority_markers',
+    'priority_justifications',
+    'independent_tests',
+    'given_when_then',
+]
+
+
+def scan_scenarios(text: str, start: int, end: int, line: int) -> list[Scenario]:
+    """Split an acceptance scenarios block into numbered scenarios.
+
+    start is the block's offset and line its 1-based line number. The
+    block is scanned once for lines starting 'N.'; each scenario's text
+    is then searched for Given/When/Then as whole words until all three
+    are found. Line numbers advance by counting newlines between
+    consecutive positions, so the whole scan stays linear.
+    """
+    scenarios = []
+    breaks = [start] if SCENARIO_START.match(text, start, end) else []
+    breaks += [m.start() for m in SCENARIO_BREAK.finditer(text, start + 1, end)]
+    breaks.append(end)
+
+    position = start
+    for item_start, item_end in zip(breaks, breaks[1:]):
+        item = SCENARIO_START.match(text, item_start, end)
+        if item is None:
+            # 'N.' not followed by whitespace only ends the previous scenario
+            continue
+        line += text.count('\n', position, item_start)
+        position = item_start
+        line_start = text.rfind('\n', 0, item_start) + 1
+        scenario = Scenario(start=item_start, end=item_end, line=line, column=item_start - line_start + 1)
+
+        clause_line, clause_from = line, item_start
+        for clause in CLAUSE.finditer(text, item.end(), item_end):
+            name = clause.group(1).lower()
+            if name in scenario.clauses:
+                continue
+            clause_line += text.count('\n', clause_from, clause.start())
+            clause_from = clause.start()
+            clause_start = text.rfind('\n', 0, clause_from) + 1
+            scenario.clauses[name] = (clause_line, clause_from - clause_start + 1)
+            if len(scenario.clauses) == 3:
+                break
+        scenarios.append(scenario)
+
+    return scenarios
+
+
+def parse_story(text: str, line: int, start: int, end: int, header_end: int,
+                header: re.Match) -> Story:
+    """Record a story and the spans of its blocks in one scan of its text."""
+    story = Story(
+        number=int(header.group(1)),
+        title=header.group(2).strip(),
+        priority=header.group(3).upper(),
+        line=line,
+        column=1,
+        start=start,
+        end=end,
+        header_end=header_end,
+        text=text
+    )
+
+    seen = set()
+    for marker in STORY_MARKER.finditer(text, start, end):
+        kind = marker.lastindex
+        if kind in seen:
+            continue
+        seen.add(kind)
+        block_start = marker.end(kind)
+
+        if kind == 3:
+            body_start, body_end = SCENARIOS_BODY.match(text, block_start, end).span(1)
+            story.scenarios = scan_scenarios(text, body_start, body_end,
+                                             line + text.count('\n', start, body_start))
+        else:
+            value = MARKER_VALUE.match(text, block_start, end)
+            if value:
+                if kind == 1:
+                    story.justification = value.span(1)
+                else:
+                    story.independent_test = value.span(1)
+        if len(seen) == 3:
+            break
+
+    return story
+
+
+def find_user_stories(doc: Document) -> list[Story]:
+    """Extract user stories from a parsed spec.
+
+    A story runs from its '### User Story' heading to the next story
+    heading or the end of the document.
+    """
+    stories = []
+    headers = [(section, match) for section in doc.sections_at(3)
+               if (match := STORY_HEADER.match(doc.lines[section.line - 1]))]
+
+    for i, (section, match) in enumerate(headers):
+        # End at next story or end of content
+        end = headers[i + 1][0].start if i + 1 < len(headers) else len(doc.text)
+        header_end = section.start + len(doc.lines[section.line - 1])
+        stories.append(parse_story(doc.text, section.line, section.start, end, header_end, match))
+
+    return stories
+
+
+def story_check(name: str, story: Story, message: str = None) -> CheckResult:
+    """Build a single-story check result, failing at the story header if message is set."""
+    result = CheckResult(name)
+    if message:
+        result.add(message, story.line, story.column)
+    return result
+
+
+def check_header_format(story: Story) -> CheckResult:
+    """Check if story header follows the correct format."""
+    first_line = story.header
+    if HEADER_FORMAT.match(first_line):
+        return story_check('header_format', story)
+    return story_check('header_format', story,
+                       f"Story {story.number}: Header format incorrect - '{first_line[:60]}...'")
+
+
+def check_priority_marker(story: Story) -> CheckResult:
+    """Check if priority marker is valid (P1, P2, or P3)."""
+    if story.priority in VALID_PRIORITIES:
+        return story_check('priority_markers', story)
+    return story_check('priority_markers', story, f"Story {story.number}: Invalid priority '{story.priority}'")
+
+
+def check_priority_justification(story: Story) -> CheckResult:
+    """Check if priority justification is present and non-empty."""
+    if story.justification is None:
+        return story_check('priority_justifications', story,
+                           f"Story {story.number}: Missing '**Why this priority**:' section")
+
+    justification = story.block(story.justification).strip()
+    if len(justification) < 20:
+        return story_check('priority_justifications', story,
+                           f"Story {story.number}: Priority justification too brief ('{justification[:30]}...')")
+
+    return story_check('priority_justifications', story)
+
+
+def check_independent_test(story: Story) -> CheckResult:
+    """Check if independent test is specified."""
+    if story.independent_test is None:
+        return story_check('independent_tests', story,
+                           f"Story {story.number}: Missing '**Independent Test**:' section")
+
+    if len(story.block(story.independent_test).strip()) < 20:
+        return story_check('independent_tests', story,
+                           f"Story {story.number}: Independent test description too brief")
+
+    return story_check('independent_tests', story)
+
+
+def check_given_when_then(story: Story) -> CheckResult:
+    """Check if acceptance scenarios use Given/When/Then format."""
+    if story.scenarios is None:
+        return story_check('given_when_then', story,
+                           f"Story {story.number}: Missing '**Acceptance Scenarios**:' section")
+
+    if not story.scenarios:
+        return story_check('given_when_then', story, f"Story {story.number}: No numbered scenarios found")
+
+    result = CheckResult('given_when_then')
+    for idx, scenario in enumerate(story.scenarios, 1):
+        label = f"Story {story.number}, Scenario {idx}"
+        # A missing clause is located where it should follow: the clause before it, else the 'N.' marker
+        where = (scenario.line, scenario.column)
+        for clause in CLAUSES:
+            found = scenario.clauses.get(clause.lower())
+            if found is None:
+                result.add(f"{label}: Missing '{clause}' clause", *where)
+            else:
+                where = found
+
+    return result
+
+
+# Per-story checks, in report order
+STORY_CHECKS = [
+    check_header_format,
+    check_priority_marker,
+    check_priority_justification,
+    check_independent_test,
+    check_given_when_then,
+]
+
+
+def validate_user_stories(file_path, listener: Optional[CheckListener] = None) -> UserStoriesResult:
+    """Validate the user stories in a spec file, passing each check to listener as it completes."""
+    path = Path(file_path)
+
+    if not path.exists():
+        raise ArtifactNotFoundError(f"File not found: {file_path}")
+
+    stories = find_user_stories(load_document(path))
+
+    if not stories:
+        return UserStoriesResult(file=str(file_path), checks=[], stories=[],
+                                 message='No user stories found in file')
+
+    # Aggregate each check across all stories
+    checks = CheckList(listener)
+    for name, check in zip(CHECK_NAMES, STORY_CHECKS):
+        aggregated = CheckResult(name)
+        for story in stories:
+            aggregated.extend(check(story))
+        checks.append(aggregated)
+
+    return UserStoriesResult(file=str(file_path), checks=checks, stories=stories)
@@ -0,0 +1,327 @@
+"""
+Watch a feature directory and re-validate artifacts as they are saved.
+
+Writes to spec.md, data-model.md, research.md, tasks.md and
+contracts/*.yaml|yml|json are picked up through inotify on Linux, or by
+polling file stats elsewhere. A burst of writes (editors often write,
+rename and touch in quick succession) is debounced into one run. Only the
+validators whose inputs changed are re-run: requirements incrementally
+through an in-memory BlockStore, the rest in-process against the cached
+Markdown documents. Each run prints the issues that appeared and the
+issues that were resolved since the previous report.
+"""
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+from .artifacts import validate_artifacts
+from .cache import BlockStore
+from .results import Issue, ValidationError
+from .sweep import CONTRACT_SUFFIXES, feature_jobs, validate_feature
+
+
+WATCHED_NAMES = ('spec.md', 'data-model.md', 'research.md', 'tasks.md')
+
+DEBOUNCE_SECONDS = 0.03
+POLL_INTERVAL = 0.1
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_artifact(feature_dir: Path, path: Path) -> bool:
+    """Return True if path is an artifact the watcher validates."""
+    if path.parent == feature_dir:
+        return path.name in WATCHED_NAMES
+    return path.parent == feature_dir / 'contracts' and path.suffix in CONTRACT_SUFFIXES
+
+
+class InotifySource:
+    """Change events for the feature directory and its contracts/ directory."""
+
+    name = 'inotify'
+
+    def __init__(self, feature_dir: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self.fd = libc.inotify_init1(IN_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.feature_dir = feature_dir
+        self.dirs = {}
+        self.watch(feature_dir)
+        if (feature_dir / 'contracts').is_dir():
+            self.watch(feature_dir / 'contracts')
+
+    def watch(self, directory: Path) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f'inotify_add_watch failed for {directory}')
+        self.dirs[wd] = directory
+
+    def wait(self, timeout: Optional[float]) -> set[Path]:
+        """Block up to timeout for events; return the artifacts they touched."""
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return set()
+        changed = set()
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                directory = self.dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / os.fsdecode(name)
+                if mask & IN_ISDIR:
+                    if path == self.feature_dir / 'contracts' and mask & (IN_CREATE | IN_MOVED_TO):
+                        self.watch(path)
+                        changed.update(p for p in path.iterdir() if is_artifact(self.feature_dir, p))
+                elif is_artifact(self.feature_dir, path):
+                    changed.add(path)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingSource:
+    """Change detection by comparing file stats at a fixed interval."""
+
+    name = 'polling'
+
+    def __init__(self, feature_dir: Path, interval: float = POLL_INTERVAL):
+        self.feature_dir = feature_dir
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self) -> dict[Path, tuple[int, int]]:
+        stats = {}
+        candidates = [self.feature_dir / name for name in WATCHED_NAMES]
+        contracts = self.feature_dir / 'contracts'
+        if contracts.is_dir():
+            candidates += [p for p in contracts.iterdir() if p.suffix in CONTRACT_SUFFIXES]
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        return stats
+
+    def wait(self, timeout: Optional[float]) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self.scan()
+            changed = {p for p in current.keys() | self.snapshot.keys()
+                       if current.get(p) != self.snapshot.get(p)}
+            self.snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            pause = self.interval if deadline is None else min(self.interval, max(0.0, deadline - time.monotonic()))
+            time.sleep(pause)
+
+    def close(self) -> None:
+        pass
+
+
+def open_source(feature_dir: Path, polling: bool = False):
+    """Use inotify when the platform has it, polling otherwise."""
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifySource(feature_dir)
+        except (OSError, AttributeError):
+            pass
+    return PollingSource(feature_dir)
+
+
+def watch_jobs(feature_dir: Path):
+    """Validators for the feature: the sweep's jobs plus tasks.md artifact checks."""
+    yield from feature_jobs(feature_dir)
+    tasks = feature_dir / 'tasks.md'
+    if tasks.is_file():
+        yield 'check-artifacts', 'tasks.md', [str(tasks)], lambda path: validate_artifacts([path]), ''
+
+
+class FeatureWatcher:
+    """Re-runs affected validators and diffs their issues against the last report."""
+
+    def __init__(self, feature_dir, out=sys.stdout, use_cache: bool = True, create_cache: bool = False):
+        self.feature_dir = Path(feature_dir).resolve()
+        self.out = out
+        # Without the cache, requirement blocks are kept in memory for the session only
+        self.use_cache = use_cache
+        self.create_cache = create_cache
+        self.issues = {}
+        self.stores = {}
+        self.dependencies = {}
+
+    def run_job(self, validator: str, files: list[str], validate, rules: str) -> dict:
+        """Run one validator and return its issues keyed for diffing.
+
+        Files the result depends on besides its inputs (a contract's $ref
+        targets) are recorded in dependencies.
+        """
+        try:
+            if validator == 'validate-requirements':
+                key = (files[0], rules)
+                if key not in self.stores:
+                    self.stores[key] = BlockStore.for_file(files[0], rules, self.create_cache) \
+                        if self.use_cache else BlockStore(None, rules)
+                store = self.stores[key]
+                result = validate(files[0], store)
+                store.save()
+                store.advance()
+            else:
+                result = validate(*files)
+        except (ValidationError, OSError, UnicodeDecodeError) as e:
+            return {('error', str(e), 0): Issue(str(e))}
+        except Exception as e:
+            # A file caught half-written must not end the watch
+            message = f"{type(e).__name__}: {e}"
+            return {('error', message, 0): Issue(message)}
+
+        self.dependencies[validator, tuple(files)] = set(getattr(result, 'referenced_files', ()))
+        found = {}
+        seen = Counter()
+        for check in result.checks:
+            for issue in check.issues:
+                # Number repeated messages so duplicates diff correctly
+                seen[check.check, issue.message] += 1
+                found[check.check, issue.message, seen[check.check, issue.message]] = issue
+        return found
+
+    def revalidate(self, changed: Optional[set[Path]] = None) -> tuple[int, int, int]:
+        """Re-run validators whose inputs are in changed (all when None); print the diff.
+
+        Returns (validators run, new issues, resolved issues).
+        """
+        jobs = list(watch_jobs(self.feature_dir))
+        changed_names = None if changed is None else {str(p) for p in changed}
+        ran = new = resolved = 0
+        lines = []
+
+        for validator, label, files, validate, rules in jobs:
+            depends = self.dependencies.get((validator, tuple(files)), set())
+            if changed_names is not None and changed_names.isdisjoint(files) and changed_names.isdisjoint(depends):
+                continue
+            ran += 1
+            key = (validator, label)
+            before = self.issues.get(key, {})
+            after = self.run_job(validator, files, validate, rules)
+            self.issues[key] = after
+
+            for issue_key, issue in after.items():
+                if issue_key not in before:
+                    new += 1
+                    lines.append(self.format_issue('+', validator, label, issue_key[0], issue))
+            for issue_key, issue in before.items():
+                if issue_key not in after:
+                    resolved += 1
+                    lines.append(self.format_issue('-', validator, label, issue_key[0], issue))
+
+        # Artifacts that were deleted take their issues with them
+        current = {(validator, label) for validator, label, *_ in jobs}
+        for key in [k for k in self.issues if k not in current]:
+            resolved += len(self.issues.pop(key))
+            lines.append(f"  - {key[0]} {key[1]}: artifact removed")
+
+        for line in lines:
+            print(line, file=self.out)
+        return ran, new, resolved
+
+    @staticmethod
+    def format_issue(sign: str, validator: str, label: str, check: str, issue: Issue) -> str:
+        where = label if issue.line is None else f"{label}:{issue.line}:{issue.column}"
+        return f"  {sign} {validator} {check} {where} {issue.message}"
+
+    def total_issues(self) -> int:
+        return sum(len(found) for found in self.issues.values())
+
+    def watch(self, polling: bool = False, debounce: float = DEBOUNCE_SECONDS) -> None:
+        """Validate once, then re-validate on every debounced burst of saves until interrupted."""
+        started = time.perf_counter()
+        ran, _, _ = self.revalidate()
+        print(f"Validated {self.feature_dir.name}: {ran} validators, {self.total_issues()} issues "
+              f"in {(time.perf_counter() - started) * 1000:.0f} ms", file=self.out)
+
+        source = open_source(self.feature_dir, polling)
+        print(f"Watching {self.feature_dir} ({source.name}); Ctrl-C to stop", file=self.out, flush=True)
+        try:
+            while True:
+                changed = source.wait(None)
+                while changed:
+                    more = source.wait(debounce)
+                    if not more:
+                        break
+                    changed |= more
+                if not changed:
+                    continue
+
+                started = time.perf_counter()
+                stamp = time.strftime('%H:%M:%S')
+                names = ', '.join(sorted(str(p.relative_to(self.feature_dir)) for p in changed))
+                print(f"[{stamp}] {names} changed", file=self.out)
+                ran, new, resolved = self.revalidate(changed)
+                print(f"[{stamp}] {ran} validators in {(time.perf_counter() - started) * 1000:.0f} ms: "
+                      f"{new} new, {resolved} resolved, {self.total_issues()} open", file=self.out, flush=True)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            source.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Validate one feature directory, optionally re-validating on every save.'
+    )
+    parser.add_argument('feature_dir', help='Feature directory, e.g. specs/001-auth')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and report new and resolved issues as artifacts change')
+    parser.add_argument('--poll', action='store_true',
+                        help='Detect changes by polling instead of inotify')
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS * 1000, metavar='MS',
+                        help=f'Quiet period that ends a burst of writes (default: {DEBOUNCE_SECONDS * 1000:.0f})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-validate every artifact instead of reusing cached results')
+    parser.add_argument('--cache', action='store_true',
+                        help='Outside a project, create .humaninloop/cache in the current directory')
+    args = parser.parse_args(argv)
+
+    if not Path(args.feature_dir).is_dir():
+        print(f"Error: Feature directory not found: {args.feature_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.watch:
+        watcher = FeatureWatcher(args.feature_dir, use_cache=not args.no_cache, create_cache=args.cache)
+        watcher.watch(args.poll, args.debounce / 1000)
+        sys.exit(0)
+
+    record = validate_feature(args.feature_dir, not args.no_cache, args.cache)
+    print(json.dumps(record, indent=2))
+    sys.exit(0 if record['passed'] else 1)
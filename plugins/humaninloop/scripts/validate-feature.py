@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Validate one feature directory, or watch it and re-validate on save.
+
+Without --watch, runs every applicable validator once and prints the
+same record the sweep emits for a feature. With --watch, re-runs only
+the validators whose artifacts changed and prints the issues that
+appeared (+) and were resolved (-) after each save.
+
+Usage:
+    python validate-feature.py <feature-dir> [--watch] [--poll] [--debounce MS] [--cache | --no-cache]
+
+Exit codes:
+    0 - All validators passed (or watch mode was interrupted)
+    1 - One or more validators failed
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from humaninloop_validators.watch import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
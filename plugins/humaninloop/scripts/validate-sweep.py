@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+Validate every feature directory under specs/ in parallel.
+
+Runs the requirement, user story, data model, OpenAPI and plan artifact
+validators on each specs/NNN-* directory across a process pool, printing
+one NDJSON record per feature as it finishes and a final summary record.
+
+Usage:
+    python validate-sweep.py [specs-dir] [--jobs N] [--cache | --no-cache]
+
+Exit codes:
+    0 - Every feature passed
+    1 - One or more features failed
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from humaninloop_validators.sweep import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Drop-in client for the resident validator server.
+
+Forwards a validator invocation to validator-server.py and reproduces its
+stdout, stderr and exit code. Without a running server the validator
+script runs in this process instead, so the output is the same either way.
+
+Usage:
+    python validator-client.py <validator> [args...]
+
+Validators:
+    validate-requirements, validate-user-stories, validate-model,
+    validate-openapi, check-artifacts
+
+Example:
+    python validator-client.py validate-requirements specs/001-auth/spec.md
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from humaninloop_validators.client import VALIDATORS, ValidatorClient, run_local  # noqa: E402
+
+
+def main():
+    if len(sys.argv) < 2 or sys.argv[1] not in VALIDATORS:
+        print(f"Usage: validator-client.py <{'|'.join(VALIDATORS)}> [args...]", file=sys.stderr)
+        sys.exit(2)
+
+    validator, args = sys.argv[1], sys.argv[2:]
+
+    try:
+        client = ValidatorClient()
+    except OSError:
+        run_local(validator, args)
+        sys.exit(0)
+
+    with client:
+        try:
+            result = client.run(validator, args)
+        except TimeoutError:
+            print(f"Error: validator server did not answer within {client.sock.gettimeout():g}s", file=sys.stderr)
+            sys.exit(1)
+
+    sys.stdout.write(result['stdout'])
+    sys.stderr.write(result['stderr'])
+    sys.exit(result['exit_code'])
+
+
+if __name__ == '__main__':
+    main()
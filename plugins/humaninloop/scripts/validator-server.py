@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Run the resident humaninloop validator server.
+
+Keeps all skill validation scripts loaded so validator-client.py requests
+skip interpreter startup and imports.
+
+Usage:
+    python validator-server.py [--socket PATH] [--idle-timeout SECONDS]
+    python validator-server.py --stdio
+
+The socket defaults to $HUMANINLOOP_VALIDATOR_SOCKET, or a per-user path
+under $XDG_RUNTIME_DIR (falling back to the temp directory).
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from humaninloop_validators.server import main  # noqa: E402
+
+if __name__ == '__main__':
+    main()
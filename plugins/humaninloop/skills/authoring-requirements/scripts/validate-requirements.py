@@ -8,277 +8,102 @@ Checks:
 - SC-XXX format and sequential numbering
 - Technology-agnostic language (no banned terms)
 
+Projects can add or drop banned terms with a term pack at
+.humaninloop/banned-terms.txt (one term per line, '!term' removes one).
+
 Usage:
-    python validate-requirements.py <path-to-spec.md>
+    python validate-requirements.py <path-to-spec.md> [--cache | --no-cache] [--incremental]
+        [--format=json|ndjson] [--fail-fast] [--max-issues N]
 
 Output:
-    JSON with validation results
-"""
-
-import json
-import re
-import sys
-from pathlib import Path
-
-
-# Terms that indicate technology/implementation leakage
-BANNED_TERMS = [
-    # Databases
-    'postgresql', 'postgres', 'mysql', 'mongodb', 'redis', 'sqlite',
-    'dynamodb', 'cassandra', 'elasticsearch',
-    # Frameworks
-    'react', 'vue', 'angular', 'django', 'flask', 'express', 'rails',
-    'spring', 'laravel', 'nextjs', 'next.js',
-    # Languages (as implementation detail)
-    'python', 'javascript', 'typescript', 'java', 'golang', 'rust',
-    # Infrastructure
-    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'k8s', 'lambda',
-    'ec2', 's3', 'cloudfront', 'heroku', 'vercel',
-    # Technical metrics
-    'api response', 'latency', 'throughput', 'cpu', 'memory usage',
-    'query time', 'database query', 'http status',
-    # Implementation patterns
-    'endpoint', 'rest api', 'graphql', 'webhook', 'microservice',
-    'cron job', 'queue', 'worker', 'cache layer',
-    # Code-level
-    'function', 'class', 'method', 'module', 'component', 'hook',
-    'middleware', 'controller', 'service layer', 'repository pattern'
-]
-
-# RFC 2119 keywords
-RFC_KEYWORDS = ['must', 'must not', 'shall', 'shall not', 'should',
-                'should not', 'required', 'recommended', 'may', 'optional']
-
-
-def find_requirements(content: str, prefix: str) -> list[dict]:
-    """Extract requirements with given prefix (FR or SC) from content."""
-    requirements = []
-
-    # Pattern for requirements like **FR-001**: or **SC-001**:
-    pattern = re.compile(
-        rf'\*\*({prefix}-(\d{{3}}))[\*:]+\s*(.+?)(?=\n\*\*{prefix}-|\n##|\n\n##|\Z)',
-        re.DOTALL | re.IGNORECASE
-    )
-
-    for match in pattern.finditer(content):
-        req_id = match.group(1).upper()
-        req_num = int(match.group(2))
-        req_text = match.group(3).strip()
-
-        requirements.append({
-            'id': req_id,
-            'number': req_num,
-            'text': req_text,
-            'line': content[:match.start()].count('\n') + 1
-        })
-
-    return requirements
-
-
-def check_format(requirements: list[dict], prefix: str) -> dict:
-    """Check if requirements follow the correct format."""
-    issues = []
-
-    for req in requirements:
-        # Check format is correct (already matched by regex, so mostly valid)
-        if not re.match(rf'^{prefix}-\d{{3}}$', req['id'], re.IGNORECASE):
-            issues.append(f"{req['id']}: Invalid format (expected {prefix}-XXX)")
-
-    return {
-        'check': f'{prefix.lower()}_format',
-        'passed': len(issues) == 0,
-        'issues': issues
-    }
-
-
-def check_sequence(requirements: list[dict], prefix: str) -> dict:
-    """Check if requirement numbers are sequential."""
-    issues = []
-
-    if not requirements:
-        return {
-            'check': f'{prefix.lower()}_sequence',
-            'passed': True,
-            'issues': []
-        }
-
-    numbers = sorted([r['number'] for r in requirements])
-
-    # Check starts at 1
-    if numbers[0] != 1:
-        issues.append(f"{prefix} numbering should start at 001, found {prefix}-{numbers[0]:03d}")
-
-    # Check for gaps
-    for i, num in enumerate(numbers):
-        expected = i + 1
-        if num != expected:
-            issues.append(f"Gap in {prefix} sequence: expected {prefix}-{expected:03d}, found {prefix}-{num:03d}")
-            break
-
-    # Check for duplicates
-    seen = set()
-    for num in numbers:
-        if num in seen:
-            issues.append(f"Duplicate {prefix}-{num:03d}")
-        seen.add(num)
-
-    return {
-        'check': f'{prefix.lower()}_sequence',
-        'passed': len(issues) == 0,
-        'issues': issues
-    }
+    JSON with validation results. Each check lists its issues together with
+    the line/column location of the requirement that raised them.
 
+Results are cached under .humaninloop/cache/ by content hash; pass
+--no-cache to always re-validate. The output's 'cache' key reports hits
+and misses.
 
-def check_rfc_keywords(requirements: list[dict]) -> dict:
-    """Check if functional requirements contain RFC 2119 keywords."""
-    issues = []
+The cache is kept in the project's .humaninloop/ directory; outside a
+project nothing is cached unless --cache creates one in the current
+directory.
 
-    for req in requirements:
-        text_lower = req['text'].lower()
-        has_keyword = any(kw in text_lower for kw in RFC_KEYWORDS)
-
-        if not has_keyword:
-            issues.append(f"{req['id']}: Missing RFC 2119 keyword (MUST, SHOULD, MAY, etc.)")
-
-    return {
-        'check': 'rfc_keywords',
-        'passed': len(issues) == 0,
-        'issues': issues
-    }
-
-
-def check_tech_agnostic(requirements: list[dict], prefix: str) -> dict:
-    """Check if requirements are technology-agnostic."""
-    issues = []
-
-    for req in requirements:
-        text_lower = req['text'].lower()
-
-        for term in BANNED_TERMS:
-            if term.lower() in text_lower:
-                issues.append(f"{req['id']}: Contains technology term '{term}'")
-                break  # Only report first violation per requirement
-
-    return {
-        'check': 'tech_agnostic',
-        'passed': len(issues) == 0,
-        'issues': issues
-    }
-
-
-def check_outcome_focus(success_criteria: list[dict]) -> dict:
-    """Check if success criteria focus on user/business outcomes."""
-    issues = []
-
-    # Patterns that suggest technical metrics instead of outcomes
-    technical_patterns = [
-        r'\d+\s*ms\b',  # milliseconds
-        r'\d+%\s*(cpu|memory|coverage)',  # technical percentages
-        r'uptime',
-        r'error rate.*\d',  # numeric error rates (vs "decreased errors")
-        r'requests?\s*per\s*second',
-        r'concurrent\s*(users?|connections?)\s*>\s*\d',
-    ]
-
-    for sc in success_criteria:
-        text_lower = sc['text'].lower()
-
-        for pattern in technical_patterns:
-            if re.search(pattern, text_lower):
-                issues.append(f"{sc['id']}: May contain technical metric instead of user outcome")
-                break
-
-    return {
-        'check': 'outcome_focus',
-        'passed': len(issues) == 0,
-        'issues': issues
-    }
+--incremental keeps each FR/SC block's issues from the previous run and
+re-checks only blocks that are new or edited. The report is identical to
+a full run.
 
+--format=ndjson prints one issue per line as each check completes, then a
+summary line. --max-issues N stops validating after N issues, and
+--fail-fast after the first one.
+"""
 
-def validate_file(file_path: str) -> dict:
-    """Validate requirements in a file."""
-    path = Path(file_path)
+import json
+import sys
+from pathlib import Path
 
-    if not path.exists():
+# Shared helpers live in the plugin-level scripts/ directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / 'scripts'))
+from humaninloop_validators.cache import BlockStore, ResultCache  # noqa: E402
+from humaninloop_validators.output import USAGE, IssueStream, emit, parse_output_args  # noqa: E402
+from humaninloop_validators.requirements import validate_requirements  # noqa: E402
+from humaninloop_validators.results import ArtifactNotFoundError, CheckListener  # noqa: E402
+from humaninloop_validators.terms import term_pack_fingerprint  # noqa: E402
+
+
+def validate_file(file_path: str, cache: ResultCache = None, incremental: bool = False,
+                  listener: CheckListener = None) -> dict:
+    """Validate requirements in a file, through the result cache if one is given."""
+    # The project term pack is part of the rule set
+    rules = term_pack_fingerprint(Path(file_path).parent) if cache or incremental else ''
+
+    def run():
+        if not incremental:
+            return validate_requirements(file_path, listener=listener).to_dict()
+        # Kept where the result cache is, or in memory outside a project
+        store = BlockStore.for_file(file_path, rules, create=cache is not None)
+        result = validate_requirements(file_path, store, listener).to_dict()
+        store.save()
+        return result
+
+    try:
+        if cache is None:
+            return run()
+        return cache.fetch('validate-requirements', [file_path], run, rules)
+    except ArtifactNotFoundError as e:
         return {
             'file': file_path,
-            'error': f"File not found: {file_path}",
+            'error': str(e),
             'requirements_found': 0,
             'success_criteria_found': 0,
             'checks': [],
             'summary': {'total': 0, 'passed': 0, 'failed': 0}
         }
 
-    content = path.read_text(encoding='utf-8')
-
-    # Find requirements
-    fr_requirements = find_requirements(content, 'FR')
-    sc_requirements = find_requirements(content, 'SC')
-
-    checks = []
-
-    # FR checks
-    if fr_requirements:
-        checks.append(check_format(fr_requirements, 'FR'))
-        checks.append(check_sequence(fr_requirements, 'FR'))
-        checks.append(check_rfc_keywords(fr_requirements))
-        checks.append(check_tech_agnostic(fr_requirements, 'FR'))
-    else:
-        checks.append({
-            'check': 'fr_format',
-            'passed': True,
-            'issues': [],
-            'message': 'No functional requirements found'
-        })
-
-    # SC checks
-    if sc_requirements:
-        checks.append(check_format(sc_requirements, 'SC'))
-        checks.append(check_sequence(sc_requirements, 'SC'))
-        checks.append(check_tech_agnostic(sc_requirements, 'SC'))
-        checks.append(check_outcome_focus(sc_requirements))
-    else:
-        checks.append({
-            'check': 'sc_format',
-            'passed': True,
-            'issues': [],
-            'message': 'No success criteria found'
-        })
-
-    passed_count = sum(1 for c in checks if c['passed'])
-    failed_count = len(checks) - passed_count
-
-    return {
-        'file': file_path,
-        'requirements_found': len(fr_requirements),
-        'success_criteria_found': len(sc_requirements),
-        'requirements': [
-            {'id': r['id'], 'line': r['line']}
-            for r in fr_requirements
-        ],
-        'success_criteria': [
-            {'id': r['id'], 'line': r['line']}
-            for r in sc_requirements
-        ],
-        'checks': checks,
-        'summary': {
-            'total': len(checks),
-            'passed': passed_count,
-            'failed': failed_count
-        }
-    }
-
 
 def main():
-    if len(sys.argv) < 2:
-        print(json.dumps({
-            'error': 'Usage: python validate-requirements.py <path-to-spec.md>'
-        }, indent=2))
+    usage = f'Usage: python validate-requirements.py <path-to-spec.md> [--cache | --no-cache] [--incremental] {USAGE}'
+    try:
+        args, options = parse_output_args(sys.argv[1:])
+    except ValueError as e:
+        print(json.dumps({'error': f'{e}. {usage}'}, indent=2))
+        sys.exit(1)
+    args = [arg for arg in args if arg not in ('--cache', '--no-cache', '--incremental')]
+    if not args:
+        print(json.dumps({'error': usage}, indent=2))
         sys.exit(1)
 
-    file_path = sys.argv[1]
-    result = validate_file(file_path)
-    print(json.dumps(result, indent=2))
+    file_path = args[0]
+    cache = None if '--no-cache' in sys.argv else ResultCache.for_path(file_path, create='--cache' in sys.argv)
+    incremental = '--incremental' in sys.argv
+    if options.streaming:
+        stream = IssueStream(options)
+        result = stream.collect(lambda listener: validate_file(file_path, cache, incremental, listener),
+                                {'file': file_path})
+    else:
+        stream = None
+        result = validate_file(file_path, cache, incremental)
+    if cache is not None:
+        result['cache'] = cache.stats()
+    emit(result, stream)
 
     # Exit with error code if validation failed
     if result.get('error') or result['summary']['failed'] > 0: